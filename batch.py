@@ -0,0 +1,337 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from services.ResultsWriter import prepare_results_file
+from services.TestNumberService import TestNumberService
+from simulate import get_algorithm_model, parse_parameters, simulate
+from utils.utils import get_data_path
+
+# The runs already done are listed in this file of the results folder,
+# which is not a CSV file so that analyse.py does not read it
+MANIFEST_FILENAME = "batch_manifest.jsonl"
+
+
+def expand_parameter_grid(
+    algorithm_name: str,
+    parameter_grid: Optional[dict[str, list[str]]] = None
+) -> list[dict[str, str]]:
+    """
+    Returns every combination of the values of the parameters of an
+    algorithm. The parameters of the grid the algorithm does not have
+    are ignored, so that one grid can be shared by several algorithms.
+
+    Args:
+        algorithm_name (str): The name of the algorithm.
+        parameter_grid (dict[str, list[str]], optional): The values of
+            each parameter, by its name in the GUI.
+
+    Returns:
+        list[dict[str, str]]: The parameters of each combination.
+    """
+    model = get_algorithm_model(algorithm_name)
+    grid = {
+        name: values
+        for name, values in (parameter_grid or {}).items()
+        if name in model.parameters
+    }
+    return [
+        dict(zip(grid.keys(), values))
+        for values in itertools.product(*grid.values())
+    ]
+
+
+def build_runs(
+    csv_paths: list[str],
+    algorithm_names: list[str],
+    agent_counts: list[int],
+    seeds: list[int],
+    parameter_grid: Optional[dict[str, list[str]]] = None
+) -> list[dict]:
+    """
+    Lists the runs of every combination of graph, algorithm, parameters,
+    number of agents and seed.
+
+    Returns:
+        list[dict]: The graph, algorithm, parameters, agents and seed of
+            each run.
+    """
+    runs = []
+    for csv_path, algorithm_name in itertools.product(csv_paths, algorithm_names):
+        algorithm = get_algorithm_model(algorithm_name).name
+        for parameters, nb_agents, seed in itertools.product(
+            expand_parameter_grid(algorithm, parameter_grid),
+            agent_counts,
+            seeds
+        ):
+            runs.append({
+                "graph": csv_path,
+                "algorithm": algorithm,
+                "parameters": parameters,
+                "agents": nb_agents,
+                "seed": seed
+            })
+    return runs
+
+
+def get_run_key(run: dict) -> str:
+    """
+    Returns a string identifying a run, to find it in the manifest.
+    """
+    return json.dumps(
+        [
+            os.path.abspath(run["graph"]),
+            run["algorithm"],
+            run["parameters"],
+            run["agents"],
+            run["seed"]
+        ],
+        sort_keys=True
+    )
+
+
+def run_experiment(
+    run: dict,
+    duration: float,
+    interval: float,
+    algorithm_workers: int = 1
+) -> list[tuple[float, float, float, float]]:
+    """
+    Simulates one run, in a worker process, whose algorithm may use
+    worker processes of its own.
+
+    Returns:
+        list[tuple[float, float, float, float]]: The samples of the
+            simulation.
+    """
+    return simulate(
+        run["graph"],
+        run["algorithm"],
+        run["agents"],
+        duration,
+        parameters=run["parameters"],
+        interval=interval,
+        seed=run["seed"],
+        nb_workers=algorithm_workers
+    )
+
+
+def get_graph_name(csv_path: str) -> str:
+    """
+    Returns the name of a graph, such as graph_1, from its CSV file.
+    """
+    return os.path.splitext(os.path.basename(csv_path))[0]
+
+
+def get_results_path(output_folder: str, csv_path: str) -> str:
+    """
+    Returns the results file of a graph, named after its CSV file like
+    the results exported by the GUI.
+    """
+    return os.path.join(output_folder, f"{get_graph_name(csv_path)}_results.csv")
+
+
+def load_manifest(manifest_path: str) -> dict[str, dict]:
+    """
+    Loads the runs already done, by their key.
+    """
+    completed = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as manifest:
+            for line in manifest:
+                if line.strip():
+                    run = json.loads(line)
+                    completed[get_run_key(run)] = run
+    return completed
+
+
+def load_test_numbers(results_path: str) -> dict[str, int]:
+    """
+    Returns the highest test number of each algorithm in a results
+    file, so that new runs never share the number of a previous one,
+    even if it was not recorded in the test numbers file.
+    """
+    test_numbers = {}
+    if os.path.exists(results_path):
+        with open(results_path, newline="") as results:
+            for row in csv.DictReader(results):
+                test_numbers[row["Algorithm"]] = max(
+                    test_numbers.get(row["Algorithm"], 0),
+                    int(row["Test Number"])
+                )
+    return test_numbers
+
+
+def write_results(
+    results_path: str,
+    algorithm: str,
+    test_number: int,
+    seed: int,
+    samples: list[tuple[float, float, float, float]]
+) -> None:
+    """
+    Appends the samples of a run to the results file of its graph.
+    """
+    prepare_results_file(results_path)
+    with open(results_path, mode="a", newline="") as results:
+        csv.writer(results).writerows(
+            [algorithm, test_number, *sample, seed] for sample in samples
+        )
+
+
+def run_batch(
+    runs: list[dict],
+    duration: float,
+    interval: float = 10,
+    output_folder: str = "results",
+    workers: Optional[int] = None,
+    resume: bool = False,
+    test_numbers_path: Optional[str] = None,
+    algorithm_workers: int = 1
+) -> list[dict]:
+    """
+    Simulates runs across a pool of processes, and appends their
+    samples to the results file of their graph as they finish.
+
+    Each finished run is recorded in a manifest with its test number,
+    so that an interrupted batch can be resumed without running it
+    again. The test numbers are taken from the test numbers file of the
+    GUI, so that the runs of the GUI and of the batch are numbered
+    together.
+
+    Args:
+        runs (list[dict]): The runs, as given by build_runs.
+        duration (float): The simulated duration of each run, in
+            seconds.
+        interval (float): The simulated time between two samples.
+        output_folder (str): The folder of the results files.
+        workers (int, optional): The number of processes, the number of
+            CPUs by default.
+        resume (bool): Whether to skip the runs of the manifest.
+        test_numbers_path (str, optional): The test numbers file, the
+            one of the GUI by default.
+        algorithm_workers (int): The number of worker processes of each
+            run of the algorithms running in several processes.
+
+    Raises:
+        ValueError: If the folder already has a manifest and the batch
+            is not resumed.
+
+    Returns:
+        list[dict]: The runs done by this call, with their test number.
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    manifest_path = os.path.join(output_folder, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path) and not resume:
+        raise ValueError(
+            f"{manifest_path} already exists, resume the batch or choose another folder"
+        )
+
+    completed = load_manifest(manifest_path)
+    pending = [run for run in runs if get_run_key(run) not in completed]
+
+    test_numbers = {
+        results_path: load_test_numbers(results_path)
+        for results_path in {
+            get_results_path(output_folder, run["graph"]) for run in pending
+        }
+    }
+
+    test_number_service = TestNumberService(
+        test_numbers_path or get_data_path('references/test_numbers.csv')
+    )
+
+    done = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                run_experiment, run, duration, interval, algorithm_workers
+            ): run
+            for run in pending
+        }
+        for future in as_completed(futures):
+            run = futures[future]
+            try:
+                samples = future.result()
+            except Exception as exception:
+                # A failed run is not recorded, so it is retried when
+                # the batch is resumed
+                print(f"Run {get_run_key(run)} failed: {exception}", file=sys.stderr)
+                continue
+
+            results_path = get_results_path(output_folder, run["graph"])
+            test_number = test_number_service.get_next_test_number(
+                run["algorithm"],
+                get_graph_name(run["graph"]),
+                minimum=test_numbers[results_path].get(run["algorithm"], 0)
+            )
+
+            write_results(results_path, run["algorithm"], test_number, run["seed"], samples)
+            run = {**run, "test_number": test_number}
+            with open(manifest_path, mode="a") as manifest:
+                manifest.write(json.dumps(run) + "\n")
+            done.append(run)
+
+    return done
+
+
+def parse_parameter_grid(values: list[str]) -> dict[str, list[str]]:
+    """
+    Parses the parameters given as NAME=VALUE1,VALUE2 on the command
+    line.
+    """
+    return {
+        name: [value.strip() for value in values.split(",")]
+        for name, values in parse_parameters(values).items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulates every combination of graphs, algorithms, parameters, "
+                    "agent counts and seeds, and writes the results for analyse.py."
+    )
+    parser.add_argument("csv_paths", nargs="+", help="CSV files of the graphs")
+    parser.add_argument("-a", "--algorithm", action="append", required=True, help="name of an algorithm, as in the GUI")
+    parser.add_argument("-n", "--agents", type=int, nargs="+", default=[1], help="numbers of agents")
+    parser.add_argument("-s", "--seeds", type=int, nargs="+", default=[0], help="seeds, one run per seed")
+    parser.add_argument("-p", "--param", action="append", default=[], help="algorithm parameter values as NAME=VALUE1,VALUE2")
+    parser.add_argument("-d", "--duration", type=float, default=3600, help="simulated duration in seconds")
+    parser.add_argument("--interval", type=float, default=10, help="simulated seconds between two samples")
+    parser.add_argument("-o", "--output", default="results", help="folder of the results files")
+    parser.add_argument("-j", "--workers", type=int, help="number of processes (number of CPUs by default)")
+    parser.add_argument("--resume", action="store_true", help="skip the runs already done in the output folder")
+    parser.add_argument("--test-numbers", help="test numbers file shared with the GUI (references/test_numbers.csv by default)")
+    parser.add_argument("--algorithm-workers", type=int, default=1, help="worker processes of each run of the algorithm (Ant Colony only)")
+    args = parser.parse_args()
+
+    try:
+        runs = build_runs(
+            args.csv_paths,
+            args.algorithm,
+            args.agents,
+            args.seeds,
+            parameter_grid=parse_parameter_grid(args.param)
+        )
+        done = run_batch(
+            runs,
+            args.duration,
+            interval=args.interval,
+            output_folder=args.output,
+            workers=args.workers,
+            resume=args.resume,
+            test_numbers_path=args.test_numbers,
+            algorithm_workers=args.algorithm_workers
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{len(done)} runs done, {len(runs)} in the batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,38 @@ PARAMETERS_WINDOW_HEIGHT = 540
 
 NODE_RADIUS = 8
 
-MAX_IDLENESS = 40
\ No newline at end of file
+MAX_IDLENESS = 40
+
+# Speed of the agents in pixels per second, ie 2 pixels per frame at 30 FPS
+AGENT_SPEED = 60
+
+# Size, in bytes, above which the least recently used paths found by the
+# algorithms are removed from the cache
+PATH_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+# Version of the paths found by the algorithms, part of the keys of the
+# cache, to be increased when a change of an algorithm changes its paths
+PATH_CACHE_VERSION = 1
+
+# Whether the GUI starts a simulation with the paths found last time on
+# the same graph with the same parameters, instead of launching the
+# algorithm again with a new seed, which a Shift+click on the start
+# button forces
+REUSE_CACHED_PATHS = True
+
+# Number of idleness samples kept in memory before they are written to
+# the results file, which is also written every RESULTS_FLUSH_INTERVAL
+# seconds
+RESULTS_BUFFER_SIZE = 256
+RESULTS_FLUSH_INTERVAL = 1
+
+# Time, in seconds, between two idleness samples exported by the GUI, which
+# may be below a second
+IDLENESS_EXPORT_INTERVAL = 10
+
+# Number of rendered texts kept by the views, so that the labels which do
+# not change are not rendered again at each frame
+GLYPH_CACHE_SIZE = 512
+
+# Size, in pixels, of the cells of the grid indexing the nodes by position
+SPATIAL_INDEX_CELL_SIZE = 4 * NODE_RADIUS
@@ -2,12 +2,12 @@ import os
 import re
 import sys
 
+import numpy as np
 import pygame
 
 from constants.Config import GRAPH_WINDOW_WIDTH, GRAPH_WINDOW_HEIGHT
 from controllers.EdgeController import EdgeController
 from controllers.NodeController import NodeController
-from models.Agent import Agent
 from models.Graph import Graph
 from models.GraphData import GraphData
 from models.GraphDataComplements import GraphDataComplements
@@ -15,6 +15,8 @@ from models.Node import Node
 from models.Info import Info
 from models.Error import Error
 from services import IImageService
+from services.DijkstraService import DijkstraService
+from services.DynamicCompleteGraphService import DynamicCompleteGraphService
 from services.ICSVService import ICSVService
 from utils.utils import get_data_path, resource_path
 from views.GraphView import GraphView
@@ -41,6 +43,9 @@ class GraphController:
             graph.
         _disable_mark: A flag to temporarily disable marking the graph
             as modified.
+        _complete_graph_repairer: The service keeping the stored
+            complements up to date with the edits of the graph, or None
+            if they have to be computed from scratch.
     """
 
     def __init__(
@@ -74,6 +79,8 @@ class GraphController:
 
         self._is_in_simulation : bool = False
 
+        self._complete_graph_repairer: DynamicCompleteGraphService | None = None
+
     @property
     def graph(self) -> Graph:
         """
@@ -94,8 +101,8 @@ class GraphController:
             raise ValueError("is_in_simulation must be a boolean")
         self._is_in_simulation = value
 
-    def reset_nodes_idleness(self) -> None:
-        self._node_controller.reset_nodes_idleness()
+    def reset_nodes_idleness(self, time: float = 0.0) -> None:
+        self.graph.reset_idleness(time)
 
     def mark_graph_as_modified(func):
         """
@@ -384,8 +391,9 @@ class GraphController:
         Clears all nodes and edges from the graph.
         """
         try:
-            self._graph.nodes.clear()
-            self._graph.edges.clear()
+            self._graph.clear()
+            # The stored complements no longer match the graph
+            self._complete_graph_repairer = None
             self.raise_message("Graph successfully cleared!")
         except Exception as e:
             self.raise_error_message(f"Error clearing graph: {str(e)}")
@@ -494,15 +502,16 @@ class GraphController:
         """
         return self._graph_view.has_an_image()
     
-    def draw_simulation(self, agents: list[Agent]) -> None:
+    def draw_simulation(self, agent_positions: np.ndarray) -> None:
         """
         Draws a simulation of agents view moving on the graph.
 
         Args:
-            agents: A list of agents view to be simulated on the graph.
+            agent_positions: The (x, y) coordinates of the agents to be
+                drawn on the graph.
         """
-        self._graph_view.draw_simulation(agents)
-    
+        self._graph_view.draw_simulation(agent_positions)
+
     def are_complements_saved(self):
         """
         Checks if complements (e.g., shortest paths and complete graph)
@@ -538,6 +547,44 @@ class GraphController:
                     graph_data_complements.shortest_paths
                 )
 
+            # The complements now match the graph, so the next edits
+            # can be repaired from them
+            if (
+                self._complete_graph_repairer is None
+                or self._complete_graph_repairer.shortest_paths
+                is not graph_data_complements.shortest_paths
+            ):
+                self._graph.pop_changes()
+                simple_graph, _ = self._graph.compute_matrix()
+                self._complete_graph_repairer = DynamicCompleteGraphService(
+                    simple_graph,
+                    DijkstraService,
+                    complete_graph=graph_data_complements.complete_adjacency_matrix,
+                    shortest_paths=graph_data_complements.shortest_paths
+                )
+
+    def repair_complements(self) -> DynamicCompleteGraphService | None:
+        """
+        Repairs the stored complete graph and shortest paths after the
+        edits made since they were stored, instead of computing them
+        from scratch.
+
+        Returns:
+            DynamicCompleteGraphService | None: The service holding the
+                repaired complements, or None if there are no stored
+                complements to repair.
+        """
+        if self._complete_graph_repairer is None:
+            return None
+
+        self._complete_graph_repairer.apply_changes(self._graph.pop_changes())
+
+        if self._complete_graph_repairer.nb_nodes != len(self._graph.nodes):
+            self._complete_graph_repairer = None
+            return None
+
+        return self._complete_graph_repairer
+
     def raise_error_message(self, message: str) -> None:
         """
         This method triggers an error popup with a specific message.
@@ -563,26 +610,4 @@ class GraphController:
         self,
         solution: list[list[int]]
     ) -> list[list[int]]:
-        real_paths = []
-        for agent_path in solution:
-            real_path = []
-            for i in range(len(agent_path) - 1):
-                start_node = agent_path[i]
-                end_node = agent_path[i + 1]
-                real_path.extend(
-                    self.graph.get_shortest_paths()[(start_node, end_node)]
-                )
-
-            # Add the way back on the first node
-            # (only if the path has more than one node)
-            if len(agent_path) > 1:
-                start_node = agent_path[-1]
-                end_node = agent_path[0]
-                real_path.extend(
-                    self.graph.get_shortest_paths()[(start_node, end_node)]
-                )
-
-            # Add the finalized path at the real_paths
-            real_paths.append(real_path)
-
-        return real_paths
\ No newline at end of file
+        return self.graph.compute_real_paths(solution)
@@ -1,4 +1,4 @@
-from models.Node import Node
+from models.Graph import Graph
 from models.IdlenessData import IdlenessData
 from views.SimulationDataView import SimulationDataView
 from views.IdlenessView import IdlenessView
@@ -31,11 +31,11 @@ class IdlenessController:
             raise ValueError("idleness must be an instance of IdlenessData")
         self._idleness_data = value
     
-    def draw_idlenesses(self, nodes_list : list[Node])-> None:
+    def draw_idlenesses(self, graph: Graph)-> None:
         """
         Draws the idleness values in the View.
         """
-        self.idleness.update_idleness(nodes_list)
+        self.idleness.update_idleness(graph)
 
         # Get the updated idleness values
         idleness_data = self._idleness_data.get_idleness_data()
@@ -1,4 +1,3 @@
-import math
 from typing import Optional
 
 from constants.Config import NODE_RADIUS
@@ -85,16 +84,8 @@ class NodeController:
             node (Node): The node to be deleted.
         """
     
-        if node is not None:  
-            # Find and remove edges connected to the node
-            edges_to_remove = [edge for edge in self._graph.edges
-                               if edge[0] == node or edge[1] == node]
-            
-            for edge in edges_to_remove:
-                del self._graph.edges[edge]
-
-            # Remove the node itself
-            self._graph.nodes.remove(node)
+        if node is not None:
+            self._graph.remove_node(node)
 
 
     def start_drag(self, pos: tuple[int, int]) -> None:
@@ -138,11 +129,11 @@ class NodeController:
         if self._dragging_node is not None:
             if snapping_enabled:
                 candidates = self.move_node_with_snapping(
-                    self._dragging_node, pos[0], pos[1], self._graph.nodes, mouse_position=pos
+                    self._dragging_node, pos[0], pos[1], mouse_position=pos
                 )
                 return candidates
             else:
-                 self._dragging_node.x, self._dragging_node.y = pos
+                 self._graph.move_node(self._dragging_node, *pos)
             
         return None
 
@@ -177,20 +168,14 @@ class NodeController:
             Node (optional): The node located at the specified
                 coordinates, or None if no node is found.
         """
-        for node in self._graph.nodes:
-            if (
-                math.sqrt((node.x - pos[0]) ** 2 + (node.y - pos[1]) ** 2)
-                < NODE_RADIUS
-            ):
-                return node
-        return None
+        nodes = self._graph.get_nodes_near(pos[0], pos[1], NODE_RADIUS)
+        return nodes[0] if nodes else None
     
     def move_node_with_snapping(
         self,
         node: Node,
         new_x: int,
         new_y: int,
-        nodes: list[Node],
         mouse_position: tuple[int, int],
         threshold: int = 10,
     ) -> Optional[dict[str, Node | None]]:
@@ -204,8 +189,6 @@ class NodeController:
                 detected on the y axis.
             new_y (int): the new y position of the node when a snap is
                 detected on the y axis.
-            nodes (list[Node]): the list of nodes in the graph used to
-                find any candidate.
             mouse_position (tuple[int, int]): the user's cursor
                 position when dragging the node.
             threshold (int, optional): the sensivity of the snapping.
@@ -223,16 +206,12 @@ class NodeController:
             # If the mouse is too far from the thresold,
             # move the node to the position of the mouse
             if distance_x > threshold or distance_y > threshold:
-                node.x, node.y = mouse_position
+                self._graph.move_node(node, *mouse_position)
                 # Don't need to search for candidates
                 return None
 
         # If the mouse is close enough, search for snap candidates
-        candidates = self._graph.find_alignment_candidates(
-            node,
-            nodes,
-            threshold
-        )
+        candidates = self._graph.find_aligned_nodes(node, threshold)
         
         # If a candidate is found on the x axis, we apply the
         # x position of the candidate
@@ -245,12 +224,6 @@ class NodeController:
             new_y = candidates["y"].y
 
         # Move the coordinates of the node (after or without snap)
-        node.x, node.y = new_x, new_y
+        self._graph.move_node(node, new_x, new_y)
 
         return candidates
-    
-    def reset_nodes_idleness(self) -> None:
-        for node in self._graph.nodes:
-            node.idleness = 0
-
-
@@ -15,6 +15,8 @@ from views.ParametersView import ParametersView
 
 from services.CompleteGraphService import CompleteGraphService
 from services.ICSVService import ICSVService
+from services.PathCacheService import PathCacheService, get_path_cache_folder
+from utils.utils import get_data_path
 
 
 class ParametersController:
@@ -81,7 +83,8 @@ class ParametersController:
             self._scrolling_list_controller,
             self._text_box_controller,
             CompleteGraphService,
-            csv_service
+            csv_service,
+            PathCacheService(get_path_cache_folder(get_data_path('csv_files')))
         )
         self._algorithm_parameters_controller = AlgorithmParametersController(
             self._parameters_view
@@ -1,9 +1,16 @@
+from typing import Optional
+
 import pygame
 
 from controllers.SimulationController import SimulationController
 from controllers.buttons.BackButtonController import BackButtonController
 from models.Graph import Graph
-from constants.Config import GRAPH_WINDOW_HEIGHT, GRAPH_WINDOW_WIDTH, PARAMETERS_WINDOW_WIDTH
+from constants.Config import (
+    GRAPH_WINDOW_HEIGHT,
+    GRAPH_WINDOW_WIDTH,
+    IDLENESS_EXPORT_INTERVAL,
+    PARAMETERS_WINDOW_WIDTH
+)
 from services.ICSVService import ICSVService
 from views.SimulationDataView import SimulationDataView
 from controllers.IdlenessesController import IdlenessController
@@ -70,10 +77,10 @@ class SimulationDataController:
         Draws also the back to configuration button.
         """
         self._simulation_data_view.draw()
-        self._idleness_controller.draw_idlenesses(graph.nodes)
+        self._idleness_controller.draw_idlenesses(graph)
         self._back_button_controller.draw_buttons()
 
-    def compute_export(self, algorithm_name: str) -> None:
+    def compute_export(self, algorithm_name: str, seed: Optional[int] = None) -> None:
         if self._simulation_controller.has_simulation_started():
             # Get the current graph number
             graph_number = self._csv_service.current_csv_number
@@ -84,22 +91,26 @@ class SimulationDataController:
             self._start_idleness_export(
                 algorithm_name = algorithm_name,
                 test_number = test_number,
-                start_time = self._simulation_controller._start_time
+                start_time = self._simulation_controller._start_time,
+                seed = seed
             )
             
     def _start_idleness_export(
         self,
         algorithm_name: str,
         test_number: int,
-        start_time: float
+        start_time: float,
+        seed: Optional[int] = None
     ) -> None:
         """
-        Starts exporting idleness data every 10 seconds with metadata.
+        Starts exporting idleness data every IDLENESS_EXPORT_INTERVAL
+        seconds with metadata.
 
         Args:
             algorithm (str): The name of the algorithm being used in the simulation.
             test_number (int): The current test number for this simulation.
             start_time (float): The simulation start time in seconds.
+            seed (int, optional): The seed of the algorithm.
         """
         def idleness_data_provider():
             return self._idleness_controller.idleness.get_idleness_data()
@@ -113,5 +124,6 @@ class SimulationDataController:
             algorithm = algorithm_name,
             test_number = test_number,
             start_time = start_time,
-            interval = 10
+            interval = IDLENESS_EXPORT_INTERVAL,
+            seed = seed
         )
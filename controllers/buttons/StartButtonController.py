@@ -1,8 +1,15 @@
 
+import secrets
 import threading
 
+import pygame
+
 from constants.Colors import Colors
-from constants.Config import PARAMETERS_WINDOW_WIDTH, PARAMETERS_WINDOW_HEIGHT
+from constants.Config import (
+    PARAMETERS_WINDOW_HEIGHT,
+    PARAMETERS_WINDOW_WIDTH,
+    REUSE_CACHED_PATHS
+)
 from controllers.GraphController import GraphController
 from controllers.ScrollingListController import ScrollingListController
 from controllers.SimulationController import SimulationController
@@ -12,9 +19,11 @@ from controllers.text_boxes.TextBoxController import TextBoxController
 from models.Button import Button
 from models.GraphData import GraphData
 from models.Error import Error
-from services.AStarService import AStarService
+from models.algorithms.NaiveRuntime import NaiveRuntime
+from services.DijkstraService import DijkstraService
 from services.ICompleteGraphService import ICompleteGraphService
 from services.ICSVService import ICSVService
+from services.IPathCacheService import IPathCacheService
 from services.algorithms.NaiveAlgorithmRuntime import NaiveAlgorithmRuntime
 from views.ButtonView import ButtonView
 from views.ParametersView import ParametersView
@@ -29,6 +38,11 @@ class StartButtonController(BaseButtonController):
             computing the complete graph.
         _csv_service (ICSVService): Service for handling CSV
             operations.
+        _path_cache_service (IPathCacheService): Service keeping the
+            paths found by the algorithms.
+        _reuse_cached_paths (bool): Whether a simulation starts with the
+            paths found last time instead of launching the algorithm,
+            unless the start button is clicked with Shift held.
         _scrolling_list_controller (ScrollingListController):
             Controller for managing the scrolling list view of algorithms.
         _simulation_controller (SimulationController):
@@ -46,7 +60,9 @@ class StartButtonController(BaseButtonController):
         scrolling_list_controller: ScrollingListController,
         text_box_controller: TextBoxController,
         complete_graph_service: ICompleteGraphService,
-        csv_service: ICSVService
+        csv_service: ICSVService,
+        path_cache_service: IPathCacheService,
+        reuse_cached_paths: bool = REUSE_CACHED_PATHS
     ) -> None:
         super().__init__()
         self._parameters_view = parameters_view
@@ -54,6 +70,8 @@ class StartButtonController(BaseButtonController):
         
         self._complete_graph_service = complete_graph_service
         self._csv_service = csv_service
+        self._path_cache_service = path_cache_service
+        self._reuse_cached_paths = reuse_cached_paths
         self._scrolling_list_controller = scrolling_list_controller
         self._simulation_controller = simulation_controller
         self._simulation_data_controller = simulation_data_controller
@@ -128,6 +146,13 @@ class StartButtonController(BaseButtonController):
         """
         self._graph_controller.raise_info('Algorithm launched')
 
+        # Holding Shift launches the algorithm with a new seed, even if
+        # its paths are cached
+        reuse_cached_paths = (
+            self._reuse_cached_paths
+            and not pygame.key.get_mods() & pygame.KMOD_SHIFT
+        )
+
         # Using threading to launch the algorithm computation parallely with the UI.
         def run_algorithm():
             selected_algorithm = self._scrolling_list_controller.get_selected_algorithm()
@@ -141,10 +166,30 @@ class StartButtonController(BaseButtonController):
                 return
 
             graph = self._graph_controller.graph
-            _algorithm = selected_algorithm.initialize_algorithm(nb_agents, graph)
+
+            # The paths found by the runtime algorithm depend on the
+            # simulation, so they are never cached
+            is_runtime = isinstance(selected_algorithm, NaiveRuntime)
+
+            # Reuse the paths found last time on the same graph with the
+            # same parameters, so that a demo starts at once
+            cached = None
+            if reuse_cached_paths and not is_runtime:
+                cached = self._path_cache_service.get(selected_algorithm, nb_agents, graph)
+
+            if cached is not None:
+                solution, seed = cached
+                _algorithm = None
+            else:
+                # Draw a seed to record it with the results, so that the
+                # run can be reproduced
+                seed = secrets.randbits(32)
+                _algorithm = selected_algorithm.initialize_algorithm(nb_agents, graph, seed=seed)
+                solution: list[list[int]] = _algorithm.launch()
+                if not is_runtime:
+                    self._path_cache_service.put(selected_algorithm, nb_agents, graph, seed, solution)
+
             self._simulation_controller.set_selected_algorithm(_algorithm)
-        
-            solution: list[list[int]] = _algorithm.launch()
 
             # Convert the solution paths to use the shortest paths in the real graph
             real_paths = self._graph_controller.compute_real_paths(solution)
@@ -164,16 +209,25 @@ class StartButtonController(BaseButtonController):
 
             # Setting the simulation as started
             self._simulation_controller.set_simulation_started(True)
-            self._graph_controller.raise_message("Simulation started!")
+            if cached is not None:
+                self._graph_controller.raise_message(
+                    "Simulation started with the cached paths! "
+                    "Shift+click for a new seed."
+                )
+            else:
+                self._graph_controller.raise_message("Simulation started!")
             self._simulation_data_controller.compute_export(
-                selected_algorithm.name
+                selected_algorithm.name,
+                seed
             )   
 
         threading.Thread(target=run_algorithm).start()
 
     def _compute_complete_graph_and_shortest_paths(self):
         """
-        Computes the complete graph and shortest paths using the A*
+        Computes the complete graph and shortest paths. The stored ones
+        are repaired after the last edits when possible, otherwise they
+        are computed in a single all-pairs pass of the Dijkstra
         algorithm.
 
         Returns:
@@ -182,31 +236,22 @@ class StartButtonController(BaseButtonController):
                 complete adjacency matrix and nodes list.
         """
         simple_graph, node_positions = self._graph_controller.graph.compute_matrix()
-        complete_graph = self._complete_graph_service(
-            simple_graph=simple_graph,
-            node_position=node_positions,
-            path_finding_service=AStarService
-        ).complete_graph
+        complete_graph_service = self._graph_controller.repair_complements()
+        if complete_graph_service is None:
+            complete_graph_service = self._complete_graph_service(
+                simple_graph=simple_graph,
+                shortest_path_service=DijkstraService
+            )
+        complete_graph = complete_graph_service.complete_graph
 
         if not complete_graph:
             return None
 
-        shortest_paths = {}
-        for start in range(len(simple_graph)):
-            for end in range(len(simple_graph)):
-                if start != end:
-                    a_star = AStarService(simple_graph,
-                                          node_positions,
-                                          start,
-                                          end)
-                    # We don't want to store the cost
-                    shortest_paths[(start, end)] = a_star.find_path()[0] 
-
         return GraphData(
             adjacency_matrix=simple_graph,
             nodes_list=node_positions,
             complete_adjacency_matrix=complete_graph,
-            shortest_paths=shortest_paths
+            shortest_paths=complete_graph_service.shortest_paths
         )
 
     def enable_start_button(self) -> None:
@@ -1,7 +1,13 @@
 import math
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from constants.Config import SPATIAL_INDEX_CELL_SIZE
 from models.Node import Node
+from models.ShortestPaths import ShortestPaths
+from models.SpatialIndex import SpatialIndex
 
 class Graph:
     """
@@ -21,17 +27,51 @@ class Graph:
             corresponding distances.
         _complete_adjacency_matrix: A complete adjacency matrix
             representing the graph's connectivity.
-        _shortest_paths: A dictionary storing the shortest paths
-            between nodes.
+        _shortest_paths: A compact store of the shortest paths
+            between nodes, backed by a predecessor matrix.
         _modified: A flag indicating whether the graph has been
             modified.
+        _changes: The structural changes made since the last call to
+            pop_changes, in the order they were made. Each change is
+            ('add_node',), ('remove_node', index) or
+            ('edge', index1, index2, distance), a distance of 0
+            meaning that the edge has been removed.
+        _last_visit_times: The time of the last visit of each node
+            during a simulation, in seconds.
+        _idleness_time: The time at which the idleness of the nodes is
+            read, in seconds.
+        _highest_idleness: The highest idleness reached by a node
+            before one of its visits.
+        _occupied_nodes: The nodes where an agent currently stands,
+            which are not idle.
+        _spatial_index: The nodes indexed by position, to find the
+            nodes near a point or aligned with a node.
+        _neighbors: The neighbors of each node with the distance of
+            their edge, the same edges as _edges by node.
+        _node_indices: The index of each node in _nodes.
+        _version: A counter increased by each change of the nodes or
+            the edges, so that the views can tell when to draw the
+            graph again.
+
+    The nodes and edges must be changed through the methods of the
+    graph, which keep the spatial index, the neighbors and the indices
+    of the nodes up to date.
     """
     def __init__(self) -> None:
         self._nodes: list[Node] = []
         self._edges: dict[tuple[Node, Node], float] = {}
         self._complete_adjacency_matrix: list[list[float]] = []
-        self._shortest_paths: dict[tuple[int, int], list[int]] = {}
+        self._shortest_paths: Optional[ShortestPaths] = None
         self._modified = False
+        self._changes: list[tuple] = []
+        self._last_visit_times = np.zeros(0)
+        self._idleness_time = 0.0
+        self._highest_idleness = 0.0
+        self._occupied_nodes = np.zeros(0, dtype=int)
+        self._spatial_index = SpatialIndex(SPATIAL_INDEX_CELL_SIZE)
+        self._neighbors: dict[Node, dict[Node, float]] = {}
+        self._node_indices: dict[Node, int] = {}
+        self._version = 0
 
     @property
     def nodes(self) -> list[Node]:
@@ -47,6 +87,14 @@ class Graph:
         """
         return self._edges
     
+    @property
+    def version(self) -> int:
+        """
+        Returns the counter increased by each change of the nodes or
+        the edges.
+        """
+        return self._version
+
     @property
     def modified(self) -> bool:
         """
@@ -63,6 +111,22 @@ class Graph:
         return not self._nodes
     
 
+    def clear(self) -> None:
+        """
+        Removes all the nodes and edges of the graph, with everything
+        computed from them.
+        """
+        self._nodes.clear()
+        self._edges.clear()
+        self._complete_adjacency_matrix = []
+        self._shortest_paths = None
+        self._changes.clear()
+        self.reset_idleness()
+        self._spatial_index = SpatialIndex(SPATIAL_INDEX_CELL_SIZE)
+        self._neighbors.clear()
+        self._node_indices.clear()
+        self._version += 1
+
     def mark_as_modified(self) -> None:
         """
         Marks the graph as modified if it has not been marked already.
@@ -79,17 +143,31 @@ class Graph:
             dragged_node (Node): The node that has been dragged and
             whose neighbors' distances need to be updated.
         """
-        neighbors = set()
-
-        for (n1, n2) in self._edges.keys():
-            if n1 == dragged_node:
-                neighbors.add(n2)
-            elif n2 == dragged_node:
-                neighbors.add(n1)
-        
-        for neighbor in neighbors:
+        node_indices = self._node_indices
+        for neighbor in self.get_neighbors(dragged_node):
             distance = self.distance(neighbor, dragged_node)
-            self._edges[neighbor, dragged_node] = self._edges[dragged_node, neighbor] = distance
+            self._set_edge(neighbor, dragged_node, distance)
+            self._changes.append(
+                (
+                    'edge',
+                    node_indices[neighbor],
+                    node_indices[dragged_node],
+                    distance
+                )
+            )
+
+    def get_neighbors(self, node: Node) -> list[Node]:
+        """
+        Returns the nodes linked to a node by an edge.
+
+        Args:
+            node (Node): The node whose neighbors are returned.
+
+        Returns:
+            list[Node]: The neighbors, in the order their edges were
+                added.
+        """
+        return list(self._neighbors.get(node, ()))
 
     def add_node(self, x: float, y: float) -> None:
         """
@@ -99,7 +177,62 @@ class Graph:
             x (float): The x coordinate of the new node.
             y (float): The y coordinate of the new node.
         """
-        self._nodes.append(Node(x, y))
+        node = Node(x, y)
+        self._spatial_index.add(node)
+        self._node_indices[node] = len(self._nodes)
+        self._nodes.append(node)
+        self._changes.append(('add_node',))
+        self._version += 1
+
+    def remove_node(self, node: Node) -> None:
+        """
+        Removes a node and all the edges connected to it.
+
+        Args:
+            node (Node): The node to be removed.
+        """
+        for neighbor in self._neighbors.pop(node, {}):
+            self._edges.pop((node, neighbor), None)
+            self._edges.pop((neighbor, node), None)
+            self._neighbors[neighbor].pop(node, None)
+
+        node_index = self._node_indices.pop(node)
+        self._changes.append(('remove_node', node_index))
+        self._spatial_index.remove(node)
+        del self._nodes[node_index]
+        self._version += 1
+
+        # The following nodes move back by one index
+        for index in range(node_index, len(self._nodes)):
+            self._node_indices[self._nodes[index]] = index
+
+    def move_node(self, node: Node, x: int, y: int) -> None:
+        """
+        Moves a node to new coordinates. The distances of its edges are
+        updated by update_distances, once the node is dropped.
+
+        Args:
+            node (Node): The node to be moved.
+            x (int): The new x coordinate of the node.
+            y (int): The new y coordinate of the node.
+        """
+        node.x, node.y = x, y
+        self._spatial_index.update(node)
+        self._version += 1
+
+    def get_nodes_near(self, x: float, y: float, radius: float) -> list[Node]:
+        """
+        Returns the nodes closer to a point than a radius.
+
+        Args:
+            x (float): The x coordinate of the point.
+            y (float): The y coordinate of the point.
+            radius (float): The distance below which a node is returned.
+
+        Returns:
+            list[Node]: The nodes, in the order of the nodes of the graph.
+        """
+        return self._spatial_index.nodes_near(x, y, radius)
 
     def add_edge(self, node1: Node, node2: Node) -> None:
         """
@@ -110,7 +243,30 @@ class Graph:
             node2 (Node): The second node in the edge.
         """
         distance = self.distance(node1, node2)
+        self._set_edge(node1, node2, distance)
+        self._changes.append(
+            ('edge', self._node_indices[node1], self._node_indices[node2], distance)
+        )
+
+    def _set_edge(self, node1: Node, node2: Node, distance: float) -> None:
+        """
+        Sets the distance of an edge in both directions.
+        """
+        self._neighbors.setdefault(node1, {})[node2] = distance
+        self._neighbors.setdefault(node2, {})[node1] = distance
         self._edges[(node1, node2)] = self._edges[(node2, node1)] = distance
+        self._version += 1
+
+    def pop_changes(self) -> list[tuple]:
+        """
+        Returns the structural changes made since the previous call and
+        forgets them.
+
+        Returns:
+            list[tuple]: The changes, in the order they were made.
+        """
+        changes, self._changes = self._changes, []
+        return changes
 
     def distance(self, node1: Node, node2: Node) -> float:
         """
@@ -145,35 +301,118 @@ class Graph:
 
         edges_matrix = [[0 for _ in range(size)] for _ in range(size)]
 
+        node_indices = self._node_indices
         for (node1, node2), distance in self._edges.items():
-            node1_index = self._nodes.index(node1)
-            node2_index = self._nodes.index(node2)
-            edges_matrix[node1_index][node2_index] = distance
+            edges_matrix[node_indices[node1]][node_indices[node2]] = distance
 
         nodes_list = {index: (node.x, node.y)
                       for index, node in enumerate(self._nodes)}
         
         return edges_matrix, nodes_list
 
+    def compute_sparse_matrix(self) -> tuple[csr_matrix, np.ndarray]:
+        """
+        Generates the adjacency matrix as a sparse CSR matrix, which
+        only stores the edges, and the coordinates of the nodes.
+
+        The matrix holds the same distances as the one of
+        compute_matrix, and is accepted by the shortest path and path
+        finding services.
+
+        Returns:
+            tuple: A tuple containing the CSR adjacency matrix and the
+                (x, y) coordinates of the nodes, one row per node.
+        """
+        size = len(self._nodes)
+        node_indices = self._node_indices
+
+        rows = np.fromiter(
+            (node_indices[node1] for node1, _ in self._edges),
+            dtype=np.int32,
+            count=len(self._edges)
+        )
+        columns = np.fromiter(
+            (node_indices[node2] for _, node2 in self._edges),
+            dtype=np.int32,
+            count=len(self._edges)
+        )
+        distances = np.fromiter(self._edges.values(), dtype=float, count=len(self._edges))
+
+        sparse_matrix = csr_matrix((distances, (rows, columns)), shape=(size, size))
+
+        # A distance of 0 means that there is no edge, as in the dense
+        # matrix
+        sparse_matrix.eliminate_zeros()
 
-    def get_shortest_paths(self):
+        positions = np.array(
+            [(node.x, node.y) for node in self._nodes],
+            dtype=float
+        ).reshape(size, 2)
+
+        return sparse_matrix, positions
+
+
+    def get_shortest_paths(self) -> Optional[ShortestPaths]:
+        """
+        Returns the shortest paths store of the graph, which gives the
+        path between two nodes with shortest_paths[(start, end)].
+        """
         return self._shortest_paths
 
 
+    def compute_real_paths(
+        self,
+        solution: list[list[int]]
+    ) -> list[list[int]]:
+        """
+        Converts the paths found by an algorithm on the complete graph
+        into paths following the edges of the graph. Each path goes
+        back to its first node at the end.
+
+        Args:
+            solution (list[list[int]]): The path of each agent on the
+                complete graph.
+
+        Returns:
+            list[list[int]]: The path of each agent on the graph.
+        """
+        real_paths = []
+        for agent_path in solution:
+            real_path = []
+            for i in range(len(agent_path) - 1):
+                start_node = agent_path[i]
+                end_node = agent_path[i + 1]
+                real_path.extend(
+                    self._shortest_paths[(start_node, end_node)]
+                )
+
+            # Add the way back on the first node
+            # (only if the path has more than one node)
+            if len(agent_path) > 1:
+                start_node = agent_path[-1]
+                end_node = agent_path[0]
+                real_path.extend(
+                    self._shortest_paths[(start_node, end_node)]
+                )
+
+            # Add the finalized path at the real_paths
+            real_paths.append(real_path)
+
+        return real_paths
+
     def get_complete_adjacency_matrix(self):
         return self._complete_adjacency_matrix
 
     def set_shortest_paths(
         self,
-        shortest_paths: dict[tuple[int, int],list[int]]
+        shortest_paths: ShortestPaths
     ) -> None:
         """
-        Sets the shortest paths dictionary for the graph.
+        Sets the shortest paths store for the graph.
 
         Args:
-            shortest_paths (dict[tuple[int, int], list[int]]):
-                A dictionary where the keys are node pairs and the
-                values are the shortest paths between those nodes.
+            shortest_paths (ShortestPaths): The store giving the
+                shortest path between each pair of nodes.
         """
         self._shortest_paths = shortest_paths
 
@@ -191,36 +430,124 @@ class Graph:
         """
         self._complete_adjacency_matrix = complete_adjacency_matrix
 
-    def find_alignment_candidates(
+    def reset_idleness(self, time: float = 0.0) -> None:
+        """
+        Considers every node as visited at a given time, which is done
+        when a simulation starts.
+
+        Args:
+            time (float): The time of the visits, in seconds.
+        """
+        self._last_visit_times = np.full(len(self._nodes), float(time))
+        self._idleness_time = float(time)
+        self._highest_idleness = 0.0
+        self._occupied_nodes = np.zeros(0, dtype=int)
+
+    def occupy_nodes(self, nodes: np.ndarray) -> None:
+        """
+        Records the nodes where an agent currently stands, whose
+        idleness is null.
+
+        Args:
+            nodes (np.ndarray): The indices of the occupied nodes.
+        """
+        self._occupied_nodes = np.asarray(nodes, dtype=int)
+
+    def set_idleness_time(self, time: float) -> None:
+        """
+        Sets the time at which the idleness of the nodes is read.
+
+        Args:
+            time (float): The current time, in seconds.
+        """
+        self._idleness_time = float(time)
+
+    def visit_nodes(
+        self,
+        nodes: Union[int, np.ndarray],
+        times: Union[float, np.ndarray]
+    ) -> None:
+        """
+        Records the visits of some nodes by the agents.
+
+        Args:
+            nodes (Union[int, np.ndarray]): The indices of the visited
+                nodes.
+            times (Union[float, np.ndarray]): The time of each visit, in
+                seconds.
+        """
+        nodes = np.atleast_1d(nodes)
+        if len(nodes) == 0:
+            return
+        times = np.broadcast_to(np.asarray(times, dtype=float), nodes.shape)
+
+        if len(nodes) == 1:
+            node, time = nodes[0], times[0]
+            self._highest_idleness = max(
+                self._highest_idleness,
+                float(time - self._last_visit_times[node])
+            )
+            self._last_visit_times[node] = max(
+                self._last_visit_times[node],
+                time
+            )
+            return
+
+        # When a node is visited several times at once, its idleness is
+        # the highest just before the first visit
+        first_visits = np.full(len(self._last_visit_times), np.inf)
+        np.minimum.at(first_visits, nodes, times)
+        visited = np.isfinite(first_visits)
+        self._highest_idleness = max(
+            self._highest_idleness,
+            float(np.max(
+                first_visits[visited] - self._last_visit_times[visited]
+            ))
+        )
+        np.maximum.at(self._last_visit_times, nodes, times)
+
+    def get_idleness(self) -> np.ndarray:
+        """
+        Returns the idleness of each node, ie the time since its last
+        visit, or zeros if no simulation has been started on the
+        current nodes.
+
+        Returns:
+            np.ndarray: The idleness of each node, in seconds.
+        """
+        if len(self._last_visit_times) != len(self._nodes):
+            return np.zeros(len(self._nodes))
+        idleness = self._idleness_time - self._last_visit_times
+        idleness[self._occupied_nodes] = 0.0
+        return idleness
+
+    @property
+    def highest_idleness(self) -> float:
+        """
+        Returns the highest idleness reached by a node before one of
+        its visits since the simulation started.
+        """
+        return self._highest_idleness
+
+    def find_aligned_nodes(
         self,
         node: Node,
-        nodes: list[Node],
         threshold=10
     ) -> dict[str, Optional[Node]]:
         """
         Finds nodes that are within a threshold distance along the x or
-        y axis from a specific node.
+        y axis from a specific node, the last added one on each axis.
 
         Args:
             node (Node): the dragged node.
-            nodes (list[Node]): the list of nodes of the graph.
             threshold (int, optional): the sensivity of the snapping.
         """
-        # Initialization of potential candidates on x and y axis.
-        candidates = {"x": None, "y": None}
-        for other_node in nodes:
-            if other_node == node:
-                continue
-            # If the distance between two nodes on the x avis is
-            # smaller than the threshold, we add the candidate into
-            # the dictionary
-            if abs(other_node.x - node.x) <= threshold:
-                candidates["x"] = other_node
-            # same for the y axis.
-            if abs(other_node.y - node.y) <= threshold:
-                candidates["y"] = other_node
-        
-        return candidates
-
-
-
+        return {
+            axis: self._spatial_index.last_node_aligned(
+                axis,
+                getattr(node, axis),
+                threshold,
+                excluded=node
+            )
+            for axis in ("x", "y")
+        }
@@ -1,4 +1,5 @@
 from models.GraphDataComplements import GraphDataComplements
+from models.ShortestPaths import ShortestPaths
 
 
 class GraphData:
@@ -7,7 +8,7 @@ class GraphData:
         nodes_list: list[tuple[int, int]] = None,
         adjacency_matrix: list[list[float]] = None,
         complete_adjacency_matrix: list[list[float]] = None,
-        shortest_paths: dict[tuple[int, int], list[int]] = None
+        shortest_paths: ShortestPaths = None
     ) -> None:
         self._nodes_list = nodes_list
         self._adjacency_matrix = adjacency_matrix
@@ -33,7 +34,7 @@ class GraphData:
         return self._complements.complete_adjacency_matrix
     
     @property
-    def shortest_paths(self) -> dict[tuple[int, int], list[int]]:
+    def shortest_paths(self) -> ShortestPaths:
         return self._complements._shortest_paths
     
     def all(
@@ -42,7 +43,7 @@ class GraphData:
         list[tuple[int, int]],
         list[list[float]],
         list[list[float]],
-        dict[tuple[int, int], list[int]]
+        ShortestPaths
     ]:
         return (
             self._nodes_list,
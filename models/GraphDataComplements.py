@@ -1,8 +1,10 @@
+from models.ShortestPaths import ShortestPaths
+
 class GraphDataComplements:
     def __init__(
         self,         
         complete_adjacency_matrix: list[list[float]] = None,
-        shortest_paths: dict[tuple[int, int], list[int]] = None
+        shortest_paths: ShortestPaths = None
     ) -> None:
         self._complete_adjacency_matrix = complete_adjacency_matrix
         self._shortest_paths = shortest_paths
@@ -12,5 +14,5 @@ class GraphDataComplements:
         return self._complete_adjacency_matrix
     
     @property
-    def shortest_paths(self) -> dict[tuple[int, int], list[int]]:
+    def shortest_paths(self) -> ShortestPaths:
         return self._shortest_paths
\ No newline at end of file
@@ -1,6 +1,6 @@
 import numpy as np
 
-from models.Node import Node
+from models.Graph import Graph
 
 class IdlenessData:
 
@@ -35,13 +35,13 @@ class IdlenessData:
         return self._average_idleness, self._max_idleness, self._all_time_highest_idleness
     
 
-    def update_idleness(self,graph_nodes : list[Node]) -> None:
+    def update_idleness(self, graph: Graph) -> None:
         """
         updates the idleness values using a dedicated function.
         """
-        self._compute_idleness_values(graph_nodes)
+        self._compute_idleness_values(graph)
 
-    def _compute_idleness_values(self, graph_nodes : list[Node]) -> None:
+    def _compute_idleness_values(self, graph: Graph) -> None:
         """
         Computes the average idleness of the current simulation.
         Computes the highest idleness of the current simulation.
@@ -49,22 +49,25 @@ class IdlenessData:
 
         """
 
-        idleness_values = []
+        #retrieving the idleness of every node at once
+        idleness_values = graph.get_idleness()
+        if len(idleness_values) == 0:
+            return
 
-        #retrieving all the idleness's in a list
-        for node in graph_nodes:
-           idleness_values.append(node.idleness)
-           
-        #computing mean value of the list
-        average_id = np.mean(idleness_values)
+        #computing mean value of the idlenesses
+        average_id = float(np.mean(idleness_values))
 
         #retrieving the max idleness
-        max_id = np.max(idleness_values)
+        max_id = float(np.max(idleness_values))
 
-        #check if there is a new all-time highest value
-        if max_id > self._all_time_highest_idleness:
-            self._all_time_highest_idleness = max_id
+        #check if there is a new all-time highest value, including the
+        #idlenesses reached between two updates before a visit
+        self._all_time_highest_idleness = max(
+            self._all_time_highest_idleness,
+            graph.highest_idleness,
+            max_id
+        )
 
         #inserting it into the corresponding attributes
-        self._average_idleness = average_id  
-        self._max_idleness = max_id          
+        self._average_idleness = average_id
+        self._max_idleness = max_id
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+
+import numpy as np
+
+class ShortestPaths(Mapping):
+    """
+    This class stores the shortest paths between every pair of nodes
+    of a graph in a compact way.
+
+    Only a predecessor matrix is kept in memory, and the paths are
+    rebuilt on demand. The most recently requested paths are kept in a
+    small LRU cache, since the algorithms tend to ask for the same
+    pairs over and over.
+
+    It can be used like the dictionary of paths it replaces:
+    shortest_paths[(start, end)] returns the list of nodes going from
+    start to end, both included.
+
+    Attributes:
+        _predecessors (np.ndarray): An int32 matrix where
+            _predecessors[i][j] is the node preceding j on the shortest
+            path from i to j, or -1 if there is none.
+        _cache (OrderedDict): The recently materialised paths, from the
+            least to the most recently used.
+        _cache_size (int): The maximum number of paths kept in the
+            cache.
+    """
+    def __init__(
+        self,
+        predecessors: np.ndarray,
+        cache_size: int = 1024
+    ) -> None:
+        self._predecessors = np.asarray(predecessors, dtype=np.int32)
+        self._cache: OrderedDict[tuple[int, int], list[int]] = OrderedDict()
+        self._cache_size = cache_size
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: dict[tuple[int, int], list[int]],
+        nb_nodes: int
+    ) -> "ShortestPaths":
+        """
+        Builds the compact store from a dictionary of full paths.
+
+        Args:
+            paths (dict[tuple[int, int], list[int]]): The shortest
+                paths, keyed by (start, end) pairs.
+            nb_nodes (int): The number of nodes of the graph.
+
+        Returns:
+            ShortestPaths: The equivalent compact store.
+        """
+        predecessors = np.full((nb_nodes, nb_nodes), -1, dtype=np.int32)
+        for (start, end), path in paths.items():
+            if len(path) > 1:
+                predecessors[start, end] = path[-2]
+        return cls(predecessors)
+
+    @property
+    def predecessors(self) -> np.ndarray:
+        """
+        Returns the predecessor matrix backing the store.
+        """
+        return self._predecessors
+
+    @property
+    def nb_nodes(self) -> int:
+        """
+        Returns the number of nodes covered by the store.
+        """
+        return len(self._predecessors)
+
+    def __getitem__(self, key: tuple[int, int]) -> list[int]:
+        path = self._cache.get(key)
+        if path is not None:
+            self._cache.move_to_end(key)
+            return path
+
+        path = self._reconstruct_path(*key)
+
+        self._cache[key] = path
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return path
+
+    def __len__(self) -> int:
+        # Only the pairs linked by a path are keys of the store
+        return int((self._predecessors >= 0).sum())
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        for start, end in np.argwhere(self._predecessors >= 0).tolist():
+            yield (start, end)
+
+    def _reconstruct_path(self, start: int, end: int) -> list[int]:
+        """
+        Walks back the predecessor matrix from the end to the start.
+
+        Args:
+            start (int): The first node of the path.
+            end (int): The last node of the path.
+
+        Raises:
+            KeyError: If there is no path between the two nodes.
+
+        Returns:
+            list[int]: The nodes of the path, from start to end.
+        """
+        if (
+            start == end
+            or not 0 <= start < self.nb_nodes
+            or not 0 <= end < self.nb_nodes
+        ):
+            raise KeyError((start, end))
+
+        predecessors = self._predecessors[start]
+        path = [end]
+        while path[-1] != start:
+            previous = int(predecessors[path[-1]])
+            if previous < 0 or len(path) > self.nb_nodes:
+                raise KeyError((start, end))
+            path.append(previous)
+        path.reverse()
+        return path
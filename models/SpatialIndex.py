@@ -0,0 +1,178 @@
+import math
+from collections import defaultdict
+from typing import Optional
+
+from models.Node import Node
+
+class SpatialIndex:
+    """
+    This class indexes the nodes of a graph on a uniform grid, so that
+    the nodes near a point or aligned with it are found without going
+    through every node.
+
+    Each node is stored in the cell, the column and the row of the grid
+    containing its position. The nodes near a point are returned in the
+    order they were added, like the list of nodes of the graph.
+
+    Attributes:
+        _cell_size (float): The width and height of a cell, in pixels.
+        _cells (defaultdict): The nodes of each (column, row) cell.
+        _columns (defaultdict): The nodes of each column.
+        _rows (defaultdict): The nodes of each row.
+        _positions (dict[Node, tuple[float, float]]): The position at
+            which each node is indexed.
+        _orders (dict[Node, int]): The order in which the nodes were
+            added.
+        _next_order (int): The order of the next node added.
+    """
+    def __init__(self, cell_size: float) -> None:
+        self._cell_size = cell_size
+        self._cells: defaultdict[tuple[int, int], set[Node]] = defaultdict(set)
+        self._columns: defaultdict[int, set[Node]] = defaultdict(set)
+        self._rows: defaultdict[int, set[Node]] = defaultdict(set)
+        self._positions: dict[Node, tuple[float, float]] = {}
+        self._orders: dict[Node, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self._positions
+
+    def add(self, node: Node) -> None:
+        """
+        Adds a node at its current position.
+
+        Args:
+            node (Node): The node to be added.
+        """
+        self._orders[node] = self._next_order
+        self._next_order += 1
+        self._insert(node)
+
+    def remove(self, node: Node) -> None:
+        """
+        Removes a node from the index.
+
+        Args:
+            node (Node): The node to be removed.
+        """
+        self._discard(node)
+        del self._orders[node]
+
+    def update(self, node: Node) -> None:
+        """
+        Moves a node to its current position in the index, keeping its
+        order.
+
+        Args:
+            node (Node): The node which has been moved.
+        """
+        if self._positions.get(node) != (node.x, node.y):
+            self._discard(node)
+            self._insert(node)
+
+    def nodes_near(self, x: float, y: float, radius: float) -> list[Node]:
+        """
+        Returns the nodes closer to a point than a radius.
+
+        Args:
+            x (float): The x coordinate of the point.
+            y (float): The y coordinate of the point.
+            radius (float): The distance below which a node is returned.
+
+        Returns:
+            list[Node]: The nodes, in the order they were added.
+        """
+        first_column, last_column = self._get_span(x, radius)
+        first_row, last_row = self._get_span(y, radius)
+
+        nodes = [
+            node
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+            for node in self._cells.get((column, row), ())
+            if math.hypot(node.x - x, node.y - y) < radius
+        ]
+        return sorted(nodes, key=self._orders.__getitem__)
+
+    def last_node_aligned(
+        self,
+        axis: str,
+        value: float,
+        threshold: float,
+        excluded: Optional[Node] = None
+    ) -> Optional[Node]:
+        """
+        Returns the last added node whose coordinate on an axis is
+        within a threshold of a value.
+
+        Args:
+            axis (str): "x" to compare the x coordinates, "y" to compare
+                the y coordinates.
+            value (float): The coordinate compared.
+            threshold (float): The largest difference of the returned
+                node.
+            excluded (Node, optional): A node which is never returned,
+                such as the node being aligned.
+
+        Raises:
+            ValueError: If the axis is neither "x" nor "y".
+
+        Returns:
+            Optional[Node]: The node, or None if no node is aligned.
+        """
+        if axis == "x":
+            bands = self._columns
+        elif axis == "y":
+            bands = self._rows
+        else:
+            raise ValueError(f"Unknown axis {axis}")
+
+        first_band, last_band = self._get_span(value, threshold)
+        return max(
+            (
+                node
+                for band in range(first_band, last_band + 1)
+                for node in bands.get(band, ())
+                if node is not excluded
+                and abs(getattr(node, axis) - value) <= threshold
+            ),
+            key=self._orders.__getitem__,
+            default=None
+        )
+
+    def _get_span(self, value: float, distance: float) -> tuple[int, int]:
+        """
+        Returns the first and last cells covering a distance around a
+        coordinate.
+        """
+        return (
+            math.floor((value - distance) / self._cell_size),
+            math.floor((value + distance) / self._cell_size)
+        )
+
+    def _insert(self, node: Node) -> None:
+        column = math.floor(node.x / self._cell_size)
+        row = math.floor(node.y / self._cell_size)
+        self._cells[column, row].add(node)
+        self._columns[column].add(node)
+        self._rows[row].add(node)
+        self._positions[node] = (node.x, node.y)
+
+    def _discard(self, node: Node) -> None:
+        x, y = self._positions.pop(node)
+        column = math.floor(x / self._cell_size)
+        row = math.floor(y / self._cell_size)
+
+        # Empty cells are removed, so that the grid does not keep every
+        # cell a node has been dragged through
+        for bands, key in (
+            (self._cells, (column, row)),
+            (self._columns, column),
+            (self._rows, row)
+        ):
+            bands[key].discard(node)
+            if not bands[key]:
+                del bands[key]
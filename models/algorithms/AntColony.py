@@ -1,3 +1,7 @@
+from typing import Optional, Union
+
+import numpy as np
+
 from models.Graph import Graph
 from models.TextBox import TextBox
 from models.algorithms.IAlgorithmModel import IAlgorithmModel
@@ -14,6 +18,8 @@ class AntColony(IAlgorithmModel):
         _parameters (dict): A dictionary storing the algorithm
             parameters, each wrapped in a TextBox object.
         _name (str): The name of the algorithm.
+        _nb_workers (int): The number of worker processes building
+            the colonies, 1 to build them in the current process.
     """
     def __init__(
         self,
@@ -22,7 +28,8 @@ class AntColony(IAlgorithmModel):
         beta=4,
         q=100,
         evaporation=0.1,
-        nb_colony = 5
+        nb_colony = 5,
+        nb_workers=1
     ) -> None:
         self._parameters = {
             "Alpha": TextBox(str(alpha)),
@@ -33,6 +40,20 @@ class AntColony(IAlgorithmModel):
             "Nb iterations": TextBox(str(nb_iterations)),
         }
         self._name = "Ant Colony Algorithm"
+        self._nb_workers = nb_workers
+
+    @property
+    def nb_workers(self) -> int:
+        """
+        Returns the number of worker processes building the colonies.
+        """
+        return self._nb_workers
+
+    @nb_workers.setter
+    def nb_workers(self, nb_workers: int) -> None:
+        if nb_workers <= 0:
+            raise ValueError("The number of workers must be positive")
+        self._nb_workers = nb_workers
 
     @property
     def parameters(self) -> None:
@@ -57,7 +78,8 @@ class AntColony(IAlgorithmModel):
     def initialize_algorithm(
             self,
             nb_agents : int,
-            graph : Graph
+            graph : Graph,
+            seed : Optional[Union[int, np.random.Generator]] = None
         ) -> IAlgorithm :
         """
         Initializes the Ant Colony algorithm with the given parameters.
@@ -65,9 +87,17 @@ class AntColony(IAlgorithmModel):
         Args:
             nb_agents (int): The number of agents to use in the algorithm.
             graph (Graph): The graph on which the algorithm will be applied.
+            seed (int or np.random.Generator, optional): The seed or
+                generator of every random draw of the algorithm.
         
         Returns:
             AntColonyAlgorithm: An instance of the AntColonyAlgorithm
             class initialized with the given parameters.
         """
-        return AntColonyAlgorithm(self._parameters, nb_agents, graph)
\ No newline at end of file
+        return AntColonyAlgorithm(
+            self._parameters,
+            nb_agents,
+            graph,
+            nb_workers=self._nb_workers,
+            seed=seed
+        )
\ No newline at end of file
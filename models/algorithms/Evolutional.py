@@ -1,3 +1,7 @@
+from typing import Optional, Union
+
+import numpy as np
+
 from models import Graph
 from models.algorithms.IAlgorithmModel import IAlgorithmModel
 from models.TextBox import TextBox
@@ -51,7 +55,8 @@ class Evolutional(IAlgorithmModel):
     def initialize_algorithm(
             self,
             nb_agents : int,
-            graph : Graph
+            graph : Graph,
+            seed : Optional[Union[int, np.random.Generator]] = None
         ) -> IAlgorithm :
         """
         Initializes the Evolutional Algorithm with the given parameters.
@@ -59,9 +64,11 @@ class Evolutional(IAlgorithmModel):
         Args:
             nb_agents (int): The number of agents to use in the algorithm.
             graph (Graph): The graph on which the algorithm will be applied.
+            seed (int or np.random.Generator, optional): The seed or
+                generator of every random draw of the algorithm.
         
         Returns:
             EvolutionalAlgorithm: An instance of the EvolutionalAlgorithm
             class initialized with the given parameters.
         """
-        return EvolutionalAlgorithm(self._parameters, nb_agents, graph)
\ No newline at end of file
+        return EvolutionalAlgorithm(self._parameters, nb_agents, graph, seed=seed)
\ No newline at end of file
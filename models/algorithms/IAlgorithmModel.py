@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+import numpy as np
 
 from models.Graph import Graph
 from services.algorithms.IAlgorithm import IAlgorithm
@@ -24,6 +27,11 @@ class IAlgorithmModel(ABC):
     def initialize_algorithm(
             self,
             nb_agents: int,
-            graph: Graph
+            graph: Graph,
+            seed: Optional[Union[int, np.random.Generator]] = None
         ) -> IAlgorithm:
+        """
+        Initializes the algorithm, which draws its random numbers from
+        the given seed or generator only.
+        """
         pass
\ No newline at end of file
@@ -1,3 +1,7 @@
+from typing import Optional, Union
+
+import numpy as np
+
 from models.Graph import Graph
 from models.TextBox import TextBox
 from models.algorithms.IAlgorithmModel import IAlgorithmModel
@@ -46,7 +50,8 @@ class KMeans(IAlgorithmModel):
     def initialize_algorithm(
             self,
             nb_agents : int,
-            graph : Graph
+            graph : Graph,
+            seed : Optional[Union[int, np.random.Generator]] = None
         ) -> IAlgorithm :
         """
         Initializes the K-Means Algorithm with the given parameters.
@@ -54,9 +59,11 @@ class KMeans(IAlgorithmModel):
         Args:
             nb_agents (int): The number of agents to use in the algorithm.
             graph (Graph): The graph on which the algorithm will be applied.
+            seed (int or np.random.Generator, optional): The seed or
+                generator of every random draw of the algorithm.
         
         Returns:
             KMeansAlgorithm: An instance of the KMeansAlgorithm
             class initialized with the given parameters.
         """
-        return KMeansAlgorithm(self._parameters, nb_agents, graph)
\ No newline at end of file
+        return KMeansAlgorithm(self._parameters, nb_agents, graph, seed=seed)
\ No newline at end of file
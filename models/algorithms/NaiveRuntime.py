@@ -1,3 +1,7 @@
+from typing import Optional, Union
+
+import numpy as np
+
 from models.Graph import Graph
 from models.algorithms.IAlgorithmModel import IAlgorithmModel
 from services.algorithms.IAlgorithm import IAlgorithm
@@ -42,7 +46,8 @@ class NaiveRuntime(IAlgorithmModel):
     def initialize_algorithm(
             self,
             nb_agents : int,
-            graph : Graph
+            graph : Graph,
+            seed : Optional[Union[int, np.random.Generator]] = None
         ) -> IAlgorithm :
         """
         Initializes the Naive Algorithm Runtime with the given parameters.
@@ -50,9 +55,11 @@ class NaiveRuntime(IAlgorithmModel):
         Args:
             nb_agents (int): The number of agents to use in the algorithm.
             graph (Graph): The graph on which the algorithm will be applied.
+            seed (int or np.random.Generator, optional): The seed or
+                generator of every random draw of the algorithm.
         
         Returns:
             NaiveAlgorithmRuntime: An instance of the NaiveAlgorithmRuntime
             class initialized with the given parameters.
         """
-        return NaiveAlgorithmRuntime(nb_agents, graph)
\ No newline at end of file
+        return NaiveAlgorithmRuntime(nb_agents, graph, seed=seed)
\ No newline at end of file
@@ -1,4 +1,8 @@
-import math
+import heapq
+from typing import Optional, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, spmatrix
 
 from services.IPathFindingService import IPathFindingService
 
@@ -6,90 +10,139 @@ class AStarService(IPathFindingService):
     """
     This class implements the A* pathfinding algorithm.
 
+    The graph is converted once into a CSR neighbour list and the score
+    arrays are allocated once, so that the same instance can answer
+    many queries on the same graph.
+
     Attributes:
-        _graph (list[list[float]]): The adjacency matrix representing the
-            graph.
-        _node_position (dict[int, tuple[int, int]]): The positions of the
-            nodes as (x, y) coordinates.
-        _start (int): The starting node for the pathfinding.
-        _end (int): The target node for the pathfinding.
-        _open_set (list[int]): A list of nodes to be evaluated by the
-            algorithm.
-        _came_from (dict[int, int]): A dictionary mapping nodes to
-            their predecessors in the path.
-        _g_score (dict[int, float]): The cost of the shortest path from
-            the start to each node.
-        _f_score (dict[int, float]): The estimated cost from the start
-            to the target through each node.
+        _indptr (np.ndarray): The CSR row pointers, the neighbours of a
+            node i are _indices[_indptr[i]:_indptr[i + 1]].
+        _indices (np.ndarray): The CSR neighbour indices.
+        _weights (np.ndarray): The CSR edge weights, aligned with
+            _indices.
+        _positions (np.ndarray): The (x, y) coordinates of the nodes,
+            one row per node.
+        _start (int): The default starting node for the pathfinding.
+        _end (int): The default target node for the pathfinding.
+        _came_from (np.ndarray): The predecessor of each node on the
+            best path found so far, -1 if there is none.
+        _g_score (np.ndarray): The cost of the shortest path from the
+            start to each node.
+        _closed (np.ndarray): Whether each node has been expanded.
     """
     def __init__(
         self,
-        graph: list[list[float]],
-        node_position: dict[int, tuple[int, int]],
-        start: int,
-        end: int
-    ) -> None: 
-        
-        self._graph = graph
-        self._node_position = node_position
+        graph: Union[list[list[float]], spmatrix],
+        node_position: Union[dict[int, tuple[int, int]], np.ndarray],
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> None:
+        # The graph may already be sparse, as exported by
+        # Graph.compute_sparse_matrix with an array of positions
+        if issparse(graph):
+            sparse_graph = csr_matrix(graph, dtype=float)
+        else:
+            sparse_graph = csr_matrix(np.asarray(graph, dtype=float))
+        self._indptr = sparse_graph.indptr
+        self._indices = sparse_graph.indices
+        self._weights = sparse_graph.data
+
+        nb_nodes = sparse_graph.shape[0]
+        self._positions = np.array(
+            [node_position[node] for node in range(nb_nodes)],
+            dtype=float
+        ).reshape(nb_nodes, 2)
+
         self._start = start
         self._end = end
 
-        self._open_set = []
-        self._came_from = {}
-        self._g_score = {}
-        self._f_score = {}
+        self._came_from = np.empty(nb_nodes, dtype=np.int32)
+        self._g_score = np.empty(nb_nodes, dtype=float)
+        self._closed = np.empty(nb_nodes, dtype=bool)
 
-        for node in self._node_position.keys():
-            self._g_score[node] = math.inf
-            self._f_score[node] = math.inf
+    def _compute_h(self, end: int) -> np.ndarray:
+        """
+        Computes the straight line distance between every node and the
+        target node.
 
-    def _compute_h (self, node): 
-        # distance entre le noeud et la fin
-        (x1, y1) = self._node_position[node]
-        (x2, y2) = self._node_position[self._end]
+        Args:
+            end (int): The target node.
 
-        return math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
-    
-    def _reconstruct_path(self, current): 
+        Returns:
+            np.ndarray: The heuristic value of each node.
+        """
+        return np.hypot(
+            *(self._positions - self._positions[end]).T
+        )
+
+    def _reconstruct_path(self, current: int) -> list[int]:
         total_path = [current]
-        while current in self._came_from.keys(): 
-            current = self._came_from[current]
-            total_path.insert(0, current)
+        while self._came_from[current] >= 0:
+            current = int(self._came_from[current])
+            total_path.append(current)
+        total_path.reverse()
 
         return total_path
-    
-
-    def find_path(self):
-        open_set = [self._start]  
-
-        self._g_score[self._start] = 0 
-        self._f_score[self._start] = self._compute_h(self._start)
 
-        while len(open_set) > 0:
-
-            current = open_set[0]
-            for node in open_set: 
-                if self._f_score[node] < self._f_score[current]: 
-                    current = node
-
-            if current == self._end: 
+    def find_path(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Optional[tuple[list[int], float]]:
+        """
+        Finds the shortest path between two nodes.
+
+        Args:
+            start (int, optional): The starting node. Defaults to the
+                one given to the constructor.
+            end (int, optional): The target node. Defaults to the one
+                given to the constructor.
+
+        Returns:
+            Optional[tuple[list[int], float]]: The nodes of the path
+                and its length, or None if the target is unreachable.
+        """
+        start = self._start if start is None else start
+        end = self._end if end is None else end
+
+        self._came_from.fill(-1)
+        self._g_score.fill(np.inf)
+        self._closed.fill(False)
+        h_score = self._compute_h(end)
+
+        self._g_score[start] = 0.0
+        # The open set is a heap of (f score, node) pairs. A node can be
+        # pushed several times, the outdated entries are skipped when
+        # they are popped
+        open_set = [(h_score[start], start)]
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if self._closed[current]:
+                continue
+
+            if current == end:
                 return (self._reconstruct_path(current),
-                        self._g_score[current])
-
-            open_set.remove(current)
-
-            for i in range(len(self._graph[current])): 
-                if self._graph[current][i] > 0: 
-                    tentative_g_score = self._g_score[current] + self._graph[current][i]
-
-                    if tentative_g_score < self._g_score[i]: 
-                        self._came_from[i] = current
-                        self._g_score[i] = tentative_g_score
-                        self._f_score[i] = tentative_g_score + self._compute_h(i)
-                        if i not in open_set: 
-                            open_set.append(i)
+                        float(self._g_score[current]))
+
+            self._closed[current] = True
+
+            begin, stop = self._indptr[current], self._indptr[current + 1]
+            neighbours = self._indices[begin:stop]
+            tentative_g_scores = (
+                self._g_score[current] + self._weights[begin:stop]
+            )
+
+            improved = tentative_g_scores < self._g_score[neighbours]
+            for neighbour, g_score in zip(
+                neighbours[improved].tolist(),
+                tentative_g_scores[improved].tolist()
+            ):
+                self._came_from[neighbour] = current
+                self._g_score[neighbour] = g_score
+                heapq.heappush(
+                    open_set,
+                    (g_score + h_score[neighbour], neighbour)
+                )
 
         return None
-                
-    
\ No newline at end of file
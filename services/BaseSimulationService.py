@@ -0,0 +1,268 @@
+from abc import abstractmethod
+from typing import Optional
+
+import numpy as np
+
+from constants.Config import AGENT_SPEED
+from models.Graph import Graph
+from services.ISimulationService import ISimulationService
+from services.algorithms.IAlgorithm import IAlgorithm
+from services.algorithms.NaiveAlgorithmRuntime import NaiveAlgorithmRuntime
+
+class BaseSimulationService(ISimulationService):
+    """
+    This class holds what the services simulating the patrol share:
+    the paths of the agents and the sampling of the idleness.
+
+    The idleness of a node is the simulated time since its last visit,
+    recorded by the graph, so nothing has to be updated between two
+    visits.
+
+    Attributes:
+        _graph (Graph): The patrolled graph.
+        _algorithm (IAlgorithm): The algorithm which found the paths,
+            asked for the next node of an agent at each of its arrivals
+            when it computes the paths at runtime.
+        _speed (float): The speed of the agents, in pixels per second.
+        _time (float): The simulated time, in seconds.
+        _positions (np.ndarray): The (x, y) coordinates of the nodes.
+        _paths (np.ndarray): The path of each agent, one row per agent
+            padded to the longest path. An agent goes back to the first
+            node of its path after the last one.
+        _path_lengths (np.ndarray): The number of nodes of each path.
+        _cursors (np.ndarray): The index, in its path, of the last node
+            reached by each agent.
+        _moving (np.ndarray): Whether each agent has somewhere to go,
+            an agent whose path has a null length stays on its node.
+    """
+    def __init__(
+        self,
+        graph: Graph,
+        paths: list[list[int]],
+        algorithm: Optional[IAlgorithm] = None,
+        speed: float = AGENT_SPEED
+    ) -> None:
+        if any(len(path) == 0 for path in paths):
+            raise ValueError("Every agent must have a path.")
+
+        self._graph = graph
+        self._algorithm = algorithm
+        self._speed = speed
+        self._time = 0.0
+
+        self._positions = np.array(
+            [(node.x, node.y) for node in graph.nodes],
+            dtype=float
+        ).reshape(len(graph.nodes), 2)
+
+        nb_agents = len(paths)
+        width = max((len(path) for path in paths), default=1)
+        self._paths = np.zeros((nb_agents, width), dtype=np.int32)
+        self._path_lengths = np.array(
+            [len(path) for path in paths],
+            dtype=np.int32
+        )
+        for agent, path in enumerate(paths):
+            self._paths[agent, :len(path)] = path
+        self._cursors = np.zeros(nb_agents, dtype=np.int32)
+        self._moving = self._compute_path_lengths() > 0
+
+        # Every node is considered visited when the simulation starts,
+        # and every agent stands on the first node of its path
+        self._graph.reset_idleness()
+        current_nodes, _ = self._current_edges()
+        self._graph.occupy_nodes(current_nodes)
+
+    @property
+    def time(self) -> float:
+        """
+        Returns the simulated time, in seconds.
+        """
+        return self._time
+
+    @property
+    def is_runtime(self) -> bool:
+        """
+        Returns True if the algorithm gives the next node of the agents
+        at runtime.
+        """
+        return isinstance(self._algorithm, NaiveAlgorithmRuntime)
+
+    @property
+    def agent_positions(self) -> np.ndarray:
+        """
+        Returns the (x, y) coordinates of each agent, one row per agent.
+        """
+        return self._positions_on_edges(self._get_progress())
+
+    def agents_on_nodes(self) -> np.ndarray:
+        """
+        Returns the node each agent stands on, read from the arrays of
+        the agents: as they travel from node to node, an agent stands
+        on the last node it reached until it has left it.
+
+        Returns:
+            np.ndarray: The node of each agent, -1 for the agents
+                between two nodes.
+        """
+        current_nodes, _ = self._current_edges()
+        return np.where(self._get_progress() == 0, current_nodes, -1)
+
+    @abstractmethod
+    def _get_progress(self) -> np.ndarray:
+        """
+        Returns the distance travelled by each agent since the last
+        node it reached.
+        """
+        pass
+
+    def _update_graph(self) -> None:
+        """
+        Sets the time at which the graph gives the idleness of the
+        nodes, which the GUI reads, and the nodes where an agent stands,
+        which are not idle.
+        """
+        self._graph.set_idleness_time(self._time)
+        nodes = self.agents_on_nodes()
+        self._graph.occupy_nodes(nodes[nodes >= 0])
+
+    def _current_edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the last node reached by each agent and the node it is
+        going to.
+        """
+        agents = np.arange(len(self._paths))
+        current_nodes = self._paths[agents, self._cursors]
+        next_nodes = self._paths[
+            agents,
+            (self._cursors + 1) % self._path_lengths
+        ]
+        return current_nodes, next_nodes
+
+    def _edge_lengths(self) -> np.ndarray:
+        """
+        Returns the length of the edge each agent is moving along.
+        """
+        current_nodes, next_nodes = self._current_edges()
+        return np.hypot(
+            *(self._positions[next_nodes] - self._positions[current_nodes]).T
+        )
+
+    def _compute_path_lengths(self) -> np.ndarray:
+        """
+        Returns the length of the whole cycle of each agent.
+        """
+        next_indices = (
+            np.arange(self._paths.shape[1])[None, :] + 1
+        ) % self._path_lengths[:, None]
+        next_nodes = np.take_along_axis(self._paths, next_indices, axis=1)
+        lengths = np.hypot(
+            *(self._positions[next_nodes] - self._positions[self._paths]).T
+        ).T
+        in_path = (
+            np.arange(self._paths.shape[1])[None, :]
+            < self._path_lengths[:, None]
+        )
+        return np.sum(lengths * in_path, axis=1)
+
+    def _positions_on_edges(self, progress: np.ndarray) -> np.ndarray:
+        """
+        Returns the (x, y) coordinates of each agent from the distance
+        it travelled along its current edge.
+
+        Args:
+            progress (np.ndarray): The distance travelled by each agent
+                since the last node it reached.
+        """
+        current_nodes, next_nodes = self._current_edges()
+        edge_lengths = self._edge_lengths()
+        ratio = np.divide(
+            progress,
+            edge_lengths,
+            out=np.zeros_like(progress),
+            where=edge_lengths > 0
+        )
+        return (
+            self._positions[current_nodes]
+            + (self._positions[next_nodes] - self._positions[current_nodes])
+            * ratio[:, None]
+        )
+
+    def _update_runtime_path(self, agent: int, arrival_time: float) -> bool:
+        """
+        Asks the runtime algorithm for the next node of an agent which
+        reached a node, as the GUI does.
+
+        Args:
+            agent (int): The agent which reached a node.
+            arrival_time (float): The time of the arrival.
+
+        Returns:
+            bool: True if the path of the agent has been replaced.
+        """
+        if self._cursors[agent] != 1:
+            return False
+
+        # The algorithm reads the idleness of the nodes from the graph
+        self._graph.set_idleness_time(arrival_time)
+
+        current_node = int(self._paths[agent, 1])
+        new_path = self._algorithm.update(agent, current_node)
+        real_path = self._graph.compute_real_paths([new_path])[0]
+
+        self._paths[agent, :2] = real_path[:2]
+        self._cursors[agent] = 0
+        return True
+
+    def get_idleness(self) -> np.ndarray:
+        """
+        Returns the idleness of each node at the simulated time.
+
+        Returns:
+            np.ndarray: The time since the last visit of each node, in
+                seconds.
+        """
+        self._graph.set_idleness_time(self._time)
+        return self._graph.get_idleness()
+
+    def get_idleness_data(self) -> tuple[float, float, float]:
+        """
+        Returns the idleness data at the simulated time.
+
+        Returns:
+            tuple[float, float, float]: The average, max and all-time
+                max idleness.
+        """
+        idleness = self.get_idleness()
+        max_idleness = float(np.max(idleness))
+        return (
+            float(np.mean(idleness)),
+            max_idleness,
+            max(self._graph.highest_idleness, max_idleness)
+        )
+
+    def run(
+        self,
+        duration: float,
+        interval: float = 10
+    ) -> list[tuple[float, float, float, float]]:
+        """
+        Runs the simulation and samples the idleness data at regular
+        intervals, like the results exported by the GUI.
+
+        Args:
+            duration (float): The simulated duration, in seconds.
+            interval (float): The simulated time between two samples,
+                in seconds.
+
+        Returns:
+            list[tuple[float, float, float, float]]: The simulated
+                time, average, max and all-time max idleness of each
+                sample.
+        """
+        samples = []
+        nb_samples = int(duration // interval)
+        for sample in range(1, nb_samples + 1):
+            self.advance(sample * interval - self._time)
+            samples.append((round(self._time, 2), *self.get_idleness_data()))
+        return samples
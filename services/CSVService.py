@@ -1,17 +1,36 @@
-import ast
 import csv
 import os
 import re
+import tempfile
 from utils.utils import get_data_path
 
-import pygame
+from typing import Collection, Optional, Union
 
-from threading import Timer
-from typing import Union
+import numpy as np
 
 from models.GraphData import GraphData
 from models.GraphDataComplements import GraphDataComplements
+from models.ShortestPaths import ShortestPaths
 from services.ICSVService import ICSVService
+from services.ResultsWriter import ResultsWriter
+from services.TestNumberService import TestNumberService
+
+# Headers of the sections of a graph CSV file, after the line of nodes
+SIMPLE_GRAPH_SECTION = "Simple Graph"
+COMPLETE_GRAPH_SECTION = "Complete Graph"
+SHORTEST_PATHS_SECTION = "Shortest paths"
+IMAGE_REF_SECTION = "Image_ref"
+SECTION_HEADERS = (
+    SIMPLE_GRAPH_SECTION,
+    COMPLETE_GRAPH_SECTION,
+    SHORTEST_PATHS_SECTION,
+    IMAGE_REF_SECTION
+)
+GRAPH_SECTIONS = (
+    SIMPLE_GRAPH_SECTION,
+    COMPLETE_GRAPH_SECTION,
+    SHORTEST_PATHS_SECTION
+)
 
 
 class CSVService(ICSVService):
@@ -35,7 +54,7 @@ class CSVService(ICSVService):
         self._results_folder_path = get_data_path('results')
         
         self._current_csv_number = 0
-        self._active_timer = None
+        self._results_writer = None
 
     @property
     def current_csv_number(self) -> int:
@@ -63,9 +82,13 @@ class CSVService(ICSVService):
         self._current_csv_number = value
 
     def stop_timer(self):
-        if self._active_timer and self._active_timer.is_alive():
-            self._active_timer.cancel()
-        self._active_timer = None
+        """
+        Stops the idleness export, after its remaining samples are
+        written to the results file.
+        """
+        if self._results_writer is not None:
+            self._results_writer.stop()
+        self._results_writer = None
 
     def _initialize_directories(self):
         """
@@ -80,14 +103,6 @@ class CSVService(ICSVService):
         if not os.path.exists(self._references_file_path):
             open(self._references_file_path, "w").close()
 
-    def _initialize_test_numbers_file(self):
-        """
-        Ensures the test numbers file exists.
-        """
-        if not os.path.exists(self._test_numbers_file_path):
-            with open(self._test_numbers_file_path, "w") as f:
-                f.write("Algorithm,TestNumber\n")
-
     def _count_files(self) -> int:
         """
         Counts the number of CSV files in the CSV directory.
@@ -97,7 +112,12 @@ class CSVService(ICSVService):
         """
         if not os.path.exists(self._csv_folder_path):
             return 0
-        return len(os.listdir(self._csv_folder_path))
+
+        # The folder also holds the cache of the paths of the algorithms
+        return len([
+            file for file in os.listdir(self._csv_folder_path)
+            if file.endswith('.csv')
+        ])
 
     def save(self, edges_matrix, nodes_list, image_name) -> None:
         """
@@ -274,97 +294,261 @@ class CSVService(ICSVService):
 
     def _parse_csv_file(
         self,
-        file_path: str
+        file_path: str,
+        sections: Optional[Collection[str]] = None
     ) -> GraphData:
         """
         Parses a CSV file to extract nodes, adjacency matrix, and
         complement data such as complete adjacency matrix and shortest
         paths.
 
+        The file is read line by line, and each line is parsed according
+        to the section it belongs to, so that only one section is held
+        in memory at once. The reading stops once the requested sections
+        are parsed.
+
         Args:
             file_path (str): Path to the CSV file.
+            sections (Collection[str], optional): The sections to parse
+                among SIMPLE_GRAPH_SECTION, COMPLETE_GRAPH_SECTION and
+                SHORTEST_PATHS_SECTION, all of them by default. The
+                nodes are always parsed.
         
         Returns:
             GraphData: Containing:
                 - List of adjacency matrix rows
                 - List of node positions (x, y)
                 - List of complete graph adjacency matrix
-                - Dictionary of shortest paths between node pairs
+                - Shortest paths between node pairs, or None if the
+                  file has no such section
         """
         if not os.path.exists(file_path):
             print("File does not exist")
             return None, None
 
-        edges_matrix: list[list[float]] = []
-        nodes_list: list[tuple[int, int]] = []
-        complete_adjacency_matrix: list[list[float]] = []
-        shortest_paths: dict[tuple[int, int], list[int]] = {}
+        remaining_sections = set(GRAPH_SECTIONS if sections is None else sections)
 
+        nodes_list: list[tuple[int, int]] = []
+        matrices: dict[str, list[list[float]]] = {
+            SIMPLE_GRAPH_SECTION: [],
+            COMPLETE_GRAPH_SECTION: []
+        }
+        predecessors: Optional[np.ndarray] = None
 
         with open(file_path, "r") as f:
-            lines = f.readlines()
-        
-        # first line with nodes data
-        nodes_line = lines[0]
-        # extract all (x, y) pairs
-        matches = re.findall(r"\((\d+),\s*(\d+)\)", nodes_line) 
-        nodes_list = [(int(x), int(y)) for x, y in matches]
-        
-        section = None
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                continue
-            
-            if "Simple Graph" in line:
-                section = "Simple Graph"
-                continue
-            elif "Complete Graph" in line:
-                section = "Complete Graph"
-                continue
-            elif "Shortest paths" in line:
-                section = "Shortest paths"
-                continue
-            elif "Image_ref" in line:
-                section = None
-                continue
-            
-            if section == "Simple Graph":
-                edges_matrix.append(
-                    [
-                        float(cell.strip()) if cell.strip() else 0.0
-                        for cell in line.split(",")
-                    ]
-                )
-            
-            elif section == "Complete Graph":
-                complete_adjacency_matrix.append(
-                    [
-                        float(cell.strip()) if cell.strip() else 0.0
-                        for cell in line.split(",")
-                    ]
-                )
-            
-            elif section == "Shortest paths":
-                parts = line.split(",", maxsplit=2)
-                if len(parts) == 3:
-                    start = int(parts[0])
-                    end = int(parts[1])
-                    path = ast.literal_eval(parts[2])
-                    shortest_paths[(start, end)] = path
+            # first line with nodes data
+            nodes_line = next(iter(f), "")
+            # extract all (x, y) pairs
+            matches = re.findall(r"\((\d+),\s*(\d+)\)", nodes_line) 
+            nodes_list = [(int(x), int(y)) for x, y in matches]
+
+            section = None
+            rows: list[np.ndarray] = []
+            for line in f:
+                # Only the headers start with a letter
+                header = line.split(",", 1)[0].strip() if line[:1].isalpha() else None
+                if header in SECTION_HEADERS:
+                    # The rows of a matrix are kept as arrays until the
+                    # end of its section
+                    if rows:
+                        matrices[section] = [row.tolist() for row in rows]
+                        rows = []
+                    remaining_sections.discard(section)
+                    if not remaining_sections:
+                        break
+
+                    section = header if header in remaining_sections else None
+                    if section == SHORTEST_PATHS_SECTION:
+                        # Only the node preceding the end of each path
+                        # is kept, the paths are rebuilt on demand from
+                        # this matrix
+                        predecessors = np.full(
+                            (len(nodes_list), len(nodes_list)),
+                            -1,
+                            dtype=np.int32
+                        )
+                    continue
+
+                line = line.strip()
+                if section is None or not line:
+                    continue
+
+                if section == SHORTEST_PATHS_SECTION:
+                    self._parse_shortest_path_line(line, predecessors)
+                else:
+                    rows.append(self._parse_matrix_row(line))
+
+            if rows:
+                matrices[section] = [row.tolist() for row in rows]
 
         return GraphData(
-            shortest_paths = shortest_paths,
+            shortest_paths=(
+                ShortestPaths(predecessors)
+                if predecessors is not None
+                else None
+            ),
+            nodes_list=nodes_list,
+            adjacency_matrix=matrices[SIMPLE_GRAPH_SECTION],
+            complete_adjacency_matrix=matrices[COMPLETE_GRAPH_SECTION]
+        )
+
+    def _parse_matrix_row(self, line: str) -> np.ndarray:
+        """
+        Converts a row of a matrix section at once, an empty cell being
+        a missing edge.
+        """
+        cells = line.split(",")
+        try:
+            return np.array(cells, dtype=float)
+        except ValueError:
+            return np.array([cell.strip() or 0.0 for cell in cells], dtype=float)
+
+    def _parse_shortest_path_line(self, line: str, predecessors: np.ndarray) -> None:
+        """
+        Reads the start, the end and the node preceding the end of a
+        path written as "start,end,[start, ..., previous, end]", without
+        decoding the whole path.
+
+        Args:
+            line (str): The line of the path.
+            predecessors (np.ndarray): The predecessor matrix to fill.
+        """
+        parts = line.split(",", 2)
+        if len(parts) < 3:
+            return
+
+        # The two last nodes of the path are enough
+        last_nodes = parts[2].strip(" []").rsplit(",", 2)
+        if len(last_nodes) >= 2:
+            predecessors[int(parts[0]), int(parts[1])] = int(last_nodes[-2])
+
+    def _load_graph_file(
+        self,
+        file_path: str,
+        sections: Optional[Collection[str]] = None
+    ) -> GraphData:
+        """
+        Loads graph data from the binary bundle of a CSV file if it is
+        up to date, or parses the CSV file and writes its bundle so that
+        the next loads need no parsing.
+
+        Args:
+            file_path (str): Path to the CSV file.
+            sections (Collection[str], optional): The sections needed
+                by the caller, all of them by default. A bundle is only
+                written when the whole file is parsed.
+
+        Returns:
+            GraphData: The data of the graph.
+        """
+        if not os.path.exists(file_path):
+            print("File does not exist")
+            return None, None
+
+        bundle_path = self._get_bundle_path(file_path)
+        if self._is_bundle_up_to_date(file_path, bundle_path):
+            try:
+                return self._read_bundle(bundle_path)
+            except (OSError, ValueError, KeyError):
+                # A damaged bundle is written again from the CSV file
+                pass
+
+        graph_data = self._parse_csv_file(file_path, sections)
+        if sections is not None and set(GRAPH_SECTIONS) - set(sections):
+            return graph_data
+
+        try:
+            self._write_bundle(graph_data, bundle_path)
+        except OSError:
+            # The CSV file can still be loaded from a read-only folder
+            pass
+        return graph_data
+
+    def _get_bundle_path(self, file_path: str) -> str:
+        """
+        Returns the path of the binary bundle of a CSV file, which is
+        next to it with the .npz extension.
+        """
+        return os.path.splitext(file_path)[0] + '.npz'
+
+    def _is_bundle_up_to_date(self, file_path: str, bundle_path: str) -> bool:
+        """
+        Checks if the binary bundle of a CSV file has been written after
+        the last change of the CSV file.
+        """
+        if not os.path.exists(bundle_path):
+            return False
+        return os.stat(bundle_path).st_mtime_ns >= os.stat(file_path).st_mtime_ns
+
+    def _write_bundle(self, graph_data: GraphData, bundle_path: str) -> None:
+        """
+        Writes graph data to a binary bundle holding the node positions,
+        the adjacency matrix and, if they are computed, the complete
+        adjacency matrix and the predecessor matrix of the shortest
+        paths.
+
+        Args:
+            graph_data (GraphData): The data of the graph.
+            bundle_path (str): Path to the .npz file.
+        """
+        nb_nodes = len(graph_data.nodes_list)
+        arrays = {
+            "nodes": np.array(graph_data.nodes_list, dtype=np.int64).reshape(nb_nodes, 2),
+            "adjacency_matrix": np.array(
+                graph_data.adjacency_matrix, dtype=float
+            ).reshape(nb_nodes, nb_nodes)
+        }
+        if graph_data.complete_adjacency_matrix and graph_data.shortest_paths is not None:
+            arrays["complete_adjacency_matrix"] = np.array(
+                graph_data.complete_adjacency_matrix, dtype=float
+            ).reshape(nb_nodes, nb_nodes)
+            arrays["predecessors"] = graph_data.shortest_paths.predecessors
+
+        # The bundle is written aside then renamed, so that it is never
+        # read half written
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix='.tmp',
+            dir=os.path.dirname(bundle_path) or None
+        )
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temporary_path, bundle_path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _read_bundle(self, bundle_path: str) -> GraphData:
+        """
+        Reads graph data from a binary bundle, without any parsing.
+
+        Args:
+            bundle_path (str): Path to the .npz file.
+
+        Returns:
+            GraphData: The data of the graph.
+        """
+        with np.load(bundle_path) as bundle:
+            nodes_list = [tuple(node) for node in bundle["nodes"].tolist()]
+            edges_matrix = bundle["adjacency_matrix"].tolist()
+            if "predecessors" in bundle.files:
+                complete_adjacency_matrix = bundle["complete_adjacency_matrix"].tolist()
+                shortest_paths = ShortestPaths(bundle["predecessors"])
+            else:
+                complete_adjacency_matrix = []
+                shortest_paths = None
+
+        return GraphData(
+            shortest_paths=shortest_paths,
             nodes_list=nodes_list,
             adjacency_matrix=edges_matrix,
             complete_adjacency_matrix=complete_adjacency_matrix
         )
-            
 
     def load_from_num_file(
         self,
-        num_file: int
+        num_file: int,
+        sections: Optional[Collection[str]] = None
     ) -> GraphData:
         """
         Loads graph data from a CSV file identified by its number.
@@ -372,6 +556,8 @@ class CSVService(ICSVService):
         Args:
             num_file (int): The number associated with the CSV file to
                 load.
+            sections (Collection[str], optional): The sections to load,
+                all of them by default.
         
         Returns:
             GraphData: Containing:
@@ -385,17 +571,20 @@ class CSVService(ICSVService):
             self._csv_folder_path,
             f"graph_{num_file}.csv"
         )
-        return self._parse_csv_file(file_path)
+        return self._load_graph_file(file_path, sections)
 
     def load(
         self,
-        file_path: str
+        file_path: str,
+        sections: Optional[Collection[str]] = None
     ) -> GraphData:
         """
         Loads graph data from a specified CSV file path.
 
         Args:
             file_path (str): Path to the CSV file.
+            sections (Collection[str], optional): The sections to load,
+                all of them by default.
 
             
         Returns:
@@ -406,7 +595,7 @@ class CSVService(ICSVService):
                 - Dictionary of shortest paths between node pairs
         """
         self.current_csv_number = self.extract_graph_number(file_path)
-        return self._parse_csv_file(file_path)
+        return self._load_graph_file(file_path, sections)
 
     def extract_graph_number(self, file_path: str) -> int:
         """
@@ -447,6 +636,10 @@ class CSVService(ICSVService):
         """
         Retrieves the next test number for the given algorithm and graph.
 
+        The numbers are shared with the batch runner through the test
+        numbers file, so that a test never reuses the number of a run
+        of the batch.
+
         Args:
             algorithm (str): The name of the algorithm.
             graph_number (int): The graph number associated with the test.
@@ -454,29 +647,10 @@ class CSVService(ICSVService):
         Returns:
             int: The next test number for the algorithm and graph.
         """
-        self._initialize_test_numbers_file()
-
-        test_numbers = {}
-
-        # Read existing test numbers
-        with open(self._test_numbers_file_path, "r") as f:
-            for line in f:
-                if line.strip() and not line.startswith("Algorithm"):
-                    key, test_number = line.strip().split(",")
-                    test_numbers[key] = int(test_number)
-
-        # Construct a composite key for algorithm and graph
-        key = f"{algorithm}_graph_{graph_number}"
-        next_test_number = test_numbers.get(key, 0) + 1
-        test_numbers[key] = next_test_number
-
-        # Write updated test numbers back to the file
-        with open(self._test_numbers_file_path, "w") as f:
-            f.write("Algorithm,TestNumber\n")  # Write header
-            for key, test_number in test_numbers.items():
-                f.write(f"{key},{test_number}\n")
-
-        return next_test_number
+        return TestNumberService(self._test_numbers_file_path).get_next_test_number(
+            algorithm,
+            f"graph_{graph_number}"
+        )
 
     def export_idleness_data(
         self,
@@ -485,23 +659,30 @@ class CSVService(ICSVService):
         algorithm: str,
         test_number: int,
         start_time: int,
-        interval: int = 10
+        interval: float = 10,
+        seed: Optional[int] = None
     ):
         """
         Exports idleness data with additional metadata to a CSV file every
-        `interval` seconds.
-        Appends results if the file already exists.
+        `interval` seconds, which may be below a second.
+        Appends results if the file already exists. The samples are
+        buffered and written by a background thread until the
+        simulation stops or stop_timer is called.
 
         Args:
-            csv_service (CSVService): Instance of CSVService to retrieve
-                current graph number.
             idleness_data_provider (callable): A function that provides
                 the idleness data as (average, max, all-time max).
+            simulation_running_provider (callable): A function telling
+                whether the simulation is still running, the writer
+                stopping once it returns False.
             algorithm (str): The name of the algorithm being tested.
             test_number (int): The test number for the current simulation.
             start_time (int): The simulation start time in milliseconds
-                (from pygame.time.get_ticks()).
-            interval (int): The interval (in seconds) at which the data will be exported.
+                (from pygame.time.get_ticks()), from which the writer
+                gets the elapsed time of each sample, in seconds.
+            interval (float): The interval (in seconds) at which the data will be exported.
+            seed (int, optional): The seed of the algorithm, recorded
+                so that the simulation can be reproduced.
         """
         current_csv_number = self.current_csv_number
         if current_csv_number == 0:
@@ -509,55 +690,26 @@ class CSVService(ICSVService):
 
         # Generate the CSV filename based on the graph number
         csv_filename = f'graph_{current_csv_number}_results.csv'
-        results_folder_path = self._results_folder_path
-        csv_path = os.path.join(results_folder_path, csv_filename)
-
-        # Ensure directory exists
-        if not os.path.exists(results_folder_path):
-            os.makedirs(results_folder_path)
-
-        # Check if the file already exists
-        file_exists = os.path.exists(csv_path)
-
-        # Write headers if the file does not exist
-        if not file_exists:
-            with open(csv_path, mode='w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([
-                    "Algorithm", "Test Number",
-                    "Simulation Time (s)", "Average Idleness",
-                    "Current Max Idleness", "All-time Max Idleness"
-                ])
-
-        def write_data():
-            if (
-                self._active_timer is None
-                or not self._active_timer.is_alive()
-                or not simulation_running_provider()
-            ):
-                return
-
-            # Retrieve idleness data
-            average, max_idleness, all_time_max = idleness_data_provider()
-
-            # Calculate simulation time in seconds
-            elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
-
-            # Write data to the CSV file
-            with open(csv_path, mode='a', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([
-                    algorithm, test_number,
-                    round(elapsed_time, 2), average, max_idleness, all_time_max
-                ])
-
-            # Schedule the next write
-            self._active_timer = Timer(interval, write_data)
-            self._active_timer.start()
-
-        # Stop the previous timer if it exists
+        csv_path = os.path.join(self._results_folder_path, csv_filename)
+
+        # pygame is only needed by the GUI export, so that the graphs
+        # can be loaded by the headless simulation without it
+        import pygame
+
+        def elapsed_time_provider():
+            return (pygame.time.get_ticks() - start_time) / 1000.0
+
+        # Stop the previous export if it exists
         self.stop_timer()
 
-        # Plan the first write
-        self._active_timer = Timer(interval, write_data)
-        self._active_timer.start()
+        self._results_writer = ResultsWriter(
+            csv_path,
+            idleness_data_provider,
+            simulation_running_provider,
+            elapsed_time_provider,
+            algorithm,
+            test_number,
+            seed=seed,
+            interval=interval
+        )
+        self._results_writer.start()
@@ -1,4 +1,10 @@
-from services.IPathFindingService import IPathFindingService
+from typing import Union
+
+import numpy as np
+from scipy.sparse import spmatrix
+
+from models.ShortestPaths import ShortestPaths
+from services.IShortestPathService import IShortestPathService
 from services.ICompleteGraphService import ICompleteGraphService
 
 class CompleteGraphService(ICompleteGraphService):
@@ -7,76 +13,61 @@ class CompleteGraphService(ICompleteGraphService):
         graph.
 
         Attributes:
-            _node_position (dict): A dictionary mapping each node to its
-                coordinates.
-            _simple_graph (list[list[float]]): The adjacency matrix
-                representing distances between nodes in the simple
-                graph.
+            _simple_graph (Union[list[list[float]], spmatrix]): The
+                adjacency matrix representing distances between nodes
+                in the simple graph, dense or sparse.
             _complete_graph (list[list[float]]): The adjacency matrix
                 representing distances between nodes in the complete
                 graph.
-            _shortest_way_matrix (list[list[list[int]]]): A matrix that
-                specifies, for each pair of nodes, the path to take
-                from one to the other.
-            _path_finding_service (IPathFindingService): A service that
-                implements a function to find the shortest way between
-                two nodes.
+            _shortest_paths (ShortestPaths): The shortest ways between
+                every pair of nodes, stored as a predecessor matrix.
+            _shortest_path_service (IShortestPathService): A service
+                that computes the shortest ways between every pair of
+                nodes in one pass.
         """
-     
+
     def __init__(
         self,
-        simple_graph: list[list[float]],
-        node_position: dict[int, tuple[int, int]],
-        path_finding_service : IPathFindingService
-    ) -> None: 
+        simple_graph: Union[list[list[float]], spmatrix],
+        shortest_path_service: type[IShortestPathService]
+    ) -> None:
         self._simple_graph = simple_graph
-        self._node_position = node_position
-        self._complete_graph = [[0 for _ in range(len(simple_graph))]
-                                for _ in range(len(simple_graph))]
-        self._shortest_way_matrix = [[[] for _ in range(len(simple_graph))]
-                                     for _ in range(len(simple_graph))]
-        self._path_finding_service = path_finding_service
+        self._complete_graph = None
+        self._shortest_paths = None
+        self._shortest_path_service = shortest_path_service
         self.create_complete_graph()
 
-    def create_complete_graph(self) -> None: 
-        for i in range(len(self._simple_graph)): 
-            for j in range(i, len(self._simple_graph[i])):
-                if self._simple_graph[i][j] == 0:
-                    path_finding_service = self._path_finding_service(
-                        self._simple_graph,
-                        self._node_position,
-                        i,
-                        j
-                    )
+    def create_complete_graph(self) -> None:
+        distances, predecessors = self._shortest_path_service(
+            self._simple_graph
+        ).compute()
 
-                    a_star_result = path_finding_service.find_path()
+        # An infinite distance means that the graph has isolated
+        # subgraphs, so no complete graph can be derived from it
+        if np.isinf(distances).any():
+            self._complete_graph = None
+            return
 
-                    if a_star_result is None:
-                        self._complete_graph = None
-                        return
+        self._complete_graph = distances.tolist()
+        self._shortest_paths = ShortestPaths(predecessors)
 
-                    path, distance = a_star_result
-                    
-                    self._complete_graph[i][j] = distance
-                    self._complete_graph[j][i] = distance
-
-                    self._shortest_way_matrix[i][j] = path
-                    self._shortest_way_matrix[j][i] = path.reverse()
-
-                elif i != j: 
-
-                    self._complete_graph[i][j] = self._simple_graph[i][j]
-                    self._complete_graph[j][i] = self._simple_graph[i][j]
+    def get_shortest_way(self, node1: int, node2: int) -> list[int]:
+        """
+        Rebuilds the shortest way between two nodes by walking back the
+        predecessor matrix.
 
-                    self._shortest_way_matrix[i][j] = [i, j]
-                    self._shortest_way_matrix[j][i] = [j, i]
+        Args:
+            node1 (int): The starting node.
+            node2 (int): The target node.
 
-    def get_shortest_way(self, node1, node2) -> list[int]: 
-        # find the shortest way in the matrix 
-        return self._shortest_way_matrix[node1, node2]
+        Returns:
+            list[int]: The nodes of the shortest way, from node1 to
+                node2 included.
+        """
+        return self._shortest_paths[(node1, node2)]
 
     @property
-    def complete_graph(self) -> list[list[float]]: 
+    def complete_graph(self) -> list[list[float]]:
         """
         Returns the complete graph as an adjacency matrix.
 
@@ -86,4 +77,16 @@ class CompleteGraphService(ICompleteGraphService):
         Returns:
             list[list[float]]: The adjacency matrix of the complete graph.
         """
-        return self._complete_graph
\ No newline at end of file
+        return self._complete_graph
+
+    @property
+    def shortest_paths(self) -> ShortestPaths:
+        """
+        Returns the shortest way between every ordered pair of distinct
+        nodes, backed by the predecessor matrix.
+
+        Returns:
+            ShortestPaths: The shortest paths, accessible by
+                (start, end) pairs.
+        """
+        return self._shortest_paths
@@ -0,0 +1,60 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, spmatrix
+from scipy.sparse.csgraph import dijkstra
+
+from services.IShortestPathService import IShortestPathService
+
+class DijkstraService(IShortestPathService):
+    """
+    This class computes all-pairs shortest paths by running one
+    heap-based Dijkstra search per source over a sparse version of the
+    adjacency matrix.
+
+    Attributes:
+        _graph (csr_matrix): The sparse adjacency matrix of the simple
+            graph, where a zero weight means that there is no edge. It
+            is given either dense or already sparse, as exported by
+            Graph.compute_sparse_matrix.
+    """
+    def __init__(self, simple_graph: Union[list[list[float]], spmatrix]) -> None:
+        if issparse(simple_graph):
+            self._graph = csr_matrix(simple_graph, dtype=float)
+        else:
+            self._graph = csr_matrix(np.asarray(simple_graph, dtype=float))
+
+    def compute(
+        self,
+        sources: Optional[Sequence[int]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the shortest distances and the predecessors from the
+        given sources in a single pass.
+
+        Args:
+            sources (Sequence[int], optional): The source nodes. Every
+                node of the graph is used as a source when omitted.
+
+        Returns:
+            tuple: A tuple containing:
+                - the distance matrix, where unreachable pairs are set
+                  to infinity,
+                - the int32 predecessor matrix, where
+                  predecessors[i][j] is the node preceding j on the
+                  shortest path from i to j (-1 if there is none).
+        """
+        if self._graph.shape[0] == 0:
+            return np.zeros((0, 0)), np.zeros((0, 0), dtype=np.int32)
+
+        distances, predecessors = dijkstra(
+            self._graph,
+            directed=False,
+            indices=sources,
+            return_predecessors=True
+        )
+
+        # scipy marks missing predecessors with a negative sentinel
+        predecessors = np.where(predecessors < 0, -1, predecessors)
+
+        return distances, predecessors.astype(np.int32)
@@ -0,0 +1,276 @@
+from typing import Optional
+
+import numpy as np
+
+from models.ShortestPaths import ShortestPaths
+from services.ICompleteGraphService import ICompleteGraphService
+from services.IShortestPathService import IShortestPathService
+
+# Distances closer than this are considered equal
+TOLERANCE = 1e-6
+
+class DynamicCompleteGraphService(ICompleteGraphService):
+    """
+    Class maintaining the complete graph and the shortest paths of a
+    simple graph while it is being edited.
+
+    Instead of recomputing every pair after each edit, the changes
+    logged by the Graph are replayed and only the pairs whose shortest
+    paths go through a changed edge are repaired:
+        - a shorter or new edge is relaxed against every pair at once,
+        - a longer or removed edge triggers a new search from the
+          sources whose shortest paths used it, found from the
+          predecessor matrix, and from them only.
+
+    Attributes:
+        _simple_graph (np.ndarray): The adjacency matrix of the simple
+            graph, where a zero weight means that there is no edge.
+        _distances (np.ndarray): The shortest distance between every
+            pair of nodes, infinite when there is no path.
+        _predecessors (np.ndarray): The int32 predecessor matrix of the
+            shortest paths, -1 when there is none.
+        _rows (list[Optional[list[float]]]): The rows of the complete
+            graph already converted to lists, None for the rows changed
+            since the last read.
+        _shortest_paths (ShortestPaths): The shortest paths of the
+            current state, a view sharing the predecessor matrix that
+            is rebuilt after each repair, so the views returned before
+            a repair must no longer be used.
+        _shortest_path_service (type[IShortestPathService]): The
+            service used to search again from the affected sources.
+    """
+
+    def __init__(
+        self,
+        simple_graph: list[list[float]],
+        shortest_path_service: type[IShortestPathService],
+        complete_graph: Optional[list[list[float]]] = None,
+        shortest_paths: Optional[ShortestPaths] = None
+    ) -> None:
+        self._simple_graph = np.array(simple_graph, dtype=float).reshape(
+            len(simple_graph), len(simple_graph)
+        )
+        self._shortest_path_service = shortest_path_service
+
+        if complete_graph is not None and shortest_paths is not None:
+            self._distances = np.array(complete_graph, dtype=float)
+            self._rows = list(complete_graph)
+            # The given paths are kept intact, since the graph may still
+            # use them if the repaired ones cannot be used
+            self._predecessors = shortest_paths.predecessors.copy()
+            self._shortest_paths = shortest_paths
+        else:
+            self.create_complete_graph()
+
+    def create_complete_graph(self) -> None:
+        self._distances, self._predecessors = self._shortest_path_service(
+            self._simple_graph
+        ).compute()
+        self._rows = [None] * self.nb_nodes
+        self._shortest_paths = ShortestPaths(self._predecessors)
+
+    @property
+    def nb_nodes(self) -> int:
+        """
+        Returns the number of nodes of the maintained graph.
+        """
+        return len(self._simple_graph)
+
+    @property
+    def complete_graph(self) -> Optional[list[list[float]]]:
+        """
+        Returns the complete graph as an adjacency matrix, or None if
+        the graph has isolated subgraphs.
+        """
+        if np.isinf(self._distances).any():
+            return None
+
+        # Only the changed rows are converted again, and a new outer
+        # list keeps the matrices returned before unchanged
+        for i, row in enumerate(self._rows):
+            if row is None:
+                self._rows[i] = self._distances[i].tolist()
+        return list(self._rows)
+
+    @property
+    def shortest_paths(self) -> ShortestPaths:
+        """
+        Returns the shortest paths of the current state of the graph.
+        """
+        return self._shortest_paths
+
+    def apply_changes(self, changes: list[tuple]) -> None:
+        """
+        Repairs the distances and the shortest paths after a batch of
+        changes logged by the Graph.
+
+        Consecutive edge changes are merged, so that an edge edited
+        several times is only repaired once with its final distance.
+
+        Args:
+            changes (list[tuple]): The changes returned by
+                Graph.pop_changes, in the order they were made.
+        """
+        if not changes:
+            return
+
+        edge_changes: dict[tuple[int, int], float] = {}
+        for change in changes:
+            if change[0] == 'edge':
+                _, node1, node2, distance = change
+                edge_changes[(min(node1, node2), max(node1, node2))] = distance
+                continue
+
+            self._update_edges(edge_changes)
+            edge_changes = {}
+            if change[0] == 'add_node':
+                self._add_node()
+            elif change[0] == 'remove_node':
+                self._remove_node(change[1])
+
+        self._update_edges(edge_changes)
+        # A new view drops the paths cached from the former predecessors
+        self._shortest_paths = ShortestPaths(self._predecessors)
+
+    def _update_edges(self, edge_changes: dict[tuple[int, int], float]) -> None:
+        """
+        Applies new distances to some edges. The edges getting longer
+        are handled together first, then the edges getting shorter.
+
+        Args:
+            edge_changes (dict[tuple[int, int], float]): The new
+                distance of each changed edge, 0 for a removed edge.
+        """
+        increases = {}
+        decreases = {}
+        for (node1, node2), distance in edge_changes.items():
+            previous = self._simple_graph[node1, node2]
+            if distance == previous:
+                continue
+            if previous > 0 and (distance == 0 or distance > previous):
+                increases[(node1, node2)] = distance
+            else:
+                decreases[(node1, node2)] = distance
+
+        if increases:
+            self._increase_edges(increases)
+        for (node1, node2), distance in decreases.items():
+            self._decrease_edge(node1, node2, distance)
+
+    def _increase_edges(self, increases: dict[tuple[int, int], float]) -> None:
+        """
+        Makes some edges longer (or removes them) and searches again
+        from the sources whose shortest paths went through one of them.
+
+        The other sources keep their shortest paths, since none of their
+        paths got longer.
+
+        Args:
+            increases (dict[tuple[int, int], float]): The new distance
+                of each edge getting longer, 0 for a removed edge.
+        """
+        edges = np.array(list(increases), dtype=np.int32).reshape(-1, 2)
+        starts = np.concatenate((edges[:, 0], edges[:, 1]))
+        ends = np.concatenate((edges[:, 1], edges[:, 0]))
+
+        # The shortest paths from a source use an edge if one end
+        # precedes the other one on them, in either direction, so that
+        # the sources are found in one pass over the predecessors
+        affected = (self._predecessors[:, ends] == starts).any(axis=1)
+
+        for (node1, node2), distance in increases.items():
+            self._simple_graph[node1, node2] = distance
+            self._simple_graph[node2, node1] = distance
+
+        sources = np.flatnonzero(affected)
+        if len(sources) == 0:
+            return
+
+        distances, predecessors = self._shortest_path_service(
+            self._simple_graph
+        ).compute(sources)
+        self._distances[sources] = distances
+        self._predecessors[sources] = predecessors
+        for source in sources:
+            self._rows[source] = None
+
+    def _decrease_edge(self, node1: int, node2: int, distance: float) -> None:
+        """
+        Makes an edge shorter (or adds it) and relaxes every pair of
+        nodes through it.
+
+        Args:
+            node1 (int): The first end of the edge.
+            node2 (int): The second end of the edge.
+            distance (float): The new distance of the edge.
+        """
+        self._simple_graph[node1, node2] = distance
+        self._simple_graph[node2, node1] = distance
+
+        for u, v in ((node1, node2), (node2, node1)):
+            through_edge = (
+                self._distances[:, u, None]
+                + distance
+                + self._distances[None, v, :]
+            )
+            # A tolerance keeps the current paths on rounding ties
+            improved = through_edge < self._distances - TOLERANCE
+            if not improved.any():
+                continue
+
+            # On a way i -> u -> v -> j, the node preceding j is u when
+            # j is v, and the one preceding j from v otherwise
+            new_predecessors = self._predecessors[v].copy()
+            new_predecessors[v] = u
+            self._distances[improved] = through_edge[improved]
+            for i in np.flatnonzero(improved.any(axis=1)):
+                self._rows[i] = None
+            self._predecessors[improved] = np.broadcast_to(
+                new_predecessors,
+                self._predecessors.shape
+            )[improved]
+
+    def _add_node(self) -> None:
+        """
+        Adds an isolated node at the end of the matrices.
+        """
+        size = self.nb_nodes + 1
+
+        simple_graph = np.zeros((size, size))
+        simple_graph[:-1, :-1] = self._simple_graph
+        self._simple_graph = simple_graph
+
+        distances = np.full((size, size), np.inf)
+        distances[:-1, :-1] = self._distances
+        distances[-1, -1] = 0.0
+        self._distances = distances
+
+        predecessors = np.full((size, size), -1, dtype=np.int32)
+        predecessors[:-1, :-1] = self._predecessors
+        self._predecessors = predecessors
+
+        self._rows = [None] * size
+
+    def _remove_node(self, node: int) -> None:
+        """
+        Removes a node and its edges, then shifts the indices of the
+        following nodes.
+
+        Args:
+            node (int): The index of the removed node.
+        """
+        neighbours = np.flatnonzero(self._simple_graph[node])
+        self._increase_edges(
+            {(node, int(neighbour)): 0.0 for neighbour in neighbours}
+        )
+
+        # The node is now isolated, so it no longer appears in any
+        # shortest path and can be dropped from the matrices
+        kept = np.arange(self.nb_nodes) != node
+        self._simple_graph = self._simple_graph[np.ix_(kept, kept)]
+        self._distances = self._distances[np.ix_(kept, kept)]
+        predecessors = self._predecessors[np.ix_(kept, kept)]
+        predecessors[predecessors > node] -= 1
+        self._predecessors = predecessors
+
+        self._rows = [None] * self.nb_nodes
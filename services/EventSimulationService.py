@@ -0,0 +1,104 @@
+import heapq
+from typing import Optional
+
+import numpy as np
+
+from constants.Config import AGENT_SPEED
+from models.Graph import Graph
+from services.BaseSimulationService import BaseSimulationService
+from services.algorithms.IAlgorithm import IAlgorithm
+
+class EventSimulationService(BaseSimulationService):
+    """
+    This class simulates the patrol of the agents on a graph without
+    any display, as a discrete-event simulation.
+
+    Since the agents move at a constant speed along known edges, the
+    time at which each agent reaches its next node is known as soon as
+    it leaves the previous one. The arrivals are kept in a priority
+    queue and processed in chronological order, and nothing happens
+    between two of them: the idleness of the nodes follows from their
+    last visit. The cost of a simulation depends on the number of
+    visits only, not on its duration.
+
+    Attributes:
+        _arrivals (list[tuple[float, int]]): A heap of the next arrival
+            of each moving agent, as (time, agent) pairs.
+        _departures (np.ndarray): The time at which each agent left the
+            last node it reached.
+    """
+    def __init__(
+        self,
+        graph: Graph,
+        paths: list[list[int]],
+        algorithm: Optional[IAlgorithm] = None,
+        speed: float = AGENT_SPEED
+    ) -> None:
+        super().__init__(graph, paths, algorithm, speed)
+        self._departures = np.zeros(len(self._paths))
+
+        edge_lengths = self._edge_lengths()
+        self._arrivals = [
+            (edge_lengths[agent] / self._speed, agent)
+            for agent in np.flatnonzero(self._moving).tolist()
+        ]
+        heapq.heapify(self._arrivals)
+
+    def _get_progress(self) -> np.ndarray:
+        return np.where(
+            self._moving,
+            (self._time - self._departures) * self._speed,
+            0.0
+        )
+
+    def advance(self, duration: float) -> None:
+        """
+        Processes the arrivals up to the end of a simulated duration.
+
+        Args:
+            duration (float): The simulated duration, in seconds.
+        """
+        end_time = self._time + duration
+
+        while self._arrivals and self._arrivals[0][0] <= end_time:
+            arrival_time, agent = heapq.heappop(self._arrivals)
+            self._time = arrival_time
+            self._arrive(agent, arrival_time)
+
+        self._time = end_time
+        self._update_graph()
+
+    def _arrive(self, agent: int, arrival_time: float) -> None:
+        """
+        Records the arrival of an agent on its next node, and schedules
+        the following one.
+
+        Args:
+            agent (int): The agent reaching a node.
+            arrival_time (float): The time of the arrival.
+        """
+        self._cursors[agent] = (
+            (self._cursors[agent] + 1) % self._path_lengths[agent]
+        )
+        self._departures[agent] = arrival_time
+
+        self._graph.visit_nodes(
+            self._paths[agent, self._cursors[agent]],
+            arrival_time
+        )
+
+        if self.is_runtime:
+            self._update_runtime_path(agent, arrival_time)
+
+        current_node = self._paths[agent, self._cursors[agent]]
+        next_node = self._paths[
+            agent,
+            (self._cursors[agent] + 1) % self._path_lengths[agent]
+        ]
+        edge_length = np.hypot(
+            *(self._positions[next_node] - self._positions[current_node])
+        )
+        heapq.heappush(
+            self._arrivals,
+            (arrival_time + edge_length / self._speed, agent)
+        )
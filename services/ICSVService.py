@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Collection, Optional, Union
 
 from models.GraphData import GraphData
 from models.GraphDataComplements import GraphDataComplements
@@ -24,14 +24,16 @@ class ICSVService(ABC):
     @abstractmethod
     def load_from_num_file(
         self,
-        num_file: int
+        num_file: int,
+        sections: Optional[Collection[str]] = None
     ) -> GraphData:
         pass
 
     @abstractmethod
     def load(
         self,
-        file_path: str
+        file_path: str,
+        sections: Optional[Collection[str]] = None
     ) -> GraphData:
         pass
 
@@ -68,6 +70,7 @@ class ICSVService(ABC):
         algorithm: str,
         test_number: int,
         start_time: int,
-        interval: int = 10
+        interval: float = 10,
+        seed: Optional[int] = None
     ):
         pass
\ No newline at end of file
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from models.ShortestPaths import ShortestPaths
+
 class ICompleteGraphService(ABC):
     """
     This interface owns an abstract method that must be implemented by
@@ -18,4 +20,12 @@ class ICompleteGraphService(ABC):
         """
         Returns the complete graph.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @property
+    @abstractmethod
+    def shortest_paths(self) -> ShortestPaths:
+        """
+        Returns the shortest paths between every pair of nodes.
+        """
+        pass
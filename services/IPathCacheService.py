@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from models.Graph import Graph
+from models.algorithms.IAlgorithmModel import IAlgorithmModel
+
+class IPathCacheService(ABC):
+    """
+    This interface owns the methods that must be implemented by the
+    services keeping the paths found by the algorithms.
+    """
+    @abstractmethod
+    def get(
+        self,
+        model: IAlgorithmModel,
+        nb_agents: int,
+        graph: Graph,
+        seed: Optional[int] = None
+    ) -> Optional[tuple[list[list[int]], int]]:
+        """
+        Returns the paths found by an algorithm with its current
+        parameters and a seed, or with any seed if none is given, and
+        the seed they were found with.
+        """
+        pass
+
+    @abstractmethod
+    def put(
+        self,
+        model: IAlgorithmModel,
+        nb_agents: int,
+        graph: Graph,
+        seed: int,
+        paths: list[list[int]]
+    ) -> None:
+        """
+        Stores the paths found by an algorithm.
+        """
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 class IPathFindingService(ABC):
     """
@@ -6,8 +7,12 @@ class IPathFindingService(ABC):
     the related services.
     """
     @abstractmethod
-    def find_path(self):
+    def find_path(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Optional[tuple[list[int], float]]:
         """
         Finds the shortest path between two nodes.
         """
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+import numpy as np
+
+class IShortestPathService(ABC):
+    """
+    This interface owns an abstract method that must be implemented by
+    the services computing shortest paths from many sources at once.
+    """
+    @abstractmethod
+    def compute(
+        self,
+        sources: Optional[Sequence[int]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the shortest distances and the predecessor matrix
+        from the given sources (every node when omitted).
+        """
+        pass
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+class ISimulationService(ABC):
+    """
+    This interface owns the methods that must be implemented by the
+    services simulating the patrol of the agents without display.
+    """
+    @property
+    @abstractmethod
+    def time(self) -> float:
+        """
+        Returns the simulated time, in seconds.
+        """
+        pass
+
+    @abstractmethod
+    def advance(self, duration: float) -> None:
+        """
+        Moves the simulation forward by a simulated duration.
+        """
+        pass
+
+    @abstractmethod
+    def get_idleness(self) -> np.ndarray:
+        """
+        Returns the idleness of each node at the simulated time.
+        """
+        pass
+
+    @abstractmethod
+    def get_idleness_data(self) -> tuple[float, float, float]:
+        """
+        Returns the average, max and all-time max idleness at the
+        simulated time.
+        """
+        pass
+
+    @abstractmethod
+    def run(
+        self,
+        duration: float,
+        interval: float
+    ) -> list[tuple[float, float, float, float]]:
+        """
+        Runs the simulation and samples the idleness data at regular
+        intervals.
+        """
+        pass
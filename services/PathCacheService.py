@@ -0,0 +1,204 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+from constants.Config import PATH_CACHE_MAX_SIZE, PATH_CACHE_VERSION
+from models.Graph import Graph
+from models.algorithms.IAlgorithmModel import IAlgorithmModel
+from services.IPathCacheService import IPathCacheService
+
+def get_path_cache_folder(graph_folder: str) -> str:
+    """
+    Returns the folder of the paths cached for the graphs of a folder,
+    next to their CSV files, so that the GUI and the headless runs share
+    the same cache.
+
+    Args:
+        graph_folder (str): The folder of the CSV files of the graphs.
+    """
+    return os.path.join(graph_folder, "cache")
+
+
+class PathCacheService(IPathCacheService):
+    """
+    This class keeps the paths found by the algorithms in files, so that
+    an algorithm is not launched again on the same graph with the same
+    parameters, number of agents and seed.
+
+    Each solution is a JSON file named after a hash of the graph, the
+    algorithm, its parameters, the number of agents and the version of
+    the cache, followed by the seed. A file is touched when it is read, and the least recently used
+    files are removed when the cache grows above its maximum size.
+
+    Attributes:
+        _folder_path (str): The folder of the cache files.
+        _max_size (int): The size of the files, in bytes, above which
+            the least recently used ones are removed.
+        _version (int): The version of the cache, so that the paths
+            found by a previous version of the algorithms are not used.
+    """
+    def __init__(
+        self,
+        folder_path: str,
+        max_size: int = PATH_CACHE_MAX_SIZE,
+        version: int = PATH_CACHE_VERSION
+    ) -> None:
+        self._folder_path = str(folder_path)
+        self._max_size = max_size
+        self._version = version
+
+    def get(
+        self,
+        model: IAlgorithmModel,
+        nb_agents: int,
+        graph: Graph,
+        seed: Optional[int] = None
+    ) -> Optional[tuple[list[list[int]], int]]:
+        """
+        Returns the paths found by an algorithm with its current
+        parameters and a seed, or the most recently used ones with any
+        seed if none is given.
+
+        Args:
+            model (IAlgorithmModel): The algorithm and its parameters.
+            nb_agents (int): The number of agents.
+            graph (Graph): The graph with its complete graph.
+            seed (int, optional): The seed of the algorithm.
+
+        Returns:
+            Optional[tuple[list[list[int]], int]]: The paths of the
+                agents and their seed, or None if they are not cached.
+        """
+        key = self._get_key(model, nb_agents, graph)
+        if seed is None:
+            file_paths = glob.glob(os.path.join(self._folder_path, f"{key}_*.json"))
+        else:
+            file_paths = [self._get_file_path(key, seed)]
+
+        # Another process may remove a file at any time
+        entries = []
+        for file_path in file_paths:
+            try:
+                entries.append((os.path.getmtime(file_path), file_path))
+            except OSError:
+                pass
+        if not entries:
+            return None
+        _, file_path = max(entries)
+
+        try:
+            with open(file_path) as cache_file:
+                entry = json.load(cache_file)
+            os.utime(file_path)
+        except (OSError, ValueError):
+            return None
+
+        return entry["paths"], entry["seed"]
+
+    def put(
+        self,
+        model: IAlgorithmModel,
+        nb_agents: int,
+        graph: Graph,
+        seed: int,
+        paths: list[list[int]]
+    ) -> None:
+        """
+        Stores the paths found by an algorithm, and removes the least
+        recently used paths if the cache is too big.
+
+        Args:
+            model (IAlgorithmModel): The algorithm and its parameters.
+            nb_agents (int): The number of agents.
+            graph (Graph): The graph with its complete graph.
+            seed (int): The seed of the algorithm.
+            paths (list[list[int]]): The path of each agent.
+        """
+        os.makedirs(self._folder_path, exist_ok=True)
+        entry = {
+            "algorithm": model.name,
+            "seed": int(seed),
+            "paths": [[int(node) for node in path] for path in paths]
+        }
+
+        # The file is written aside then renamed, so that a process never
+        # reads half of it
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp",
+            dir=self._folder_path
+        )
+        with os.fdopen(file_descriptor, "w") as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(
+            temporary_path,
+            self._get_file_path(self._get_key(model, nb_agents, graph), seed)
+        )
+
+        self._evict()
+
+    def _get_key(
+        self,
+        model: IAlgorithmModel,
+        nb_agents: int,
+        graph: Graph
+    ) -> str:
+        """
+        Returns a hash of the graph, the algorithm, its parameters, the
+        number of agents and the version of the cache.
+        """
+        digest = hashlib.sha256()
+
+        # The positions of the nodes are hashed with the complete graph,
+        # as the K-means algorithm groups the nodes by position
+        complete_graph = np.asarray(graph.get_complete_adjacency_matrix(), dtype=float)
+        positions = np.array([(node.x, node.y) for node in graph.nodes], dtype=float)
+        for array in (complete_graph, positions):
+            digest.update(np.asarray(array.shape, dtype=np.int64).tobytes())
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+        parameters = {
+            name: parameter.text_content
+            for name, parameter in model.parameters.items()
+        }
+        digest.update(
+            json.dumps(
+                [self._version, model.name, parameters, nb_agents],
+                sort_keys=True
+            ).encode()
+        )
+        return digest.hexdigest()[:32]
+
+    def _get_file_path(self, key: str, seed: int) -> str:
+        return os.path.join(self._folder_path, f"{key}_{int(seed)}.json")
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used files until the cache fits in
+        its maximum size, keeping at least the most recent one.
+        """
+        entries = []
+        for file_path in glob.glob(os.path.join(self._folder_path, "*.json")):
+            try:
+                entries.append((
+                    os.path.getmtime(file_path),
+                    os.path.getsize(file_path),
+                    file_path
+                ))
+            except OSError:
+                pass
+
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_path in entries[:-1]:
+            if total_size <= self._max_size:
+                break
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+            total_size -= size
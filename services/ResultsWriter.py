@@ -0,0 +1,179 @@
+import csv
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from constants.Config import RESULTS_BUFFER_SIZE, RESULTS_FLUSH_INTERVAL
+
+# The seed is the last column, as it was added after the results files
+# of the first versions were written
+RESULTS_HEADER = [
+    "Algorithm", "Test Number",
+    "Simulation Time (s)", "Average Idleness",
+    "Current Max Idleness", "All-time Max Idleness",
+    "Seed"
+]
+
+
+def prepare_results_file(csv_path: str) -> None:
+    """
+    Makes a results file ready for new rows to be appended: writes the
+    header of a new file, and rewrites a file written with other
+    columns, such as the files without a seed, with the current ones.
+
+    Args:
+        csv_path (str): The results file.
+
+    Raises:
+        ValueError: If the file has a column unknown to the results.
+    """
+    os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+        with open(csv_path, mode="w", newline="") as results:
+            csv.writer(results).writerow(RESULTS_HEADER)
+        return
+
+    with open(csv_path, newline="") as results:
+        header = next(csv.reader(results), [])
+    if header == RESULTS_HEADER:
+        return
+    if not set(header) <= set(RESULTS_HEADER):
+        raise ValueError(f"{csv_path} has unknown results columns {header}")
+
+    # The rows are rewritten aside then renamed, so that the file is
+    # never left half migrated
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        suffix=".tmp",
+        dir=os.path.dirname(csv_path) or "."
+    )
+    with open(csv_path, newline="") as results, \
+            os.fdopen(file_descriptor, mode="w", newline="") as migrated:
+        writer = csv.DictWriter(migrated, fieldnames=RESULTS_HEADER, restval="")
+        writer.writeheader()
+        writer.writerows(csv.DictReader(results))
+    os.replace(temporary_path, csv_path)
+
+
+class ResultsWriter:
+    """
+    This class samples the idleness of a running simulation and appends
+    the samples to a results file, from a single background thread.
+
+    The samples are kept in a buffer and written in batches, when the
+    buffer is full or every RESULTS_FLUSH_INTERVAL seconds, through a
+    file handle kept open while the simulation runs. The remaining
+    samples are written when the writer is stopped.
+
+    Attributes:
+        _csv_path (str): The results file.
+        _idleness_data_provider (Callable): Returns the idleness data as
+            (average, max, all-time max).
+        _simulation_running_provider (Callable): Returns whether the
+            simulation is still running.
+        _elapsed_time_provider (Callable): Returns the simulation time,
+            in seconds.
+        _algorithm (str): The algorithm written in each row.
+        _test_number (int): The test number written in each row.
+        _seed (Optional[int]): The seed written in each row.
+        _interval (float): The time between two samples, in seconds.
+        _buffer (deque): The samples not written yet.
+        _stop_event (threading.Event): Set to stop the thread.
+        _thread (threading.Thread): The thread sampling and writing.
+    """
+    def __init__(
+        self,
+        csv_path: str,
+        idleness_data_provider: Callable[[], tuple[float, float, float]],
+        simulation_running_provider: Callable[[], bool],
+        elapsed_time_provider: Callable[[], float],
+        algorithm: str,
+        test_number: int,
+        seed: Optional[int] = None,
+        interval: float = 10,
+        buffer_size: int = RESULTS_BUFFER_SIZE,
+        flush_interval: float = RESULTS_FLUSH_INTERVAL
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("The sampling interval must be positive")
+
+        self._csv_path = csv_path
+        self._idleness_data_provider = idleness_data_provider
+        self._simulation_running_provider = simulation_running_provider
+        self._elapsed_time_provider = elapsed_time_provider
+        self._algorithm = algorithm
+        self._test_number = test_number
+        self._seed = seed
+        self._interval = interval
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+
+        self._buffer = deque(maxlen=buffer_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Opens the results file, with its header if it is new, and starts
+        sampling in the background.
+
+        Raises:
+            ValueError: If the file has a column unknown to the results.
+        """
+        prepare_results_file(self._csv_path)
+        self._file = open(self._csv_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops sampling, and waits for the remaining samples to be
+        written and the file to be closed.
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            # The samples are planned from the start, so that the time
+            # spent writing does not shift the following ones
+            start = time.monotonic()
+            next_sample = start + self._interval
+            next_flush = start + self._flush_interval
+            while not self._stop_event.wait(max(0.0, next_sample - time.monotonic())):
+                if not self._simulation_running_provider():
+                    break
+
+                average, max_idleness, all_time_max = self._idleness_data_provider()
+                self._buffer.append([
+                    self._algorithm, self._test_number,
+                    round(self._elapsed_time_provider(), 2),
+                    average, max_idleness, all_time_max,
+                    self._seed
+                ])
+                next_sample += self._interval
+
+                now = time.monotonic()
+                if len(self._buffer) >= self._buffer_size or now >= next_flush:
+                    self._flush()
+                    next_flush = now + self._flush_interval
+        finally:
+            self._flush()
+            self._file.close()
+
+    def _flush(self) -> None:
+        """
+        Writes the buffered samples to the results file.
+        """
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
@@ -0,0 +1,97 @@
+from typing import Optional
+
+import numpy as np
+
+from constants.Config import AGENT_SPEED
+from models.Graph import Graph
+from services.BaseSimulationService import BaseSimulationService
+from services.algorithms.IAlgorithm import IAlgorithm
+
+class SimulationService(BaseSimulationService):
+    """
+    This class simulates the patrol of the agents on a graph with a
+    fixed simulated time step, headless or advanced frame by frame by
+    the GUI.
+
+    The agents move along their paths at a constant speed. The time at
+    which an agent reaches a node is computed exactly inside a step,
+    so the step only sets how often the simulation is updated, and it
+    can be much longer than a frame of the GUI.
+
+    Attributes:
+        _time_step (float): The simulated duration of a step, in
+            seconds.
+        _progress (np.ndarray): The distance travelled by each agent
+            since the last node it reached.
+    """
+    def __init__(
+        self,
+        graph: Graph,
+        paths: list[list[int]],
+        algorithm: Optional[IAlgorithm] = None,
+        speed: float = AGENT_SPEED,
+        time_step: float = 1.0
+    ) -> None:
+        super().__init__(graph, paths, algorithm, speed)
+        self._time_step = time_step
+        self._progress = np.zeros(len(self._paths))
+
+    def _get_progress(self) -> np.ndarray:
+        return self._progress
+
+    def advance(self, duration: float) -> None:
+        """
+        Moves the simulation forward by a simulated duration, step by
+        step.
+
+        Args:
+            duration (float): The simulated duration, in seconds.
+        """
+        end_time = self._time + duration
+        while self._time < end_time:
+            self._step(min(self._time_step, end_time - self._time))
+        self._time = max(self._time, end_time)
+        self._update_graph()
+
+    def _step(self, duration: float) -> None:
+        """
+        Moves every agent along its path during one step. An agent can
+        reach several nodes during the same step.
+
+        Args:
+            duration (float): The simulated duration of the step.
+        """
+        remaining = np.where(self._moving, self._speed * duration, 0.0)
+        agents = np.arange(len(self._paths))
+
+        while True:
+            to_go = self._edge_lengths() - self._progress
+            arriving = self._moving & (remaining >= to_go)
+            if not arriving.any():
+                break
+
+            arriving_agents = agents[arriving]
+            remaining[arriving_agents] -= to_go[arriving_agents]
+            arrival_times = (
+                self._time + duration - remaining[arriving_agents] / self._speed
+            )
+
+            self._cursors[arriving_agents] = (
+                (self._cursors[arriving_agents] + 1)
+                % self._path_lengths[arriving_agents]
+            )
+            self._progress[arriving_agents] = 0.0
+
+            self._graph.visit_nodes(
+                self._paths[arriving_agents, self._cursors[arriving_agents]],
+                arrival_times
+            )
+            if self.is_runtime:
+                for agent, arrival_time in zip(
+                    arriving_agents.tolist(),
+                    arrival_times.tolist()
+                ):
+                    self._update_runtime_path(agent, arrival_time)
+
+        self._progress += remaining
+        self._time += duration
@@ -0,0 +1,65 @@
+import os
+
+class TestNumberService:
+    """
+    Service numbering the tests of each algorithm on each graph, shared
+    by the GUI and the batch runner so that two runs never get the same
+    number.
+
+    The numbers are recorded in a CSV file of (key, test number) lines,
+    a new line being appended for each test, the last line of a key
+    giving its current number. The file is read again for each test, as
+    the GUI and a batch may number tests at the same time.
+
+    Attributes:
+        _file_path (str): The path of the test numbers file.
+    """
+    def __init__(self, file_path: str) -> None:
+        self._file_path = str(file_path)
+
+    def get_next_test_number(
+        self,
+        algorithm: str,
+        graph_name: str,
+        minimum: int = 0
+    ) -> int:
+        """
+        Records and returns the next test number of an algorithm on a
+        graph.
+
+        Args:
+            algorithm (str): The name of the algorithm.
+            graph_name (str): The name of the graph, such as "graph_1".
+            minimum (int): A number the next one must be above, such as
+                the highest one of results written before the numbers
+                were recorded.
+
+        Returns:
+            int: The next test number for the algorithm and graph.
+        """
+        key = f"{algorithm}_{graph_name}"
+        next_test_number = max(self._read_test_numbers().get(key, 0), minimum) + 1
+
+        with open(self._file_path, "a") as f:
+            f.write(f"{key},{next_test_number}\n")
+
+        return next_test_number
+
+    def _read_test_numbers(self) -> dict[str, int]:
+        """
+        Reads the current test number of each key, creating the file if
+        it does not exist.
+        """
+        if not os.path.exists(self._file_path):
+            os.makedirs(os.path.dirname(self._file_path) or ".", exist_ok=True)
+            with open(self._file_path, "w") as f:
+                f.write("Algorithm,TestNumber\n")
+
+        test_numbers = {}
+        with open(self._file_path, "r") as f:
+            for line in f:
+                if line.strip() and not line.startswith("Algorithm"):
+                    # The name of an algorithm may not contain a comma
+                    key, test_number = line.strip().rsplit(",", 1)
+                    test_numbers[key] = int(test_number)
+        return test_numbers
@@ -10,6 +10,10 @@ Usage example:
 To use this module, instantiate the AntColony class with the desired parameters, and call the `launch` method with a cost matrix and starting node.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional, Union
+
 from matplotlib import pyplot as plt
 import numpy as np
 import time as time
@@ -33,6 +37,8 @@ class AntColonyAlgorithm(IAlgorithm):
         nb_colony (int): The number of colonies.
         nb_iterations (int): The number of iterations to run the algorithm.
         cost_matrix (np.ndarray): The matrix representing the cost between nodes.
+        nb_workers (int): The number of worker processes building the colonies, 1 to build them
+            in the current process.
     Methods:
         __init__(self, parameters: dict[str, TextBox], nb_agents: int, cost_matrix) -> None:
             Initializes the AntColonyAlgorithm with the given parameters.
@@ -40,12 +46,12 @@ class AntColonyAlgorithm(IAlgorithm):
             Calculates the total length of paths taken by all ants.
         get_pheromone_matrix(self, pheromone_matrix, globl_ants_path):
             Returns the new pheromone matrix after the passage of each ant.
-        get_probability(self, pheromone_matrix, current_node, visited):
-            Returns a probability vector representing the probability that an ant at the current node 
-        roulette_wheel(self, pheromone_matrix, current_node, visited):
-            Returns the next node for an ant based on the roulette wheel selection method.
+        get_attractiveness_matrix(self, pheromone_matrix):
+            Returns the probability numerator of every move of an ant.
         get_start_nodes(self):
             Returns the starting nodes for each ant.
+        build_colonies_path(self, global_pheromone_matrix, colony_start_nodes):
+            Builds a path for each ant of every colony at once.
         colony_path(self, nb_nodes, global_pheromone_matrix, first_nodes):
             Builds a path for each ant in the colony.
         launch(self):
@@ -63,7 +69,9 @@ class AntColonyAlgorithm(IAlgorithm):
         parameters: dict[str, TextBox],
         nb_agents: int,
         graph: Graph,
-        active_plot : bool = False
+        active_plot : bool = False,
+        nb_workers: int = 1,
+        seed: Optional[Union[int, np.random.Generator]] = None
     ) -> None:
         # Get parameters
         alpha_parameter: float =  float(parameters["Alpha"].text_content)
@@ -88,6 +96,8 @@ class AntColonyAlgorithm(IAlgorithm):
             raise Error("The number of iterations must be greater than 0.")
         if pheromone_quantity <= 0:
             raise Error("The pheromone quantity must be greater than 0.")
+        if nb_workers <= 0:
+            raise Error("The number of workers must be greater than 0.")
 
         if nb_agents > len(graph.nodes):
             raise Error(f"The number of agents ({nb_agents}) cannot exceed the number of nodes ({len(graph.nodes)}).")
@@ -100,12 +110,32 @@ class AntColonyAlgorithm(IAlgorithm):
         self.nb_ants : int = nb_agents
         self.nb_colony : int = nb_colony
         self.nb_iterations : int = nb_iterations
+        self.nb_workers : int = nb_workers
         
         # Standardizing the cost matrix
         cost_matrix = np.array(graph.get_complete_adjacency_matrix())
         min_cost = np.min(cost_matrix[np.nonzero(cost_matrix)])
         cost_matrix = cost_matrix / min_cost
         self.cost_matrix : np.ndarray  = cost_matrix
+
+        # Visibility component of the probabilities, (1 / cost) ** beta,
+        # which does not change during the algorithm
+        with np.errstate(divide='ignore'):
+            self._visibility_matrix : np.ndarray = np.where(
+                cost_matrix != 0,
+                (1 / cost_matrix) ** beta_parameter,
+                0
+            )
+
+        # The starting nodes are drawn from a single generator. At each
+        # iteration, each colony gets its own generator spawned from the same
+        # seed, in the current process or in a worker, so that a run does not
+        # depend on the number of workers. A generator given as seed only
+        # gives the seed the colonies' ones are spawned from
+        if isinstance(seed, np.random.Generator):
+            seed = int(seed.integers(2**63))
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_sequence)
         self.active_plot = active_plot
         
         self._list_nodes = np.zeros((len(graph.nodes), 2)) 
@@ -114,6 +144,14 @@ class AntColonyAlgorithm(IAlgorithm):
         
         self.best_ever_colony_length = float('inf')
         self.graph = graph
+        self._shortest_paths = graph.get_shortest_paths()
+
+    def __getstate__(self) -> dict:
+        # The graph is not needed to build the colonies (and its nodes
+        # do not need to be copied in every worker process)
+        state = self.__dict__.copy()
+        state["graph"] = None
+        return state
 
     def get_length_path(self, ants_path: list[int]) -> float:
         """
@@ -130,20 +168,15 @@ class AntColonyAlgorithm(IAlgorithm):
             float: The sum of the distances traveled by all ants.
         """
         
-        # Initialize the distance matrix
-        distance = np.zeros(len(ants_path))
+        # For each ant, add the distance from each node to the next one,
+        # the last node being connected to the first one (it is a loop)
+        distance = 0.0
+        for ant_path in ants_path:
+            nodes = np.asarray(ant_path, dtype=np.intp)
+            distance += self.cost_matrix[nodes, np.roll(nodes, -1)].sum()
 
-        # For each ant
-        for k_ant, ant_path in enumerate(ants_path):
-            # For each node, add distance from the node to next node to 
-            # the total distance that the ant travel
-            for k_node, node in enumerate(ant_path):
-                # We considerate that it is a loop, so the last node is connected to the first one
-                next_node = ant_path[k_node + 1] if k_node != (len(ant_path) - 1) else ant_path[0]
-                distance[k_ant] += self.cost_matrix[node][next_node]
-        
         # Return the distance
-        return np.sum(distance)
+        return distance
 
     def get_pheromone_matrix(
             self,
@@ -214,103 +247,34 @@ class AntColonyAlgorithm(IAlgorithm):
         # When = 1 the old pheromone_matrix is completly evaporated
         return pheromone_matrix
 
-    def get_probability(
-            self,
-            pheromone_matrix: np.ndarray,
-            current_node : int,
-            visited : list[int]
-        ) -> np.ndarray:
+    def get_attractiveness_matrix(self, pheromone_matrix: np.ndarray) -> np.ndarray:
         """
-        Generates a probability vector for the next node selection.
+        Computes the attractiveness of every move of an ant, which is the
+        numerator of the probability to go from a node to another one:
+        (pheromone level ** alpha) * ((1 / cost) ** beta).
 
-        This method calculates the probability that an ant at the current node will move 
-        to each possible next node, while ignoring already visited nodes. The probability 
-        is influenced by the pheromone levels and the inverse of the path costs.
+        The visibility part only depends on the cost matrix, so it is
+        computed once in the constructor, and this method is called once
+        per iteration.
 
         Args:
             pheromone_matrix (np.ndarray): The matrix representing pheromone levels between nodes.
-            current_node (int): The current node where the ant is located.
-            visited (list[int]): A list of nodes that the ant has already visited.
 
         Returns:
-            np.ndarray: A probability vector where each element represents the 
-            probability of moving to the corresponding node.
+            np.ndarray: The attractiveness of each move, 0 on the diagonal (no loop).
         """
-        
-        # Take only the line corresponding to the current_node for the pheromonal component
-        pheromone_component = (pheromone_matrix[current_node]) ** self.alpha_parameter
+        pheromone_component = pheromone_matrix ** self.alpha_parameter
 
         # Addition of an epsilon to avoid zeros in the pheromone matrix
         epsilon = 1e-6
         pheromone_component = np.where(pheromone_component == 0, epsilon, pheromone_component)
-        
-        # Diagonal reset (no loop)
-        pheromone_component[current_node] = 0
-        
-        # Reset nodes already visited
-        pheromone_component[np.array(list(visited))] = 0
-
-        # Set the nodes in visited to 0 to exclude them from normalization
-        cost_matrix = self.cost_matrix[current_node].copy()
-        cost_matrix[np.array(list(visited))] = 0
-
-        # Calculation of the inverse cost component raised to beta power, only for the current_node line
-        with np.errstate(divide='ignore', invalid='ignore'):
-            reverse_cost_matrix = np.where(cost_matrix != 0, (1 / cost_matrix) ** self.beta_parameter, 0)
-
-        # Calcul du numérateur des probabilités
-        probability_vector = pheromone_component * reverse_cost_matrix
-
-        # Normalisation pour obtenir une probabilité valide
-        total = np.sum(probability_vector)
-        if total > 0:
-            probability_vector /= total
-        else:
-            # Si la somme est nulle, il peut y avoir un problème avec les matrices de phéromones ou de coûts.
-            raise Error("La somme des probabilités est nulle. Vérifiez les matrices de phéromones et de coûts.")
-
-        return probability_vector
 
-    def roulette_wheel(
-            self,
-            pheromone_matrix: np.ndarray,
-            current_node: int,
-            visited: list[int]
-        ) -> int:
-        """
-        Generate a random number and use it to select the next node for the ant based on the probability matrix.
-        
-        Args:
-            pheromone_matrix (np.ndarray): The matrix representing pheromone levels between nodes.
-            current_node (int): The current node where the ant is located.
-            visited (set): A set of nodes that the ant has already visited.
-        
-        Returns:
-            int: The next node that the ant will move to based on the roulette wheel selection.
-        """
-        
-        prob = self.get_probability(pheromone_matrix, current_node, visited)
-        
-        # Calculate the cumulative sum of the probabilities
-        cumulative_sum = np.cumsum(prob)
-        
-        # Generate a random number
-        # Create a default random number generator
-        rng = np.random.default_rng()
+        attractiveness_matrix = pheromone_component * self._visibility_matrix
 
-        # Generate a random number between 0 and 1
-        random_number = rng.random()
-        
-        # Find the next node based on the random number
-        # [0] because np.nonzero is a tuple, [0] allows direct retrieval of the array of indices
-        next_node_indices = np.nonzero(cumulative_sum >= random_number)[0]
-        if len(next_node_indices) == 0:
-            raise IndexError("No valid next node found, check the probability matrix.")
-        # Return the first value of next_node_indices bacause it 
-        # is the next_node chosen based of the random_number and cumulative_sum
-        next_node = next_node_indices[0]
+        # Diagonal reset (no loop)
+        np.fill_diagonal(attractiveness_matrix, 0)
 
-        return next_node
+        return attractiveness_matrix
 
     def get_start_nodes(self) -> list[int]:
         """
@@ -323,49 +287,138 @@ class AntColonyAlgorithm(IAlgorithm):
         Returns:
             list: A list of starting node indices for the ants.
         """
-        nb_nodes : int= self.cost_matrix.shape[0]
-        start_nodes : list= []
-
         # Select the first node based on the maximum sum of distances to all other nodes
-        first_node = np.argmax(np.sum(self.cost_matrix, axis=1))
-        start_nodes.append(first_node)
+        first_node = int(np.argmax(np.sum(self.cost_matrix, axis=1)))
+        start_nodes : list[int] = [first_node]
+
+        # Minimum distance from each node to the selected nodes, kept up
+        # to date as nodes are selected (0 for the selected nodes)
+        min_distances = self.cost_matrix[first_node].copy()
+        min_distances[first_node] = 0
 
         # Select subsequent nodes
         for _ in range(self.nb_ants - 1):
-            min_distances = []
-
-            # Calculate the minimum distance from each unselected node to the selected nodes
-            for node in range(nb_nodes):
-                if node in start_nodes:
-                    min_distances.append(0)
-                else:
-                    # Compute the minimum distance between this node and all selected nodes
-                    min_distance = min([self.cost_matrix[start_node][node] for start_node in start_nodes])
-                    min_distances.append(min_distance)
-
-            # Convert minimum distances to a numpy array
-            distances = np.array(min_distances)
-
             # Normalize probabilities using a transformation of distances
-            top_distances = distances ** 8 #power 8
+            top_distances = min_distances ** 8 #power 8
             probabilities = top_distances / top_distances.sum()
 
             # Select the next node based on probabilities
-            next_node = np.random.choice(np.arange(nb_nodes), p=probabilities)
+            next_node = int(self._rng.choice(len(min_distances), p=probabilities))
 
             # Add the selected node to the list of starting nodes
             start_nodes.append(next_node)
+            min_distances = np.minimum(min_distances, self.cost_matrix[next_node])
+            min_distances[next_node] = 0
 
         # Return the list of starting nodes
         return start_nodes
 
+    def build_colonies_path(
+            self,
+            global_pheromone_matrix: np.ndarray,
+            colony_start_nodes: list[list[int]],
+            colony_rngs: Optional[list[np.random.Generator]] = None
+        ) -> list[list[list[int]]]:
+        """
+        Simulates the path construction for every colony of an iteration at once.
+
+        The colonies are independent, so they are advanced together: at each step,
+        the current ant of every unfinished colony chooses its next node with the
+        roulette wheel, from a single random draw per colony. Inside a colony, the
+        ant moving next is the one with the shortest tour so far, so the tour
+        lengths are kept up to date as the ants move instead of being recomputed.
+
+        Args:
+            global_pheromone_matrix (np.ndarray): The matrix representing the pheromone levels between nodes.
+            colony_start_nodes (list of list of int): The initial nodes where each ant of each colony starts.
+            colony_rngs (list of np.random.Generator, optional): One generator per colony, so that
+                the paths of a colony do not depend on the colonies built along with it. The
+                generator of the algorithm is used for every colony when omitted.
+        Returns:
+            list of list of list of int: For each colony, the paths taken by each ant.
+        """
+        nb_nodes = self.cost_matrix.shape[0]
+        attractiveness_matrix = self.get_attractiveness_matrix(global_pheromone_matrix)
+        shortest_paths = self._shortest_paths
+
+        start_nodes = np.array(colony_start_nodes, dtype=np.intp)
+        nb_colony = len(start_nodes)
+        colonies = np.arange(nb_colony)
+
+        # Each ant builds a path from its starting node
+        global_ants_path : list[list[list[int]]] = [
+            [[int(node)] for node in first_nodes] for first_nodes in start_nodes
+        ]
+
+        # Tabou list of each colony, as a mask of the visited nodes
+        visited = np.zeros((nb_colony, nb_nodes), dtype=bool)
+        visited[colonies[:, None], start_nodes] = True
+        nb_visited = visited.sum(axis=1)
+
+        # Last node and length of the open path of each ant
+        last_nodes = start_nodes.copy()
+        open_lengths = np.zeros(start_nodes.shape)
+
+        current_ants = np.zeros(nb_colony, dtype=np.intp)
+        active = nb_visited < nb_nodes
+
+        # Reapet until every tabou list is full IE : All nodes are visited
+        while active.any():
+            active_colonies = colonies[active]
+            current_nodes = last_nodes[active_colonies, current_ants[active_colonies]]
+
+            # Roulette wheel over the nodes not visited yet by the colony
+            weights = attractiveness_matrix[current_nodes] * ~visited[active_colonies]
+            cumulative_sum = np.cumsum(weights, axis=1)
+            totals = cumulative_sum[:, -1]
+            if (totals <= 0).any():
+                raise Error("The sum of probabilities is zero. Check the pheromone and cost matrices.")
+            if colony_rngs is None:
+                random_numbers = self._rng.random(len(active_colonies))
+            else:
+                random_numbers = np.array(
+                    [colony_rngs[colony].random() for colony in active_colonies]
+                )
+            random_numbers *= totals
+            # The next node is the first one whose cumulative sum exceeds the random number
+            next_nodes = np.sum(cumulative_sum <= random_numbers[:, None], axis=1)
+
+            for colony, current_node, next_node in zip(
+                active_colonies.tolist(),
+                current_nodes.tolist(),
+                next_nodes.tolist()
+            ):
+                ant = current_ants[colony]
+                ant_path = global_ants_path[colony][ant]
+                for node in shortest_paths[(current_node, next_node)][1:]:
+                    if not visited[colony, node]:
+                        open_lengths[colony, ant] += self.cost_matrix[ant_path[-1], node]
+                        ant_path.append(node)
+                        visited[colony, node] = True
+                        nb_visited[colony] += 1
+                last_nodes[colony, ant] = ant_path[-1]
+
+            # If list taboo complete then no more movement possible
+            active = nb_visited < nb_nodes
+            moving_colonies = colonies[active]
+
+            # Choose next ant by getting the one with the shortest path,
+            # the paths being considered as loops
+            tour_lengths = (
+                open_lengths[moving_colonies]
+                + self.cost_matrix[last_nodes[moving_colonies], start_nodes[moving_colonies]]
+            )
+            current_ants[moving_colonies] = np.argmin(tour_lengths, axis=1)
+
+        # Return the paths of every colony
+        return global_ants_path
 
     def colony_path(
             self,
             nb_nodes: int,
             global_pheromone_matrix: np.ndarray,
             first_nodes: list[int]
-        ) -> tuple[list[list[int]], list[np.ndarray]]:
+        ) -> list[list[int]]:
         """
         Simulates the path construction for a colony of ants in the Ant Colony Optimization algorithm.
         
@@ -376,68 +429,15 @@ class AntColonyAlgorithm(IAlgorithm):
         Returns:
             list of list of int: A list containing the paths taken by each ant.
         """
-
-        # Each ant builds a path
-        ants_path : list[list[int]]= [[] for _ in range(self.nb_ants)]
-
-        # Heuristique to find first node
-        current_nodes : list[int] = first_nodes.copy()
-
-        # Initialize tabou list
-        tabou_list : list[int] = current_nodes.copy()
-
-        for ant_index in range(self.nb_ants):
-            ants_path[ant_index].append(current_nodes[ant_index])
-
-        ant : int = 0
-
-        # Reapet until list tabou is full IE : All nodes are visited
-        while (len(tabou_list) < nb_nodes):
-            # Move each ant one at a time to the next node
-            # Choose a random starting node for each ant
-            current_node : int = current_nodes[ant]
-            
-            # Choose the next node based on the roulette wheel
-            next_node : int = self.roulette_wheel(global_pheromone_matrix, current_node, tabou_list)
-
-            path : list[int] = self.graph.get_shortest_paths()[(current_node, next_node)]
-
-            for node in path:
-                if node not in tabou_list:
-                    ants_path[ant].append(node)
-                    tabou_list.append(node)
-
-            current_nodes[ant] = next_node
-
-            # If list taboo complete then no more movement possible
-            if (len(tabou_list) == nb_nodes):
-                break
-
-            # Choose next ant by getting the one with the shortest path :
-            # Find the ant with the shortest path
-            shortest_path_length : float = float('inf')
-            shortest_path_ant = None
-            for i, path in enumerate(ants_path):
-                if len(path) == 0:
-                    continue
-                path_length = self.get_length_path([path])
-                if path_length < shortest_path_length:
-                    shortest_path_length = path_length
-                    shortest_path_ant = i
-
-            # If no valid ant found, break the loop
-            if shortest_path_ant is None:
-                break
-            else:
-                # Set the current ant to the one with the shortest path
-                ant = shortest_path_ant
-        
-        # Return the path for this colony
-        return ants_path
+        return self.build_colonies_path(global_pheromone_matrix, [first_nodes])[0]
     
     def launch(self) -> list[list[int]]:
         """
         Launch the ant colony algorithm and return the final best path and path length history.
+
+        The colonies are built in the current process, or farmed out to a pool of
+        nb_workers processes. In the latter case, the pheromone matrix is shared with
+        the workers through shared memory instead of being sent at each iteration.
         
         Args:
         - self.cost_matrix: matrix of costs between nodes.
@@ -447,6 +447,85 @@ class AntColonyAlgorithm(IAlgorithm):
         - path_length_history: a list of lists where each inner list 
             contains the total path length for each colony in each iteration.
         """
+        if self.nb_workers <= 1:
+            return self._optimize(self.evaluate_colonies)
+
+        nb_nodes = self.cost_matrix.shape[0]
+        shared_memory = SharedMemory(create=True, size=self.cost_matrix.nbytes)
+        shared_pheromone_matrix = np.ndarray(
+            (nb_nodes, nb_nodes),
+            dtype=float,
+            buffer=shared_memory.buf
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.nb_workers,
+                initializer=_initialize_worker,
+                initargs=(self, shared_memory.name, (nb_nodes, nb_nodes))
+            ) as executor:
+
+                def evaluate_colonies(pheromone_matrix, colony_start_nodes, seeds):
+                    shared_pheromone_matrix[:] = pheromone_matrix
+                    # Each worker builds a share of the colonies in batch
+                    shares = [
+                        share.tolist()
+                        for share in np.array_split(np.arange(len(colony_start_nodes)), self.nb_workers)
+                        if len(share) > 0
+                    ]
+                    colonies_path = executor.map(
+                        _evaluate_colonies,
+                        [[colony_start_nodes[colony] for colony in share] for share in shares],
+                        [[seeds[colony] for colony in share] for share in shares]
+                    )
+                    return [ants_path for share_path in colonies_path for ants_path in share_path]
+
+                return self._optimize(evaluate_colonies)
+        finally:
+            # The view must be released before closing the shared memory
+            del shared_pheromone_matrix
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def evaluate_colonies(
+            self,
+            global_pheromone_matrix: np.ndarray,
+            colony_start_nodes: list[list[int]],
+            seeds: list[np.random.SeedSequence]
+        ) -> list[list[list[int]]]:
+        """
+        Builds the paths of every colony in the current process, then negotiates them.
+
+        Args:
+            global_pheromone_matrix (np.ndarray): The matrix representing the pheromone levels between nodes.
+            colony_start_nodes (list of list of int): The initial nodes where each ant of each colony starts.
+            seeds (list of np.random.SeedSequence): The seed of each colony for this iteration.
+        Returns:
+            list of list of list of int: For each colony, the paths taken by each ant.
+        """
+        colonies_path = self.build_colonies_path(
+            global_pheromone_matrix,
+            colony_start_nodes,
+            [np.random.default_rng(seed) for seed in seeds]
+        )
+        return [self.negotiation(ants_path) for ants_path in colonies_path]
+
+    def _optimize(
+            self,
+            evaluate_colonies: Callable[
+                [np.ndarray, list[list[int]], list[np.random.SeedSequence]],
+                list[list[list[int]]]
+            ]
+        ) -> list[list[int]]:
+        """
+        Runs the iterations of the algorithm.
+
+        Args:
+            evaluate_colonies (Callable): Builds and negotiates the paths of every colony
+                from the pheromone matrix, the starting nodes of the colonies and their
+                seeds.
+        Returns:
+            list of list of int: The best path found.
+        """
         # Get the number of nodes
         nb_nodes = self.cost_matrix.shape[0]
 
@@ -470,13 +549,13 @@ class AntColonyAlgorithm(IAlgorithm):
             best_colony_index = None
             best_colony_length = float('inf')
 
+            # Every colony builds and negotiates its paths
+            # The seeds of the colonies are spawned here, whoever builds them
+            seeds = self._seed_sequence.spawn(self.nb_colony)
+            colonies_path = evaluate_colonies(global_pheromone_matrix, colony_start_nodes, seeds)
+
             # For each colony
-            for colony in range(self.nb_colony):
-                
-                ants_path = self.colony_path(nb_nodes, global_pheromone_matrix, colony_start_nodes[colony])
-                
-                # negotiation
-                ants_path = self.negotiation(ants_path)
+            for colony, ants_path in enumerate(colonies_path):
                 global_ants_path[colony] = ants_path
 
                 path_length = self.get_length_path(global_ants_path[colony])
@@ -652,4 +731,41 @@ class AntColonyAlgorithm(IAlgorithm):
                 best_len_path_num = num
                 best_len_path = len_path
 
-        return global_ants_path[best_len_path_num]
\ No newline at end of file
+        return global_ants_path[best_len_path_num]
+
+
+# State of a worker process building colonies for AntColonyAlgorithm.launch
+_worker_algorithm: Optional[AntColonyAlgorithm] = None
+_worker_shared_memory: Optional[SharedMemory] = None
+_worker_pheromone_matrix: Optional[np.ndarray] = None
+
+def _initialize_worker(
+        algorithm: AntColonyAlgorithm,
+        shared_memory_name: str,
+        shape: tuple[int, int]
+    ) -> None:
+    """
+    Keeps the algorithm and a read-only view on the shared pheromone matrix
+    for the lifetime of a worker process.
+    """
+    global _worker_algorithm, _worker_shared_memory, _worker_pheromone_matrix
+    _worker_algorithm = algorithm
+    _worker_shared_memory = SharedMemory(name=shared_memory_name)
+    _worker_pheromone_matrix = np.ndarray(shape, dtype=float, buffer=_worker_shared_memory.buf)
+    _worker_pheromone_matrix.flags.writeable = False
+
+def _evaluate_colonies(
+        colony_start_nodes: list[list[int]],
+        seeds: list[np.random.SeedSequence]
+    ) -> list[list[list[int]]]:
+    """
+    Builds and negotiates the paths of some colonies in a worker process, each
+    colony drawing its random numbers from its own seed.
+    """
+    colony_rngs = [np.random.default_rng(seed) for seed in seeds]
+    colonies_path = _worker_algorithm.build_colonies_path(
+        _worker_pheromone_matrix,
+        colony_start_nodes,
+        colony_rngs
+    )
+    return [_worker_algorithm.negotiation(ants_path) for ants_path in colonies_path]
@@ -1,5 +1,5 @@
-import random as rd
 import time
+from typing import Optional, Union
 
 from models.Graph import Graph
 from models.TextBox import TextBox
@@ -7,6 +7,14 @@ from services.algorithms.IAlgorithm import IAlgorithm
 
 import numpy as np
 
+# Above this population size, the Pareto fronts are assigned by sorting
+# instead of building the whole dominance matrix
+DOMINANCE_MATRIX_MAX_SIZE = 200
+
+# The mean node occurrence is maximised and the mean distance minimised,
+# so the occurrence is negated to sort the fronts on two minimised objectives
+MINIMISED_FITNESS_SIGNS = np.array([-1.0, 1.0])
+
 
 class EvolutionalAlgorithm(IAlgorithm):
     """
@@ -21,14 +29,16 @@ class EvolutionalAlgorithm(IAlgorithm):
 
         indicative_paths_population : Contains the "short" version of the pat,
          thus ignoring the case when 2 following nodes in the path don't have a direct link.
-
-        real_paths_population : Contains the "real" path by adding the
-        additional nodes between 2 nodes which don't have a direct link
+         It is an int32 array of shape (nb_individuals, nb_agents, path_width), every path
+         of an individual being padded to the same width.
 
         shortest_way_dict : the "shortest_paths" attribute from the Graph Class.
 
         distance_matrix : the "complete_adjacency_matrix" attribute from the Graph Class.
 
+        hop_count_matrix : the number of nodes added after each node of a "real" path,
+         ie the number of edges of the shortest way between two nodes.
+
         nodes_idx_list : Stores a sorted list of all the nodes contained the Graph.
 
         number_of_crossing_points : nb of crossing points used in the Algorithm
@@ -36,6 +46,8 @@ class EvolutionalAlgorithm(IAlgorithm):
         crossing_rate :  the crossing rate used in the Algorithm
 
         mutation_rate : the mutating rate used in the Algorithm
+
+        _rng : the generator of every random draw of the Algorithm
     """
 
     # The "# NOSONAR" comments you'll see next to the random number generators are used to tell SonarCloud
@@ -45,75 +57,44 @@ class EvolutionalAlgorithm(IAlgorithm):
             self, 
             parameters : dict[str, TextBox], 
             nb_agents: int ,
-            graph_object: Graph
+            graph_object: Graph,
+            seed: Optional[Union[int, np.random.Generator]] = None
         ) -> None :
 
         self.nb_generations : int = int(parameters["Number of iterations"].text_content)
         self.nb_agents = nb_agents
         self.nb_individuals_in_pop : int = int(parameters["Number of individuals"].text_content)
-        self.indicative_paths_population = []
-        self.real_paths_population = []
+        self.indicative_paths_population = np.empty((0, nb_agents, 0), dtype=np.int32)
         self.shortest_way_dict = graph_object.get_shortest_paths()
-        self.distance_matrix = graph_object.get_complete_adjacency_matrix()
+        self.distance_matrix = np.array(graph_object.get_complete_adjacency_matrix(), dtype=float)
+        self.hop_count_matrix = self.hop_counts_computing()
         self.nodes_idx_list = np.arange(0, len(graph_object.get_complete_adjacency_matrix()))
         self.number_of_crossing_points = 2
         self.crossing_rate = 0.8
         self.mutation_rate = 0.5
+        self._rng = np.random.default_rng(seed)
 
     def initial_population_generation(self) -> np.ndarray:
         """
         Generates a random initial population for the Algorithm.
-        Also verifies that the generated individual is indeed valid
-        thus helps the algorithm for converging faster
+
+        Each individual shares out the nodes of the Graph between its paths
+        (see split_list), so it covers all nodes and is valid,
+        which helps the algorithm for converging faster.
 
         Returns:
             ndarray: the generated indicative population.
         """
 
-        # maximal number of tries allowed
-        max_tries = 10
+        # splitting the list of nodes of the Graph for each individual
+        # (a gene is a path of an agent)
+        indicative_population = np.array(
+            [self.split_list()[:self.nb_agents] for _ in range(self.nb_individuals_in_pop)],
+            dtype=np.int32
+        )
 
-        indicative_population = []
-
-        # For each individual
-        for _ in range(self.nb_individuals_in_pop):
-            
-            #splitting the list of nodes of the Graph
-            graph_sublists = self.split_list()
-
-            # while the individual is not covering all nodes, we generate him
-            # we generate another one (max 10 tries)
-            nb_tries_individual = 0
-            while (nb_tries_individual < max_tries):
-
-                individual = []
-                # For each gene of the individual (a gene is a path of an agent)
-                for _ ,init_path  in zip(range(self.nb_agents),graph_sublists):
-
-                    # we shuffle the initial_path (the sublist)
-                    rd.shuffle(init_path) #NOSONAR
-
-                    #adding to the individual
-                    individual.append(init_path)
-                    
-                individual = np.array(individual)
-
-                # verifying of the individual covers all nodes at least once
-                if self.are_all_nodes_visited(individual):
-                    # Appending the individual to the population if he's OK
-                    indicative_population.append(individual)
-                    break
-
-                else:
-                    # if it's the last attempt, we add the individual (even if he's not valid )
-                    nb_tries_individual+=1
-                    if nb_tries_individual == max_tries:
-                        indicative_population.append(individual)
-
-        # Transforming into np.array for later use
-        indicative_population = np.array(indicative_population)
-
-        return indicative_population
+        # we shuffle every path of every individual at once
+        return self._rng.permuted(indicative_population, axis=2)
 
     def split_list(self)-> list[list]:
         """
@@ -156,7 +137,7 @@ class EvolutionalAlgorithm(IAlgorithm):
             while len(sub_list) < target_size:
 
                 # we choose a random node to add 
-                random_node = rd.choice(list(self.nodes_idx_list)) #NOSONAR
+                random_node = self._rng.choice(self.nodes_idx_list) #NOSONAR
                 sub_list = np.append(sub_list,random_node)
             
             #updating the sublist with the corrected one
@@ -164,192 +145,144 @@ class EvolutionalAlgorithm(IAlgorithm):
 
         return sublists
 
-    def are_all_nodes_visited(self, individual: np.ndarray) -> bool:
+    def are_all_nodes_visited(self, individual: np.ndarray) -> bool | np.ndarray:
         """
         Checks if an individual covers all the nodes of the Graph at least once
 
         Args:
-            individual: The individual which has to be checked.
+            individual: The individual which has to be checked,
+                or a whole population of individuals.
 
         Returns:
             bool: True -> all the nodes of the Graph are, at least once, visited.
             bool: False -> one or more nodes are not being visited by the individual.
+            For a population, an array of these booleans is returned.
         """
+        individual = np.asarray(individual, dtype=np.int64)
+        nb_nodes = len(self.nodes_idx_list)
 
-        # creating an empty set to store the visited nodes
-        visited_nodes = set()
+        # one row of nodes per individual
+        individuals = individual.reshape(-1, individual.shape[-2] * individual.shape[-1])
 
-        for gene in individual:
-            for node in gene:
-                # we add the visited nodes to the corresponding set
-                visited_nodes.add(node)
+        # counting the visits of each node of each individual at once,
+        # by giving each individual its own range of bins
+        offsets = np.arange(len(individuals))[:, None] * nb_nodes
+        node_counts = np.bincount(
+            (individuals + offsets).ravel(),
+            minlength=len(individuals) * nb_nodes
+        ).reshape(len(individuals), nb_nodes)
 
-        # creating a set of the nodes the individuals have to cover
-        nodes_to_cover = set(self.nodes_idx_list)
+        # the individual is valid if each node is visited at least once
+        all_nodes_visited = np.all(node_counts > 0, axis=1)
 
-        # if the sets are equal, the individual covered all the nodes
-        # thus the individual is valid
-        if nodes_to_cover <= visited_nodes:
-            return True
-        else:
-            return False
+        if individual.ndim == 2:
+            return bool(all_nodes_visited[0])
+        return all_nodes_visited
 
-    def get_real_population_from_indicative_population(self) -> np.ndarray:
+    def hop_counts_computing(self) -> np.ndarray:
         """
-         Gives the "real" paths using the "indicative" ones for the whole population.
+        Computes the number of edges of the shortest way between every pair of nodes,
+        without rebuilding the shortest ways.
 
         Returns:
-            ndarray: Indicative_paths_populations-like matrix
-                    containing the real paths for each indicative path.
+            ndarray: An int32 matrix where hop_counts[i][j] is the number of edges
+                of the shortest way from i to j.
         """
+        predecessors = self.shortest_way_dict.predecessors
+        starts = np.arange(len(predecessors))
 
-        # Create matrix of same shape
-        shape_of_indicative_pop = self.indicative_paths_population.shape
-        real_paths_population = np.empty((shape_of_indicative_pop[0], shape_of_indicative_pop[1]), dtype=object)
+        # each node of a shortest way is farther from the start than the node
+        # preceding it, so visiting the nodes by increasing distance from every
+        # start at once gives the number of edges to a predecessor before its node
+        order = np.argsort(self.distance_matrix, axis=1, kind="stable")
+        hop_counts = np.zeros(predecessors.shape, dtype=np.int32)
+        for ends in order[:, 1:].T:
+            hop_counts[starts, ends] = hop_counts[starts, predecessors[starts, ends]] + 1
 
-        # For each individual
-        for idx_individual, individual in enumerate(self.indicative_paths_population):
-            # For each path
-            for idx_path, path in enumerate(individual):
-                new_real_path = []
+        return hop_counts
 
-                # For each node in the path
-                for i in range(len(path)):
-                    # Retrieve the current node and the next node (wrap around with %)
-                    origin, destination = path[i], path[(i + 1) % len(path)]
-
-                    # Skip if origin and destination are the same
-                    if origin == destination:
-                        continue
-
-                    # Retrieve the shortest path between origin and destination
-                    shortest_path = list(self.shortest_way_dict[(origin, destination)])
-
-                    # Append the nodes from the shortest path to the real path
-                    # skipping the first if already added
-                    if new_real_path and new_real_path[-1] == shortest_path[0]:
-                        new_real_path.extend(shortest_path[1:])
-                    else:
-                        new_real_path.extend(shortest_path)
-
-                # Remove the last node to avoid duplicating
-                # the initial node at the end of the cycle
-                if new_real_path and new_real_path[-1] == new_real_path[0]:
-                    new_real_path.pop()
-
-                # Store the real path
-                real_paths_population[idx_individual][idx_path] = new_real_path
-
-        return real_paths_population
-
-    def path_lengths_computing(self, path: np.ndarray) -> float:
+    def path_lengths_computing(self, path: np.ndarray) -> float | np.ndarray:
         """
         Computes the total length of a path.
 
         Args:
             path: The path for which the total length has to be computed.
+                Any array of paths (along its last axis) is accepted.
 
         Returns:
             float: The total length of a path.
         """
+        path = np.asarray(path)
 
-        # contains the final value of the path
-        eval_distance = 0
-        for i in range(len(path) - 1):
-            # we retrieve the actual node and the following one
-            origin, destination = path[i], path[i + 1]
-            # we add the intermediate distance to the final distance of the path
-            eval_distance += self.distance_matrix[origin][destination]
-
-        return eval_distance
+        # we add the distances between each node and the following one
+        return self.distance_matrix[path[..., :-1], path[..., 1:]].sum(axis=-1)
 
-    def mean_node_occurrence_computing(self, individual: np.ndarray) -> np.ndarray:
+    def mean_node_occurrence_computing(self, individual: np.ndarray) -> float | np.ndarray:
         """
-        Computes the mean occurrence of each node in the individual.
+        Computes the mean occurrence of each node in the "real" paths of the individual.
+
+        The real path of a path goes through the shortest way between each node
+        and the next one (the last node being connected to the first one), so each
+        node adds the number of edges of this shortest way to the real path.
+        The mean of the occurrences being their total over the number of nodes,
+        it is computed without building the real paths.
 
         Args:
-            individual: The individual for which the mean node occurrence has to be computed.
+            individual: The individual for which the mean node occurrence has to be computed,
+                or a whole population of individuals.
 
         Returns:
             float: The mean node occurrence for the individual.
         """
+        individual = np.asarray(individual)
 
-        list_of_occurrences = []
-        flattened_individual = []
-
-        for path in individual:
-            for node in path:
-                # if the current node is the list of the intermediate paths from node A to B
-                if isinstance(node, list):
-                    flattened_individual.extend(node)
-                else:  # if not, we append it
-                    flattened_individual.append(node)
-
-        # for each node of the graph, we compute the occurrence
-        for node in self.nodes_idx_list:
-            # we count its occurrence in the individual
-            occurrences = np.count_nonzero(flattened_individual == node)
-            list_of_occurrences.append(occurrences)
+        # the number of nodes in the real paths of the individual
+        nb_occurrences = self.hop_count_matrix[
+            individual,
+            np.roll(individual, -1, axis=-1)
+        ].sum(axis=(-2, -1))
 
         # then we compute the mean occurrence of the nodes in the individual
-        mean_node_occurrence = np.mean(list_of_occurrences)
+        return nb_occurrences / len(self.nodes_idx_list)
 
-        return mean_node_occurrence
-
-    def mean_path_lengths_computing(self, individual: np.ndarray) -> np.ndarray:
+    def mean_path_lengths_computing(self, individual: np.ndarray) -> float | np.ndarray:
         """
         Computes the mean length of each path in the individual.
 
         Args:
-            individual: The individual for which the mean path length has to be computed.
+            individual: The individual for which the mean path length has to be computed,
+                or a whole population of individuals.
 
         Returns:
             float: the mean path length of the individual.
         """
 
-        path_lengths = []
-        # for each path of the individual
-        for path in individual:
-            # we append the length of the whole path
-            path_lengths.append(self.path_lengths_computing(path))
-
-        # then we compute the mean length of the paths
-        path_length_mean = np.mean(path_lengths)
-        return path_length_mean
+        # we compute the mean length of the paths
+        return self.path_lengths_computing(individual).mean(axis=-1)
 
     def fitness(self) -> list[tuple[float, float]]:
         """
         Awards a fitness to each individual
-        using the mean occurrence and mean path length.
+        using the mean occurrence, to maximise, and the mean path length, to minimise.
 
         Returns:
             A list of tuples (mean_node_occurrence, mean_distance).
         """
-        fitness_lst = []
+        population = self.indicative_paths_population
 
-        for indicative_individual, real_individual in zip(self.indicative_paths_population, self.real_paths_population):
+        # the mean node occurrence is computed from the real paths,
+        # the mean path length on the indicative ones
+        # ( would've given the same value if we used the real paths instead)
+        fitness_array = np.column_stack((
+            self.mean_node_occurrence_computing(population),
+            self.mean_path_lengths_computing(population)
+        ))
 
-            # if the individual is valid
-            if self.are_all_nodes_visited(indicative_individual):
+        # if an individual is not valid, we apply the worst possible fitness to him
+        # in our case, we give it infinite
+        fitness_array[~self.are_all_nodes_visited(population)] = (-float('inf'), float('inf'))
 
-                # we compute it's mean node recurrence using the real paths
-                mean_node_occurrence = self.mean_node_occurrence_computing(real_individual)
-                # and the mean path length using the indicative population
-                # ( would've given the same value if we used the real paths instead)
-                mean_path_length = self.mean_path_lengths_computing(indicative_individual)
-
-                # computing the fitness itself
-                fitness_value = (mean_node_occurrence, mean_path_length)
-
-            # if he's not, we apply the worst possible fitness to him
-            else:
-                # in our case, we give it infinite
-                fitness_value = (-float('inf'), float('inf'))
-
-            # we append the fitness to a list of all the fitness's of the population
-            fitness_lst.append(fitness_value)
-
-        return fitness_lst
+        return [tuple(fitness_value) for fitness_value in fitness_array.tolist()]
 
     def dominates(
             self, 
@@ -367,8 +300,8 @@ class EvolutionalAlgorithm(IAlgorithm):
             bool: True if individual_1 dominates individual_2.
             bool: False if there is no domination.
         """
-        # verifying if the 2nd individual is dominating the 1st
-        if individual_1[0] <= individual_2[0] and individual_1[1] <= individual_2[1]:
+        # verifying if the 1st individual occurs at least as much, with a path at most as long
+        if individual_1[0] >= individual_2[0] and individual_1[1] <= individual_2[1]:
 
             # verifying that the 2 individuals aren't equal (would mean they're equivalent)
             if individual_1 != individual_2:
@@ -381,7 +314,10 @@ class EvolutionalAlgorithm(IAlgorithm):
             # not respecting the domination condition, so no domination
             return False
 
-    def pareto_fronts(self, fitness_list: list[tuple[float, float]]) -> list:
+    def pareto_fronts(
+            self,
+            fitness_list: list[tuple[float, float]]
+        ) -> tuple[list[np.ndarray], np.ndarray]:
         """
         Classifies all the individuals of the population
         into categories from the best to the worst.
@@ -389,61 +325,159 @@ class EvolutionalAlgorithm(IAlgorithm):
         It is using the Pareto Efficiency concept to achieve this.
         https://en.wikipedia.org/wiki/Pareto_front
 
+        Small populations are sorted with a dominance matrix, the bigger ones
+        with a sort-based front assignment running in O(N log N).
+
         Args:
             fitness_list : The list containing th fitness of the population.
 
         Returns:
-            A list of fronts where the first front contains the most balanced individuals
-            1st front : the best individuals.
-            last front: the worst individuals.
+            A tuple containing:
+                - a list of fronts, each one being the sorted array of the indices
+                  of its individuals. The first front contains the most balanced individuals
+                  1st front : the best individuals.
+                  last front: the worst individuals.
+                - the crowding distance of each individual inside its front.
         """
+        fitness_array = self.minimised_fitness(fitness_list)
 
-        # output
-        fronts = []
+        if len(fitness_array) <= DOMINANCE_MATRIX_MAX_SIZE:
+            fronts = self._pareto_fronts_with_dominance_matrix(fitness_array)
+        else:
+            fronts = self._pareto_fronts_with_sorting(fitness_array)
 
-        # index list of all remaining individuals to "categorize"
-        remaining_individual_indices = list(range(len(self.indicative_paths_population)))
+        crowding_distances = np.zeros(len(fitness_array))
+        for front in fronts:
+            crowding_distances[front] = self.crowding_distances(fitness_array[front])
 
-        while remaining_individual_indices:
+        return fronts, crowding_distances
 
-            # storing the current front
-            current_front = []
+    def minimised_fitness(self, fitness_list: list[tuple[float, float]]) -> np.ndarray:
+        """
+        Turns the fitness's into two objectives to minimise,
+        the opposite of the mean node occurrence and the mean distance.
 
-            # for each remaining individual
-            for index_1 in remaining_individual_indices:
-                is_dominated = False
+        Args:
+            fitness_list : The list containing th fitness of the population.
 
-                # verifying if he's dominated by another individual
-                for index_2 in remaining_individual_indices:
+        Returns:
+            The (N, 2) array of the minimised objectives.
+        """
+        fitness_array = np.array(fitness_list, dtype=float).reshape(len(fitness_list), 2)
+        return fitness_array * MINIMISED_FITNESS_SIGNS
 
-                    # if he is dominated, we break out of this loop
-                    if self.dominates(fitness_list[index_2], fitness_list[index_1]):
-                        is_dominated = True
-                        break
+    def _pareto_fronts_with_dominance_matrix(self, fitness_array: np.ndarray) -> list[np.ndarray]:
+        """
+        Peels the Pareto fronts using the dominance matrix of the whole population.
 
-                        # if he is not dominated, he will be part of the actual front
-                if not is_dominated:
-                    current_front.append(index_1)
+        Args:
+            fitness_array: The (N, 2) array of the minimised fitness's of the population.
 
-            # adding the corresponding matrices for the current front
-            current_front_matrices = []
-            for i in current_front:
-                current_front_matrices.append(self.indicative_paths_population[i])
+        Returns:
+            The list of fronts, each one being the sorted array of its indices.
+        """
+        # dominance_matrix[i][j] is True if the individual i dominates the individual j
+        # (see the dominates method)
+        lower_or_equal = np.all(fitness_array[:, None, :] <= fitness_array[None, :, :], axis=2)
+        different = np.any(fitness_array[:, None, :] != fitness_array[None, :, :], axis=2)
+        dominance_matrix = lower_or_equal & different
 
-            # adding the finished front to the fronts list
-            fronts.append(current_front_matrices)
+        # number of individuals dominating each individual
+        nb_dominating = dominance_matrix.sum(axis=0)
+        remaining = np.ones(len(fitness_array), dtype=bool)
 
-            # removing the indices of the actual front in the "remaining indices" list
-            remaining_indices_new = []
-            for i in remaining_individual_indices:
-                if i not in current_front:
-                    remaining_indices_new.append(i)
+        fronts = []
+        while remaining.any():
+            # the individuals that are not dominated anymore form the current front
+            current_front = np.flatnonzero(remaining & (nb_dominating == 0))
+            fronts.append(current_front)
 
-            # updating the list
-            remaining_individual_indices = remaining_indices_new
+            remaining[current_front] = False
+            nb_dominating = nb_dominating - dominance_matrix[current_front].sum(axis=0)
 
         return fronts
 
+    def _pareto_fronts_with_sorting(self, fitness_array: np.ndarray) -> list[np.ndarray]:
+        """
+        Assigns the Pareto fronts by visiting the individuals in lexicographic order
+        of their fitness's, and finding the front of each one by binary search.
+
+        In that order, an individual can only be dominated by the ones visited
+        before him, and the last individual added to a front is the one of the
+        front with the lowest mean distance. So comparing to this last
+        individual is enough to know if a front dominates the current one.
+
+        Args:
+            fitness_array: The (N, 2) array of the minimised fitness's of the population.
+
+        Returns:
+            The list of fronts, each one being the sorted array of its indices.
+        """
+        order = np.lexsort((fitness_array[:, 1], fitness_array[:, 0]))
+
+        # last individual added to each front
+        fronts_last_fitness: list[tuple[float, float]] = []
+        fronts: list[list[int]] = []
+
+        for index in order.tolist():
+            occurrence, distance = fitness_array[index]
+
+            # binary search of the first front not dominating the individual
+            # (if a front dominates him, all the previous ones do too)
+            low, high = 0, len(fronts)
+            while low < high:
+                middle = (low + high) // 2
+                last_occurrence, last_distance = fronts_last_fitness[middle]
+                if (
+                    last_distance < distance
+                    or (last_distance == distance and last_occurrence < occurrence)
+                ):
+                    low = middle + 1
+                else:
+                    high = middle
+
+            if low == len(fronts):
+                fronts.append([])
+                fronts_last_fitness.append((occurrence, distance))
+            fronts[low].append(index)
+            fronts_last_fitness[low] = (occurrence, distance)
+
+        return [np.sort(np.array(front, dtype=int)) for front in fronts]
+
+    def crowding_distances(self, front_fitness: np.ndarray) -> np.ndarray:
+        """
+        Computes the crowding distance of the individuals of a front,
+        which is bigger for the individuals in less crowded areas of the front.
+
+        Args:
+            front_fitness: The (N, 2) array of the fitness's of the front.
+
+        Returns:
+            ndarray: The crowding distance of each individual of the front.
+        """
+        nb_individuals = len(front_fitness)
+        crowding_distances = np.zeros(nb_individuals)
+        if nb_individuals <= 2:
+            crowding_distances[:] = np.inf
+            return crowding_distances
+
+        for objective in front_fitness.T:
+            order = np.argsort(objective, kind="stable")
+            sorted_objective = objective[order]
+
+            # the extreme individuals are always kept
+            crowding_distances[order[[0, -1]]] = np.inf
+
+            with np.errstate(invalid="ignore"):
+                objective_range = sorted_objective[-1] - sorted_objective[0]
+                gaps = (sorted_objective[2:] - sorted_objective[:-2]) / objective_range
+            # an objective with no (or an infinite) range does not separate individuals
+            if not np.isfinite(objective_range) or objective_range == 0:
+                gaps = np.zeros_like(gaps)
+            crowding_distances[order[1:-1]] += np.nan_to_num(gaps, nan=0.0)
+
+        return crowding_distances
+
     def selection_with_pareto(
                         self, 
                         fitness: list[tuple[float, float]], 
@@ -452,6 +486,9 @@ class EvolutionalAlgorithm(IAlgorithm):
         """
         Selects the best individuals until reaching the desired number of parents.
 
+        The front that does not fit entirely is truncated by keeping its
+        individuals with the biggest crowding distance first.
+
         Args:
             fitness : The list containing th fitness of the population.
             nb_parent: The number of desired parents.
@@ -461,24 +498,26 @@ class EvolutionalAlgorithm(IAlgorithm):
                         to be used for crossing and mutating.
         """
 
-        selected_individuals = []
+        selected_indices = []
 
         # getting the pareto fronts
-        fronts = self.pareto_fronts(fitness)
+        fronts, crowding_distances = self.pareto_fronts(fitness)
 
         for front in fronts:
             # checking if we can add the whole front
-            if len(selected_individuals) + len(front) <= nb_parent:
+            if len(selected_indices) + len(front) <= nb_parent:
                 # adding it
-                selected_individuals.extend(front)
+                selected_indices.extend(front.tolist())
             else:
-                # if not, we only add what we need, then we get out of the loop
-                remaining_slots = nb_parent - len(selected_individuals)
-                selected_individuals.extend(front[:remaining_slots])
+                # if not, we only add the least crowded individuals we need,
+                # then we get out of the loop
+                remaining_slots = nb_parent - len(selected_indices)
+                least_crowded = np.argsort(-crowding_distances[front], kind="stable")
+                selected_indices.extend(front[least_crowded[:remaining_slots]].tolist())
                 break
 
-        # casting it to a ndarray for later
-        selected_individuals = np.array(selected_individuals)
+        # gathering the selected individuals for later
+        selected_individuals = self.indicative_paths_population[selected_indices]
 
         return selected_individuals
 
@@ -512,7 +551,7 @@ class EvolutionalAlgorithm(IAlgorithm):
         shuffled_sub_matrices = []
         for sub_matrix in sub_matrices_second_individual:
             #shuffling the lines of the matrices 
-            shuffled_matrix = sub_matrix[np.random.permutation(sub_matrix.shape[0]), :] 
+            shuffled_matrix = sub_matrix[self._rng.permutation(sub_matrix.shape[0]), :] 
             shuffled_sub_matrices.append(shuffled_matrix)
 
         sub_matrices_second_individual = shuffled_sub_matrices
@@ -646,18 +685,18 @@ class EvolutionalAlgorithm(IAlgorithm):
         while (i < nb_children):
 
             # probability of sterile parent
-            x = rd.random()  # NOSONAR
+            x = self._rng.random()  # NOSONAR
             if x > self.crossing_rate:
                 continue
 
             # randomly choosing the 2 individuals to cross together
-            first_individual_to_cross = rd.randint(0, len(parents) - 1)  # NOSONAR
-            second_individual_to_cross = rd.randint(0, len(parents) - 1)  # NOSONAR
+            first_individual_to_cross = self._rng.integers(0, len(parents))  # NOSONAR
+            second_individual_to_cross = self._rng.integers(0, len(parents))  # NOSONAR
 
             # assuring we don't choose the same individual twice
             # (no point doing that when crossing)
             while first_individual_to_cross == second_individual_to_cross:
-                second_individual_to_cross = rd.randint(0, len(parents) - 1)  # NOSONAR
+                second_individual_to_cross = self._rng.integers(0, len(parents))  # NOSONAR
 
             # getting the parents
             parent1 = parents[first_individual_to_cross]
@@ -679,7 +718,7 @@ class EvolutionalAlgorithm(IAlgorithm):
                     children[i] = self.optimize_child(valid_child)            
                 i += 1
 
-        return children.astype(int)
+        return children.astype(np.int32)
 
     def mutating(self, children: np.ndarray) -> np.ndarray:
         """
@@ -697,20 +736,20 @@ class EvolutionalAlgorithm(IAlgorithm):
         for i in range(mutants.shape[0]):
 
             # probability of mutating
-            random_value = rd.random()  # NOSONAR
+            random_value = self._rng.random()  # NOSONAR
             if random_value > self.mutation_rate:
                 # continue
                 pass
 
             # generate a random value associated for deciding which path will be mutated
-            idx_col_to_shuffle = rd.randint(0, mutants.shape[1] - 1)  # NOSONAR
+            idx_col_to_shuffle = self._rng.integers(0, mutants.shape[1])  # NOSONAR
 
             # we reverse the right path of the child
             children[i][idx_col_to_shuffle] = np.flip(children[i][idx_col_to_shuffle])
             # we add the child to the mutants output
             mutants[i] = children[i]
 
-        return mutants.astype(int)
+        return mutants.astype(np.int32)
 
     def find_best_individual(self, tuples_list: list[tuple[float, float]]) -> int:
         """
@@ -734,8 +773,8 @@ class EvolutionalAlgorithm(IAlgorithm):
 
         for tuple in tuples_list:
             
-            #checking if actual individual is better than the actual best 
-           if (tuple[0] > best_solution[0]) and (tuple[1] < best_solution[1] ):
+            #checking if actual individual dominates the actual best, as in the Pareto sort
+           if self.dominates(tuple, best_solution):
                 best_solution = tuple
 
         # looping over the elements of the list until we find the "best individual"
@@ -777,7 +816,7 @@ class EvolutionalAlgorithm(IAlgorithm):
                 #   -> 1, 2, 2, 3 is NOT OK
                 # If the current node is not equal to the last added node, add it
                 if not cleaned_path or cleaned_path[-1] != node:
-                    cleaned_path.append(node)
+                    cleaned_path.append(int(node))
 
             # Store the "cleaned" path
             cleaned_individual.append(cleaned_path)
@@ -798,7 +837,6 @@ class EvolutionalAlgorithm(IAlgorithm):
 
         # generating the initial population
         self.indicative_paths_population = self.initial_population_generation()
-        self.real_paths_population = self.get_real_population_from_indicative_population()
 
         # declaring the number of parents and thus, the number of children
         nbr_parents = self.nb_individuals_in_pop // 2
@@ -822,9 +860,6 @@ class EvolutionalAlgorithm(IAlgorithm):
             self.indicative_paths_population[0:parents.shape[0], :] = parents
             self.indicative_paths_population[parents.shape[0]:, :] = mutants
 
-            # updating te "real paths" population
-            self.real_paths_population = self.get_real_population_from_indicative_population()
-
         # evaluating the fitness of the final population
         fitness_finale = self.fitness()
 
@@ -1,5 +1,6 @@
+from typing import Optional, Union
+
 import numpy as np
-import math
 from scipy.spatial.distance import cdist
 import matplotlib.pyplot as plt
 
@@ -14,21 +15,27 @@ class KMeansAlgorithm(IAlgorithm):
         parameters: dict[str, TextBox],
         nb_agents : int, 
         graph: Graph,
-        active_plot : bool = False
+        active_plot : bool = False,
+        kmeans_plus_plus : bool = True,
+        seed : Optional[Union[int, np.random.Generator]] = None
     ) -> None:
 
         self._nb_clusters = nb_agents  
 
-        self._list_nodes = np.zeros((len(graph.nodes), 2)) 
-        for i in range(len(graph.nodes)): 
-            self._list_nodes[i] = np.array([graph.nodes[i].x, graph.nodes[i].y])
+        self._list_nodes = np.array(
+            [(node.x, node.y) for node in graph.nodes], dtype=float
+        ).reshape(len(graph.nodes), 2)
 
-        self._distances = graph._complete_adjacency_matrix  
+        self._distances = np.asarray(graph._complete_adjacency_matrix, dtype=float)
         self._nb_launch_kmeans : int = int(parameters["Number of launch"].text_content)
         self._active_plot = active_plot
+        self._kmeans_plus_plus = kmeans_plus_plus
+        # The clusters and their tours draw from the same generator
+        self._rng = np.random.default_rng(seed)
 
         self._centers = None  
-        self._clusters = {}  
+        # Indices of the nodes of each cluster in the graph
+        self._clusters : dict[int, np.ndarray[int]] = {}  
 
 
     def launch(self) -> list[list[int]]:
@@ -39,27 +46,11 @@ class KMeansAlgorithm(IAlgorithm):
         Returns:
             result (list of list of int) : path found for each agent.
         """
-        best_result = math.inf
-        best_clusters_attribution = np.zeros(self._nb_clusters)
-        best_clusters = {}
-        best_centers = np.zeros((self._nb_clusters, 2))
-
-        for _ in range(self._nb_launch_kmeans):
-            # Run KMean algorithm to group the nodes
-            cluster_attribution = self._group_nodes() 
-            result = self._evaluate_kmean()
-            if result < best_result: 
-                best_result = result
-                best_clusters = self._clusters.copy()
-                best_clusters_attribution = cluster_attribution.copy()
-                best_centers = self._centers.copy()
-
-
-        self._clusters = best_clusters
-        self._centers = best_centers # only use for the plot
+        # Run KMean algorithm to group the nodes
+        clusters_attribution = self._group_nodes()
 
         if self._active_plot:
-            self._plot(best_clusters_attribution)
+            self._plot(clusters_attribution)
 
         # Run genetic algorithm to connect the nodes in the same cluster
         result = self._connect_nodes()
@@ -71,61 +62,147 @@ class KMeansAlgorithm(IAlgorithm):
         """
         Create one cluster by agent and optimize the attribution 
         of each node in a cluster following KMeans algorithm.
+
+        The _nb_launch_kmeans launches run side by side: the distances 
+        between the nodes and the centers of every launch are computed 
+        with a single cdist at each iteration, and the launch with the 
+        lowest sum of squared distances is kept.
+
+        Returns:
+            clusters_attribution (np.ndarray[int]) : the cluster of each node 
+            in the best launch.
         """
-        self._initialize_centers()
-        prev_centers = np.empty_like(self._centers)
-        
+        nb_launch = max(self._nb_launch_kmeans, 1)
+        nb_nodes = len(self._list_nodes)
+        centers = self._initialize_centers(nb_launch)
+        prev_centers = np.empty_like(centers)
+
         i = 0
 
-        # Loop until convergence
-        while (not np.allclose(self._centers, prev_centers)) and (i < 100):  
-            prev_centers = self._centers.copy()
-            
-            # Compute distance matrix betwenn all nodes and all centers
-            distances = cdist(self._list_nodes, self._centers)
-            
+        # Loop until convergence of every launch
+        while (not np.allclose(centers, prev_centers)) and (i < 100):  
+            prev_centers = centers.copy()
+
+            # Compute distance matrix between all nodes and all centers, 
+            # of shape (nb_nodes, nb_launch, nb_clusters)
+            distances = cdist(self._list_nodes, centers.reshape(-1, 2)).reshape(
+                nb_nodes, nb_launch, self._nb_clusters
+            )
+
             # Assign each node to the closest centers
-            clusters_attribution = np.argmin(distances, axis=1)
-            
+            clusters_attribution = np.argmin(distances, axis=2)
+
             # Replace each center in the center of his cluster
-            self._actualize_centers(clusters_attribution)
+            centers = self._actualize_centers(clusters_attribution, centers)
 
             i += 1
 
-        return clusters_attribution
+        # Evaluate each launch on its last attribution
+        distances = cdist(self._list_nodes, centers.reshape(-1, 2)).reshape(
+            nb_nodes, nb_launch, self._nb_clusters
+        )
+        clusters_attribution = np.argmin(distances, axis=2)
+        best_launch = np.argmin(self._evaluate_kmean(distances, clusters_attribution))
+
+        best_attribution = clusters_attribution[:, best_launch]
+        self._centers = centers[best_launch] # only use for the plot
+        self._clusters = {
+            i: np.flatnonzero(best_attribution == i) 
+            for i in range(self._nb_clusters)
+        }
 
+        return best_attribution
 
-    def _initialize_centers(self) -> None: 
+
+    def _initialize_centers(self, nb_launch : int) -> np.ndarray[float]: 
         """
-        Initialize all center randomly by taking for each the 
-        coordinates of a random node in the list.
+        Initialize the centers of every launch on the coordinates of 
+        nodes. With the k-means++ seeding, the first center is a random 
+        node and each following one is drawn with a probability 
+        proportional to its squared distance to the closest chosen 
+        center. Otherwise all centers are random distinct nodes.
+
+        Args:
+            nb_launch (int) : number of launches to initialize.
+
+        Returns:
+            centers (np.ndarray[float]) : the centers of every launch, of 
+            shape (nb_launch, nb_clusters, 2).
         """
-        self._centers = self._list_nodes[
-            np.random.choice(len(self._list_nodes), self._nb_clusters, replace=False)
-        ]
+        nb_nodes = len(self._list_nodes)
+
+        if not self._kmeans_plus_plus:
+            chosen = np.array([
+                self._rng.choice(nb_nodes, self._nb_clusters, replace=False)
+                for _ in range(nb_launch)
+            ]).reshape(nb_launch, self._nb_clusters)
+            return self._list_nodes[chosen]
+
+        chosen = np.empty((nb_launch, self._nb_clusters), dtype=int)
+        chosen[:, 0] = self._rng.integers(0, nb_nodes, size=nb_launch)
+        closest_squarred_distances = np.full((nb_launch, nb_nodes), np.inf)
+
+        for k in range(1, self._nb_clusters):
+            last_centers = self._list_nodes[chosen[:, k - 1]]
+            squarred_distances = np.sum(
+                (self._list_nodes[None, :, :] - last_centers[:, None, :]) ** 2, 
+                axis=2
+            )
+            np.minimum(closest_squarred_distances, squarred_distances, out=closest_squarred_distances)
+
+            # When all nodes are on chosen centers, any node can be drawn
+            weights = closest_squarred_distances.copy()
+            weights[weights.sum(axis=1) == 0] = 1.0
+
+            cumulative_weights = np.cumsum(weights, axis=1)
+            draws = self._rng.random(nb_launch) * cumulative_weights[:, -1]
+            chosen[:, k] = np.minimum(
+                np.sum(cumulative_weights <= draws[:, None], axis=1), 
+                nb_nodes - 1
+            )
+
+        return self._list_nodes[chosen]
 
 
-    def _actualize_centers(self, clusters_attribution : list[int]) -> None: 
+    def _actualize_centers(
+        self, 
+        clusters_attribution : np.ndarray[int], 
+        centers : np.ndarray[float]
+    ) -> np.ndarray[float]: 
         """
-        Replace each center on the mean position of his cluster 
-        and actualize the list of cluster in attribute.
+        Replace each center on the mean position of his cluster, for every
+        launch at once. The center of an empty cluster does not move.
         
         Args:
-           clusters_attribution (list of int) : associate the number of 
-           his cluster for each node e.g. : [0, 2, 0, 1] -> nodes 0 and 2 in cluster 0 ; 
-           nodes 3 in cluster 1 ; node 1 in cluster 2.   
+           clusters_attribution (np.ndarray[int]) : associate the number of 
+           his cluster for each node and each launch, of shape 
+           (nb_nodes, nb_launch) e.g. : [0, 2, 0, 1] -> nodes 0 and 2 in 
+           cluster 0 ; nodes 3 in cluster 1 ; node 1 in cluster 2.   
+           centers (np.ndarray[float]) : the current centers of every launch.
+
+        Returns:
+            centers (np.ndarray[float]) : the new centers of every launch.
         """
-        for i in range(self._nb_clusters):
+        nb_launch = centers.shape[0]
+        nb_bins = nb_launch * self._nb_clusters
 
-            # Take all nodes in the center i 
-            cluster = self._list_nodes[clusters_attribution == i]
-            
-            # Actualise the list of cluster 
-            self._clusters[i] = cluster
+        # Number each cluster of each launch to sum all of them together
+        bins = (
+            np.arange(nb_launch)[None, :] * self._nb_clusters + clusters_attribution
+        ).ravel()
+        positions = np.repeat(self._list_nodes, nb_launch, axis=0)
+
+        counts = np.bincount(bins, minlength=nb_bins)
+        sums = np.stack([
+            np.bincount(bins, weights=positions[:, 0], minlength=nb_bins),
+            np.bincount(bins, weights=positions[:, 1], minlength=nb_bins)
+        ], axis=1)
 
-            # If there is at least 1 node in the cluster we 
-            if len(cluster) > 0:
-                self._centers[i] = np.mean(cluster, axis=0)
+        new_centers = centers.reshape(nb_bins, 2).copy()
+        not_empty = counts > 0
+        new_centers[not_empty] = sums[not_empty] / counts[not_empty, None]
+
+        return new_centers.reshape(centers.shape)
 
 
     def _plot(self, clusters_attribution : list[int]) -> None:
@@ -172,28 +249,28 @@ class KMeansAlgorithm(IAlgorithm):
 
 
     # calculer la somme des carrées des distances au centre
-    def _evaluate_kmean(self) -> int:
+    def _evaluate_kmean(
+        self, 
+        distances : np.ndarray[float], 
+        clusters_attribution : np.ndarray[int]
+    ) -> np.ndarray[float]:
         """
         Compute the sum of the squared distance between each node and 
-        his center to evaluate the KMeans algorithm.
-        """ 
-        sum_squarred_distance = 0
-        for id_center, cluster in self._clusters.items(): 
-            for node in cluster: 
-                sum_squarred_distance += self._squarred_distance(node, self._centers[id_center])
+        his center to evaluate each launch of the KMeans algorithm.
 
-        return sum_squarred_distance
-                
+        Args:
+            distances (np.ndarray[float]) : the distances between the nodes and 
+            the centers of every launch, of shape (nb_nodes, nb_launch, nb_clusters).
+            clusters_attribution (np.ndarray[int]) : the cluster of each node 
+            in each launch, of shape (nb_nodes, nb_launch).
 
-    def _squarred_distance(
-        self, 
-        node1 : np.ndarray[float], 
-        node2 : np.ndarray[float]
-    ) -> float: 
-        """
-        Compute the squared distance between two nodes.
-        """
-        return ((node1[0] - node2[0]) ** 2) + ((node1[1] - node2[1]) ** 2) 
+        Returns:
+            sum_squarred_distance (np.ndarray[float]) : the evaluation of each launch.
+        """ 
+        distances_to_center = np.take_along_axis(
+            distances, clusters_attribution[:, :, None], axis=2
+        )[:, :, 0]
+        return np.sum(distances_to_center ** 2, axis=0)
 
 
     def _connect_nodes(self) -> tuple[list[list[int]], list[float]]:
@@ -212,7 +289,7 @@ class KMeansAlgorithm(IAlgorithm):
             cluster_distances = self.create_distance_matrix(cluster)
 
             # Run the genetic algorithm to connect the nodes
-            kmea = KMEA(nb_nodes=len(cluster), distances=cluster_distances) 
+            kmea = KMEA(nb_nodes=len(cluster), distances=cluster_distances, seed=self._rng) 
             result = kmea.run()
 
             # Append the result to the list of all results
@@ -220,7 +297,8 @@ class KMeansAlgorithm(IAlgorithm):
             min_cost_kmea.append(result[1])
 
             if self._active_plot:
-                ax.plot(cluster[result[0], 0], cluster[result[0], 1], 'o-')
+                path = self._list_nodes[cluster[result[0]]]
+                ax.plot(path[:, 0], path[:, 1], 'o-')
 
         if self._active_plot:
             plt.show() 
@@ -230,50 +308,25 @@ class KMeansAlgorithm(IAlgorithm):
 
     def create_distance_matrix(
         self, 
-        cluster : np.ndarray[np.ndarray[float]]
+        cluster : np.ndarray[int]
     ) -> np.ndarray[np.ndarray[float]]: 
         """
-        Compute the distance between each nodes by using 
+        Extract the distance between each nodes of a cluster from 
         the initial distance matrix.        
         
         Args: 
-              cluster (np.ndarray[np.ndarray[float]]) : list of nodes in the cluster
+              cluster (np.ndarray[int]) : indices of the nodes in the cluster
 
         Returns:
                 cluster_distances (np.ndarray[np.ndarray[float]]) : distance matrix 
                 between all nodes in the cluster based on the initial distance matrix.
         """
-        cluster_distances = np.empty((len(cluster), len(cluster)))
-
-        for i in range(len(cluster)): 
-            for j in range(i, len(cluster)): 
-                
-                id_node1 = self.find_index(cluster[i])
-                id_node2 = self.find_index(cluster[j])
-
-                cluster_distances[i][j] = self._distances[id_node1][id_node2]
-                cluster_distances[j][i] = cluster_distances[i][j]
-        
-        return cluster_distances
-    
-    def find_index(self, target_node : np.ndarray[float]) -> int:
-        """
-        Find the index of a node in the list of nodes.
-
-        Args:
-            node (np.ndarray[float]) : node to find in the list of nodes.
-
-        Returns:
-            index (int) : index of the node in the list of nodes.
-        """
-        for idx, node in enumerate(self._list_nodes):
-            if np.array_equal(node, target_node):
-                return idx
+        return self._distances[np.ix_(cluster, cluster)]
             
     
     def reconstruct_solution(
         self, 
-        cluster :  np.ndarray[np.ndarray[float]],
+        cluster : np.ndarray[int],
         solution : np.ndarray[int]
         ) -> list[int]:
         """
@@ -281,15 +334,10 @@ class KMeansAlgorithm(IAlgorithm):
         index of the nodes in the list of nodes.
 
         Args:
+            cluster (np.ndarray[int]) : indices of the nodes in the cluster.
             solution (np.ndarray[int]) : solution to reconstruct.
 
         Returns:
-            reconstructed_solution (np.ndarray[int]) : reconstructed solution.
+            reconstructed_solution (list[int]) : reconstructed solution.
         """
-        reconstructed_solution = np.empty(len(solution), dtype=int)
-
-        for i in range(len(solution)):
-            node = cluster[solution[i]]
-            reconstructed_solution[i] = self.find_index(node)
-
-        return reconstructed_solution.tolist()
\ No newline at end of file
+        return cluster[solution].tolist()
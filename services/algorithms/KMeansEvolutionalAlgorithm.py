@@ -1,153 +1,145 @@
 
-import random as rd
+from typing import Optional, Union
+
 import numpy as np
 
-class KMeansEvolutionalAlgorithm: 
+class KMeansEvolutionalAlgorithm:
 
     def __init__(
-        self, 
-        nb_nodes : int, 
+        self,
+        nb_nodes : int,
         distances : np.ndarray[np.ndarray[float]],
+        seed : Optional[Union[int, np.random.Generator]] = None
     ) -> None:
 
         self._nb_nodes = nb_nodes
-        self._distances = distances
+        self._distances = np.asarray(distances, dtype=float)
 
         self._nb_generations = 600
         self._pop_size = 40
         self._crossover_rate = 0.8
         self._mutation_rate = 0.2
-        self._population = np.empty((self._pop_size, self._nb_nodes))
+        # Number of generations without improvement of the best tour
+        # after which the optimization stops
+        self._max_stagnation = 100
+        self._population = np.empty((self._pop_size, self._nb_nodes), dtype=int)
+        self._rng = np.random.default_rng(seed)
+
 
-        
     def run(self) -> tuple[np.ndarray[int], float]:
         """
         Run the genetic algorithm to solve a TSP problem.
         """
+        if self._nb_nodes == 0:
+            return np.empty(0, dtype=int), 0.0
+
         self._init_ag()
         return self._optimize()
 
 
-    def _init_ag(self) -> None: 
+    def _init_ag(self) -> None:
         """
         Initialize the population of the genetic algorithm.
         Create first individual by using the nearest neighbour heuristic.
         Generate the rest of the population by mutation of the first individual.
         """
-        first_individual = np.empty(self._nb_nodes)
-        
-        already_visited = set()
-        not_visited = [i for i in range(self._nb_nodes)] 
-        not_visited = set(not_visited)
-
-        current_node = not_visited.pop()
-        already_visited.add(current_node)
-        first_individual[0] = current_node
+        first_individual = np.empty(self._nb_nodes, dtype=int)
+        not_visited = np.ones(self._nb_nodes, dtype=bool)
 
-        k = 1
-
-        while len(not_visited) > 0:
+        current_node = 0
+        not_visited[current_node] = False
+        first_individual[0] = current_node
 
-            next_node = self._closest_neighbour(current_node, not_visited)
-            not_visited.remove(next_node)
-            already_visited.add(next_node)
-            current_node = next_node
+        for k in range(1, self._nb_nodes):
+            current_node = self._closest_neighbour(current_node, not_visited)
+            not_visited[current_node] = False
             first_individual[k] = current_node
-            k += 1
-
 
         self._population[0] = first_individual
-
-        for i in range(1, self._pop_size):
-            individual = self._individual_mutation(first_individual)
-            self._population[i] = individual
-        
-        self._population = self._population.astype(int)
+        self._population[1:] = self._mutation_rsm(
+            np.tile(first_individual, (self._pop_size - 1, 1)),
+            mutation_rate=1.0
+        )
 
 
     def _closest_neighbour(
-        self, 
-        current_node : int, 
-        not_visited : set[int]
+        self,
+        current_node : int,
+        not_visited : np.ndarray[bool]
     ) -> int:
         """
         Find the closest neighbour of a node.
 
         Args:
             current_node : int : the current node
-            not_visited : set[int] : the set of not visited nodes
+            not_visited : np.ndarray[bool] : whether each node is not visited yet
 
         Returns:
             int : the closest neighbour of the current node
         """
-        min_distance = 999999
-        closest_node = -1
-
-        for node in not_visited:
-            distance = self._distances[current_node][node]
-            if distance < min_distance:
-                min_distance = distance
-                closest_node = node
-
-        return closest_node
+        distances = np.where(not_visited, self._distances[current_node], np.inf)
+        return int(np.argmin(distances))
 
 
     def _optimize(self) -> tuple[np.ndarray[int], float]:
         """
         Run the genetic algorithm to solve the TSP problem.
 
+        The best tour met so far is kept aside, and the optimization stops
+        early once it has not improved for _max_stagnation generations.
+
         Returns:
             sol_opt : np.ndarray[int] : the optimal solution
             min_fitness : float : the minimum distance
         """
         nbr_parents = self._pop_size // 2
-        nbr_children = self._pop_size - nbr_parents 
-       
+        nbr_children = self._pop_size - nbr_parents
+
+        fitness = self._compute_fitness()
+        best_index = np.argmin(fitness)
+        sol_opt = self._population[best_index].copy()
+        min_fitness = fitness[best_index]
+        stagnation = 0
+
         for _ in range(self._nb_generations):
-            
-            fitness = self._compute_fitness()
 
             parents = self._selection(fitness, nbr_parents)
             children = self._crossover(parents, nbr_children)
             mutants = self._mutation_rsm(children)
 
-            
             self._population[0:parents.shape[0]] = parents
             self._population[parents.shape[0]:, :] = mutants
 
-            
-        fitness_derniere_generation = self._compute_fitness()   
-        
-        min_fitness = np.min(fitness_derniere_generation)
-        index_min_fitness = np.nonzero(fitness_derniere_generation == min_fitness)
-        sol_opt = self._population[index_min_fitness[0][0],:]
-        
-        return sol_opt, min_fitness
+            fitness = self._compute_fitness()
+            best_index = np.argmin(fitness)
+
+            if fitness[best_index] < min_fitness:
+                sol_opt = self._population[best_index].copy()
+                min_fitness = fitness[best_index]
+                stagnation = 0
+            else:
+                stagnation += 1
+                if stagnation >= self._max_stagnation:
+                    break
+
+        return sol_opt, float(min_fitness)
 
 
     def _compute_fitness(self) -> np.ndarray[float]:
         """
-        Compute the fitness of each individual in the population.
+        Compute the fitness of each individual in the population, ie the
+        length of its tour, going back from its last node to its first one.
 
         Returns:
             np.ndarray[float] : the fitness of each individual
         """
-        fitness = np.empty(self._population.shape[0])
-
-        for i in range(self._population.shape[0]):
-            eval_distance=0
-            solution = self._population[i]
-            for j in range (len(solution)):
-                origine, destination = solution[j], solution[(j+1)%self._nb_nodes]
-                eval_distance += self._distances[origine][destination]
-            fitness[i] = eval_distance
-        
-        return fitness.astype(float)
+        next_nodes = np.roll(self._population, -1, axis=1)
+        return self._distances[self._population, next_nodes].sum(axis=1)
 
 
     def _selection(
-        self, 
-        fitness : np.ndarray[float], 
+        self,
+        fitness : np.ndarray[float],
         nbr_parents : int
     ) -> np.ndarray[np.ndarray[int]]:
         """
@@ -165,77 +157,86 @@ class KMeansEvolutionalAlgorithm:
 
         total_fitness = np.sum(1 / fitness)
         probabilities = (1 / fitness) / total_fitness
-        indices = np.random.choice(range(len(self._population)), size=nbr_parents, p=probabilities, replace=False)
+        indices = self._rng.choice(len(self._population), size=nbr_parents, p=probabilities, replace=False)
         parents = self._population[indices]
 
         return parents
 
 
-    def _mutation_rsm(
-        self, 
-        children : np.ndarray[np.ndarray[int]]
-    ) -> np.ndarray[np.ndarray[int]]:
+    def _random_segments(
+        self,
+        nb_segments : int
+    ) -> tuple[np.ndarray[int], np.ndarray[int]]:
         """
-        Apply the mutation to the children by using the RSM mutation.
+        Draw one random segment [point_a, point_b[ of the genome for each
+        individual, with 0 <= point_a < point_b <= nb_nodes - 1.
 
         Args:
-            children : np.ndarray[np.ndarray[int]] : the children
+            nb_segments : int : the number of segments to draw
 
         Returns:
-            np.ndarray[np.ndarray[int]] : the mutated children
+            point_a : np.ndarray[int] : the first index of each segment
+            point_b : np.ndarray[int] : the index following each segment
         """
-        
-        mutants = np.empty((children.shape))
-        
-        for i in range(mutants.shape[0]):
+        point_a = self._rng.integers(0, self._nb_nodes - 2, size=nb_segments)
+        point_b = self._rng.integers(point_a + 1, self._nb_nodes)
+        return point_a, point_b
 
-            if rd.random() > self._mutation_rate:
-                mutants[i] = children[i].copy()
-            
-            else: 
-                mutants[i] = self._individual_mutation(children[i])
 
-        return mutants 
-
-
-    def _individual_mutation(
-        self, 
-        child : np.ndarray[np.ndarray[int]]
-    ) -> np.ndarray[np.ndarray[int]]: 
+    def _mutation_rsm(
+        self,
+        children : np.ndarray[np.ndarray[int]],
+        mutation_rate : float = None
+    ) -> np.ndarray[np.ndarray[int]]:
         """
-        Apply the RSM mutation to an individual.
+        Apply the mutation to the children by using the RSM mutation: a
+        random segment of each mutated child is reversed. All the children
+        are mutated at once.
 
         Args:
-            child : np.ndarray[int] : the individual
+            children : np.ndarray[np.ndarray[int]] : the children
+            mutation_rate : float : the probability for a child to be mutated,
+                the one of the algorithm by default
 
         Returns:
-            np.ndarray[int] : the mutated individual
+            np.ndarray[np.ndarray[int]] : the mutated children
         """
+        if mutation_rate is None:
+            mutation_rate = self._mutation_rate
 
-        if (child.shape[0] < 3):
-            return child.copy()
-        
-        point_a = rd.randint(0, child.shape[0] - 3)
-        point_b = rd.randint(point_a + 1, child.shape[0] - 1)
-
-        inverted_segment = child[point_a:point_b].copy()               
-        inverted_segment = np.flip(inverted_segment)
+        if self._nb_nodes < 3:
+            return children.copy()
 
-        mutant = child.copy()
+        nb_children = children.shape[0]
+        point_a, point_b = self._random_segments(nb_children)
 
-        for i in range(point_a, point_b):
-            mutant[i] = inverted_segment[i - point_a]
+        # Inside its segment, the gene at position i comes from position
+        # point_a + point_b - 1 - i, the other genes stay in place
+        positions = np.arange(self._nb_nodes)
+        in_segment = (
+            (positions >= point_a[:, None]) & (positions < point_b[:, None])
+        )
+        is_mutated = self._rng.random(nb_children) < mutation_rate
+        in_segment &= is_mutated[:, None]
 
-        return mutant
+        sources = np.where(
+            in_segment,
+            (point_a + point_b - 1)[:, None] - positions,
+            positions
+        )
+        return np.take_along_axis(children, sources, axis=1)
 
 
     def _crossover(
-        self, 
+        self,
         parents : np.ndarray[np.ndarray[int]],
         nbr_children : int
     ) -> np.ndarray[np.ndarray[int]]:
         """
-        Apply the crossover to the parents by using the OX crossover.
+        Apply the crossover to the parents by using the OX crossover: each
+        child inherits a random segment of its first parent, and the other
+        nodes in the order of its second parent. All the children are
+        created at once.
 
         Args:
             parents : np.ndarray[np.ndarray[int]] : the parents
@@ -243,63 +244,29 @@ class KMeansEvolutionalAlgorithm:
 
         Returns:
             np.ndarray[np.ndarray[int]] : the children
-        """ 
-        children = np.empty((nbr_children, parents.shape[1]))
-        nb_children_create = 0
-
-        for nb_children_create in range(nbr_children):
-
-            rd_parent1 = parents[rd.randint(0, parents.shape[0] - 1)].copy()
-            rd_parent2 = parents[rd.randint(0, parents.shape[0] - 1)].copy()
-
-            if rd.random() > self._crossover_rate or parents.shape[1] < 3: 
-                children[nb_children_create] = rd_parent1
-
-            else:
-
-                point_a = rd.randint(0, parents.shape[1] - 3)
-                point_b = rd.randint(point_a + 1, parents.shape[1] - 1)
-
-                child = np.full(rd_parent1.shape, -1)
-
-                heritage_parent1 = rd_parent1[point_a:point_b].copy()
-                not_in_h1 = []
-
-                for i in range(child.shape[0]):
-                    if rd_parent2[i] not in heritage_parent1:
-                        not_in_h1.append(rd_parent2[i])
-
-                child[point_a:point_b] = heritage_parent1
-
-                child = self._complete_child(child, not_in_h1)
-                
-                children[nb_children_create] = child
-
-        return children
-    
-
-    def _complete_child(
-        self, 
-        child : np.ndarray[int], 
-        not_in_h1 : list[int]
-    ) -> np.ndarray[int]: 
         """
-        Complete the child by adding the missing nodes (part of the crossover).
-
-        Args:
-            child : np.ndarray[int] : the child
-            not_in_h1 : list[int] : the missing nodes
-
-        Returns:
-            np.ndarray[int] : the child with the missing nodes
-        """
-
-        index = 0
-
-        for i in range(child.shape[0]):
-            if  child[i] == -1:
-                child[i] = not_in_h1[index]
-                index += 1
-
-        return child
-
+        first_parents = parents[self._rng.integers(0, parents.shape[0], size=nbr_children)]
+        second_parents = parents[self._rng.integers(0, parents.shape[0], size=nbr_children)]
+
+        if self._nb_nodes < 3:
+            return first_parents
+
+        point_a, point_b = self._random_segments(nbr_children)
+        positions = np.arange(self._nb_nodes)
+        heritage_parent1 = (
+            (positions >= point_a[:, None]) & (positions < point_b[:, None])
+        )
+
+        # Flag, for each child, the nodes inherited from its first parent
+        inherited_nodes = np.zeros((nbr_children, self._nb_nodes), dtype=bool)
+        np.put_along_axis(inherited_nodes, first_parents, heritage_parent1, axis=1)
+        not_in_h1 = ~np.take_along_axis(inherited_nodes, second_parents, axis=1)
+
+        # Each child has as many free positions as missing nodes, so the
+        # row-major boolean indexing fills every child with its own nodes,
+        # in the order of its second parent
+        children = first_parents.copy()
+        children[~heritage_parent1] = second_parents[not_in_h1]
+
+        is_crossed = self._rng.random(nbr_children) < self._crossover_rate
+        return np.where(is_crossed[:, None], children, first_parents)
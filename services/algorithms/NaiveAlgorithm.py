@@ -1,5 +1,6 @@
+from typing import Optional, Union
+
 import numpy as np
-import random as rd
 
 from models.Graph import Graph
 from services.algorithms.IAlgorithm import IAlgorithm
@@ -13,19 +14,22 @@ class NaiveAlgorithm(IAlgorithm):
         distance_matrix : the "complete_adjacency_matrix" attribute from the Graph Class.
         path : a list of the shortest path found by the algorithm
         paths : a list of a list, the path of each agent
+        _rng : the generator of every random draw of the algorithm
     
     """
 
     def __init__(
         self,
         nb_agents: int,
-        graph_object: Graph
+        graph_object: Graph,
+        seed: Optional[Union[int, np.random.Generator]] = None
     ) -> None:
 
         self.nb_agents = nb_agents
         self.distance_matrix = np.array(graph_object.get_complete_adjacency_matrix())
         self.path = []
         self.paths = []
+        self._rng = np.random.default_rng(seed)
     
     def naive_shortest_path(self) -> None:
         """
@@ -37,7 +41,7 @@ class NaiveAlgorithm(IAlgorithm):
         visited = [False] * nb_nodes
 
         # Start at a node between 0 and number max of nodes.
-        current_node = rd.randint(0,nb_nodes-1)
+        current_node = int(self._rng.integers(0,nb_nodes))
         self.path.append(current_node)
         visited[current_node] = True
         
@@ -1,5 +1,6 @@
+from typing import Optional, Union
+
 import numpy as np
-import random as rd
 
 from models.Graph import Graph
 from services.algorithms.IAlgorithm import IAlgorithm
@@ -11,13 +12,15 @@ class NaiveAlgorithmRuntime(IAlgorithm):
     Attributes:
         nb_agents : The number of agents
         graph_object : the object of the Graph Class.
+        seed : the seed or generator of every random draw of the algorithm.
 
     """
 
     def __init__(
         self, 
         nb_agents: int,
-        graph_object: Graph
+        graph_object: Graph,
+        seed: Optional[Union[int, np.random.Generator]] = None
     ) -> None:
 
         self.distance_matrix = np.array(graph_object.get_complete_adjacency_matrix())
@@ -28,6 +31,7 @@ class NaiveAlgorithmRuntime(IAlgorithm):
         self.paths = [None] * nb_agents 
         self.positions = [0] * nb_agents  # Actual position of each Agent
         self.targets = [None] * nb_agents  # Next node of each agent
+        self._rng = np.random.default_rng(seed)
     
 
     def find_next_node(self, agent_id: int) -> int:
@@ -46,21 +50,24 @@ class NaiveAlgorithmRuntime(IAlgorithm):
         nearest_node = None
         max_idleness = -1  # Keep track of the highest idleness
 
+        # Compare the idleness of the nodes in whole seconds
+        idlenesses = np.floor(self.graph.get_idleness())
+
         # Search the node non visited (and not reserved) with the highest idleness
         for i in range(self.nb_nodes):
             if i not in self.targets and i not in self.positions:  # Avoid nodes already visited and reserved as targets
                 distance = self.distance_matrix[current_node][i]
-                idleness = self.graph.nodes[i].idleness
+                idleness = idlenesses[i]
                 if idleness > max_idleness:
                     nearest_node = i
                     min_distance = distance
-                    max_idleness = self.graph.nodes[i].idleness
+                    max_idleness = idleness
                 elif idleness == max_idleness:
                     # If two nodes have the same highest idleness, choose the one with the shorter distance
                     if distance < min_distance:
                         nearest_node = i
                         min_distance = distance
-                        max_idleness = self.graph.nodes[i].idleness
+                        max_idleness = idleness
         return nearest_node
 
     def update_target(self, agent_id: int) -> None:
@@ -132,7 +139,10 @@ class NaiveAlgorithmRuntime(IAlgorithm):
         self.positions[agent_id] = node_start
         target_node = self.targets[agent_id]
 
-        if ((node_start == target_node) or (self.graph.nodes[target_node].idleness == 0)):
+        # The target has been visited by another agent in the last second
+        target_visited = self.graph.get_idleness()[target_node] < 1
+
+        if ((node_start == target_node) or target_visited):
             self.targets[agent_id] = None
 
             # Update the targets of each agents
@@ -152,7 +162,7 @@ class NaiveAlgorithmRuntime(IAlgorithm):
         """
         
         for agent_id in range(self.nb_agents):
-            self.first_step(agent_id,rd.randint(0,self.nb_nodes-1))
+            self.first_step(agent_id,int(self._rng.integers(0,self.nb_nodes)))
 
         return self.paths
     
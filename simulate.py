@@ -0,0 +1,286 @@
+import argparse
+import csv
+import os
+import sys
+from typing import Optional
+
+from constants.Config import AGENT_SPEED
+from models.Graph import Graph
+from models.GraphData import GraphData
+from models.algorithms.AntColony import AntColony
+from models.algorithms.Evolutional import Evolutional
+from models.algorithms.IAlgorithmModel import IAlgorithmModel
+from models.algorithms.KMeans import KMeans
+from models.algorithms.Naive import Naive
+from models.algorithms.NaiveRuntime import NaiveRuntime
+from services.CSVService import CSVService
+from services.CompleteGraphService import CompleteGraphService
+from services.DijkstraService import DijkstraService
+from services.EventSimulationService import EventSimulationService
+from services.IPathCacheService import IPathCacheService
+from services.PathCacheService import PathCacheService, get_path_cache_folder
+from services.SimulationService import SimulationService
+
+
+def get_algorithm_models() -> list[IAlgorithmModel]:
+    """
+    Returns a new instance of every algorithm available in the GUI.
+    """
+    return [Naive(), Evolutional(), AntColony(), KMeans(), NaiveRuntime()]
+
+
+def get_algorithm_model(
+    algorithm_name: str,
+    parameters: Optional[dict[str, str]] = None,
+    nb_workers: int = 1
+) -> IAlgorithmModel:
+    """
+    Finds an algorithm by its name and sets its parameters.
+
+    Args:
+        algorithm_name (str): The name of the algorithm, as displayed in
+            the GUI (case insensitive).
+        parameters (dict[str, str], optional): The value of some
+            parameters, by their name in the GUI.
+        nb_workers (int): The number of worker processes of the
+            algorithms running in several processes, the Ant Colony
+            algorithm. The other algorithms ignore it.
+
+    Raises:
+        ValueError: If the algorithm or one of the parameters is
+            unknown, or the number of workers is not positive.
+
+    Returns:
+        IAlgorithmModel: The algorithm with its parameters set.
+    """
+    for model in get_algorithm_models():
+        if model.name.lower() == algorithm_name.lower():
+            break
+    else:
+        names = ", ".join(model.name for model in get_algorithm_models())
+        raise ValueError(f"Unknown algorithm {algorithm_name}, choose among: {names}")
+
+    for name, value in (parameters or {}).items():
+        if name not in model.parameters:
+            raise ValueError(f"Unknown parameter {name} for {model.name}")
+        model.parameters[name].text_content = str(value)
+
+    if isinstance(model, AntColony):
+        model.nb_workers = nb_workers
+    elif nb_workers <= 0:
+        raise ValueError("The number of workers must be positive")
+
+    return model
+
+
+def build_graph(graph_data: GraphData) -> Graph:
+    """
+    Builds a graph from the data of a CSV file, and computes its
+    complete graph and shortest paths if the file has none.
+
+    Args:
+        graph_data (GraphData): The data loaded from the CSV file.
+
+    Raises:
+        ValueError: If the graph has isolated subgraphs.
+
+    Returns:
+        Graph: The graph with its complements.
+    """
+    graph = Graph()
+    for x, y in graph_data.nodes_list:
+        graph.add_node(x, y)
+    for i, row in enumerate(graph_data.adjacency_matrix):
+        for j, distance in enumerate(row[:i]):
+            if distance > 0:
+                graph.add_edge(graph.nodes[i], graph.nodes[j])
+
+    if graph_data.complete_adjacency_matrix and graph_data.shortest_paths:
+        graph.set_complete_adjacency_matrix(graph_data.complete_adjacency_matrix)
+        graph.set_shortest_paths(graph_data.shortest_paths)
+    else:
+        simple_graph, _ = graph.compute_sparse_matrix()
+        complete_graph_service = CompleteGraphService(simple_graph, DijkstraService)
+        if not complete_graph_service.complete_graph:
+            raise ValueError("The graph must not have isolated subgraphs")
+        graph.set_complete_adjacency_matrix(complete_graph_service.complete_graph)
+        graph.set_shortest_paths(complete_graph_service.shortest_paths)
+
+    graph.pop_changes()
+    return graph
+
+
+def launch_algorithm(
+    model: IAlgorithmModel,
+    nb_agents: int,
+    graph: Graph,
+    seed: Optional[int] = None,
+    path_cache_service: Optional[IPathCacheService] = None
+) -> list[list[int]]:
+    """
+    Returns the paths found by an algorithm, from the cache if it has
+    already been launched with the same seed.
+
+    Args:
+        model (IAlgorithmModel): The algorithm and its parameters.
+        nb_agents (int): The number of agents.
+        graph (Graph): The graph with its complements.
+        seed (int, optional): The seed of the algorithm, the paths are
+            only cached when it is given.
+        path_cache_service (IPathCacheService, optional): The cache of
+            the paths.
+
+    Returns:
+        list[list[int]]: The path of each agent.
+    """
+    if path_cache_service is None or seed is None:
+        return model.initialize_algorithm(nb_agents, graph, seed=seed).launch()
+
+    cached = path_cache_service.get(model, nb_agents, graph, seed)
+    if cached is not None:
+        return cached[0]
+
+    solution = model.initialize_algorithm(nb_agents, graph, seed=seed).launch()
+    path_cache_service.put(model, nb_agents, graph, seed, solution)
+    return solution
+
+
+def simulate(
+    csv_path: str,
+    algorithm_name: str,
+    nb_agents: int,
+    duration: float,
+    parameters: Optional[dict[str, str]] = None,
+    interval: float = 10,
+    time_step: Optional[float] = None,
+    speed: float = AGENT_SPEED,
+    seed: Optional[int] = None,
+    use_cache: bool = True,
+    nb_workers: int = 1
+) -> list[tuple[float, float, float, float]]:
+    """
+    Runs an algorithm on a graph and simulates the patrol of its
+    agents without display.
+
+    Args:
+        csv_path (str): The path to the CSV file of the graph.
+        algorithm_name (str): The name of the algorithm.
+        nb_agents (int): The number of agents.
+        duration (float): The simulated duration, in seconds.
+        parameters (dict[str, str], optional): The parameters of the
+            algorithm, by their name in the GUI.
+        interval (float): The simulated time between two samples.
+        time_step (float, optional): The simulated duration of a step,
+            to simulate with fixed steps instead of processing the
+            arrivals of the agents one after the other.
+        speed (float): The speed of the agents, in pixels per second.
+        seed (int, optional): The seed of the algorithm, to reproduce a
+            simulation.
+        use_cache (bool): Whether to reuse the paths found by the
+            algorithm with the same seed, cached next to the CSV file.
+        nb_workers (int): The number of worker processes of the
+            algorithm, if it can run in several processes.
+
+    Returns:
+        list[tuple[float, float, float, float]]: The simulated time,
+            average, max and all-time max idleness of each sample.
+    """
+    graph = build_graph(CSVService().load(csv_path))
+    model = get_algorithm_model(algorithm_name, parameters, nb_workers)
+
+    # The runtime algorithm only gives the next node of each agent, and
+    # is asked for the following ones during the simulation
+    if isinstance(model, NaiveRuntime):
+        algorithm = model.initialize_algorithm(nb_agents, graph, seed=seed)
+        real_paths = [
+            real_path[:2]
+            for real_path in graph.compute_real_paths(algorithm.launch())
+        ]
+    else:
+        algorithm = None
+        path_cache_service = None
+        if use_cache:
+            path_cache_service = PathCacheService(
+                get_path_cache_folder(os.path.dirname(os.path.abspath(csv_path)))
+            )
+        solution = launch_algorithm(model, nb_agents, graph, seed, path_cache_service)
+        real_paths = graph.compute_real_paths(solution)
+
+    if time_step is None:
+        simulation = EventSimulationService(
+            graph,
+            real_paths,
+            algorithm=algorithm,
+            speed=speed
+        )
+    else:
+        simulation = SimulationService(
+            graph,
+            real_paths,
+            algorithm=algorithm,
+            speed=speed,
+            time_step=time_step
+        )
+    return simulation.run(duration, interval)
+
+
+def parse_parameters(values: list[str]) -> dict[str, str]:
+    """
+    Parses the parameters given as NAME=VALUE on the command line.
+    """
+    parameters = {}
+    for value in values:
+        name, separator, parameter = value.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Invalid parameter {value}, expected NAME=VALUE")
+        parameters[name.strip()] = parameter.strip()
+    return parameters
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulates the patrol of the agents on a graph without display."
+    )
+    parser.add_argument("csv_path", help="CSV file of the graph (e.g. csv_files/graph_1.csv)")
+    parser.add_argument("-a", "--algorithm", required=True, help="name of the algorithm, as in the GUI")
+    parser.add_argument("-n", "--agents", type=int, default=1, help="number of agents")
+    parser.add_argument("-d", "--duration", type=float, default=3600, help="simulated duration in seconds")
+    parser.add_argument("-p", "--param", action="append", default=[], help="algorithm parameter as NAME=VALUE")
+    parser.add_argument("--interval", type=float, default=10, help="simulated seconds between two samples")
+    parser.add_argument("--time-step", type=float, help="simulate with fixed steps of this many simulated seconds")
+    parser.add_argument("--seed", type=int, help="seed of the algorithm, to reproduce a simulation")
+    parser.add_argument("--no-cache", action="store_true", help="launch the algorithm even if its paths are cached")
+    parser.add_argument("--speed", type=float, default=AGENT_SPEED, help="agent speed in pixels per second")
+    parser.add_argument("-o", "--output", help="CSV file to write the samples to (standard output by default)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes of the algorithm (Ant Colony only)")
+    args = parser.parse_args()
+
+    samples = simulate(
+        args.csv_path,
+        args.algorithm,
+        args.agents,
+        args.duration,
+        parameters=parse_parameters(args.param),
+        interval=args.interval,
+        time_step=args.time_step,
+        speed=args.speed,
+        seed=args.seed,
+        use_cache=not args.no_cache,
+        nb_workers=args.workers
+    )
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = csv.writer(output)
+        writer.writerow([
+            "Simulation Time (s)", "Average Idleness",
+            "Current Max Idleness", "All-time Max Idleness"
+        ])
+        writer.writerows(samples)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
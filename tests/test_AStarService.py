@@ -0,0 +1,32 @@
+import unittest
+
+from services.AStarService import AStarService
+
+class TestAStarService(unittest.TestCase):
+    def setUp(self):
+        # We build a line of three nodes, plus an isolated node
+        self.node_positions = {0: (0, 0), 1: (10, 0), 2: (20, 0), 3: (50, 50)}
+        self.graph = [
+            [0.0, 10.0, 0.0, 0.0],
+            [10.0, 0.0, 10.0, 0.0],
+            [0.0, 10.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0]
+        ]
+
+    def test_find_path_with_constructor_nodes(self):
+        service = AStarService(self.graph, self.node_positions, 0, 2)
+
+        self.assertEqual(service.find_path(), ([0, 1, 2], 20.0))
+
+    def test_find_path_reused_across_queries(self):
+        service = AStarService(self.graph, self.node_positions)
+
+        # We verify that a previous query does not leak into the next one
+        self.assertEqual(service.find_path(0, 2), ([0, 1, 2], 20.0))
+        self.assertEqual(service.find_path(2, 1), ([2, 1], 10.0))
+        self.assertEqual(service.find_path(1, 1), ([1], 0.0))
+
+    def test_find_path_unreachable_node(self):
+        service = AStarService(self.graph, self.node_positions)
+
+        self.assertIsNone(service.find_path(0, 3))
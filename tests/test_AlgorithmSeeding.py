@@ -0,0 +1,49 @@
+import random
+import unittest
+
+import numpy as np
+
+from models.algorithms.AntColony import AntColony
+from models.algorithms.Evolutional import Evolutional
+from models.algorithms.KMeans import KMeans
+from models.algorithms.Naive import Naive
+from models.algorithms.NaiveRuntime import NaiveRuntime
+from tests.utils import build_grid_graph
+
+class TestAlgorithmSeeding(unittest.TestCase):
+    def setUp(self):
+        # We build a graph shaped like a grid of 3 x 4 nodes with its
+        # complete graph and shortest paths
+        self.graph = build_grid_graph(3, 4, 100)
+
+        self.models = [
+            Naive(),
+            NaiveRuntime(),
+            Evolutional(nb_iterations=5, nb_individuals=10),
+            AntColony(nb_iterations=3),
+            KMeans(nb_launch_kmeans=3)
+        ]
+
+    def _launch(self, model, seed, global_seed):
+        # The global generators are seeded differently, so that the
+        # paths only depend on the seed of the algorithm
+        random.seed(global_seed)
+        np.random.seed(global_seed)
+        paths = model.initialize_algorithm(3, self.graph, seed=seed).launch()
+        return [[int(node) for node in path] for path in paths]
+
+    def test_same_seed_gives_same_paths(self):
+        for model in self.models:
+            with self.subTest(algorithm=model.name):
+                self.assertEqual(
+                    self._launch(model, 42, 1),
+                    self._launch(model, 42, 2)
+                )
+
+    def test_generator_as_seed(self):
+        for model in self.models:
+            with self.subTest(algorithm=model.name):
+                self.assertEqual(
+                    self._launch(model, np.random.default_rng(7), 1),
+                    self._launch(model, np.random.default_rng(7), 2)
+                )
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from models.algorithms.AntColony import AntColony
+from services.algorithms.AntColonyAlgorithm import AntColonyAlgorithm
+from tests.utils import build_grid_graph
+
+class TestAntColonyAlgorithm(unittest.TestCase):
+    def setUp(self):
+        # We build a graph shaped like a grid of 4 x 4 nodes with its
+        # complete graph and shortest paths
+        self.graph = build_grid_graph(4, 4, 100)
+
+        self.algorithm = AntColony(nb_iterations=5).initialize_algorithm(
+            3,
+            self.graph
+        )
+
+    def test_build_colonies_path_visits_every_node_once(self):
+        colony_start_nodes = [[0, 5, 15], [3, 12, 6]]
+        pheromone_matrix = np.ones((16, 16))
+        np.fill_diagonal(pheromone_matrix, 0)
+
+        colonies_path = self.algorithm.build_colonies_path(
+            pheromone_matrix,
+            colony_start_nodes
+        )
+
+        self.assertEqual(len(colonies_path), 2)
+        for ants_path, start_nodes in zip(colonies_path, colony_start_nodes):
+            # We verify that each ant starts on its own starting node...
+            self.assertEqual([path[0] for path in ants_path], start_nodes)
+            # ...and that the ants of a colony share out every node
+            self.assertEqual(sorted(sum(ants_path, [])), list(range(16)))
+
+    def test_get_length_path_is_a_loop(self):
+        # The loop 0 -> 1 -> 5 -> 4 -> 0 has four edges of equal length
+        length = self.algorithm.get_length_path([[0, 1, 5, 4]])
+
+        self.assertAlmostEqual(length, 4 * self.algorithm.cost_matrix[0][1])
+
+    def test_launch_gives_one_path_per_agent(self):
+        best_path = self.algorithm.launch()
+
+        self.assertEqual(len(best_path), 3)
+        self.assertEqual(sorted(sum(best_path, [])), list(range(16)))
+
+    def test_launch_with_workers_is_reproducible(self):
+        # We launch the same seeded algorithm with different numbers of
+        # worker processes
+        best_paths = [
+            AntColonyAlgorithm(
+                AntColony(nb_iterations=3, nb_colony=4).parameters,
+                3,
+                self.graph,
+                nb_workers=nb_workers,
+                seed=42
+            ).launch()
+            for nb_workers in (1, 2, 3)
+        ]
+
+        # The colonies get their own seeds, so the result does not
+        # depend on whether they are built in the current process or
+        # how they are shared out between the workers
+        self.assertEqual(best_paths[0], best_paths[1])
+        self.assertEqual(best_paths[0], best_paths[2])
+        self.assertEqual(sorted(sum(best_paths[0], [])), list(range(16)))
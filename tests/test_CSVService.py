@@ -1,7 +1,8 @@
 import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
-from services.CSVService import CSVService
+from services.CSVService import CSVService, SIMPLE_GRAPH_SECTION
 
 class TestCSVService(unittest.TestCase):
     @patch('os.listdir') # Mocking the os.listdir function to simulate listing files in a directory.
@@ -157,3 +158,144 @@ class TestCSVService(unittest.TestCase):
         # We assert that both edges_matrix and nodes are None since the file does not exist.
         self.assertIsNone(edges_matrix)
         self.assertIsNone(nodes_list)
+
+    @patch('os.path.exists')
+    def test_parse_csv_file_shortest_paths(self, mock_exists):
+        mock_exists.return_value = True
+        # We simulate a graph of three nodes in a line, saved with its
+        # complements
+        csv_data = (
+            "Nodes,(0, 0),(10, 0),(20, 0),\n"
+            "Simple Graph,\n"
+            "0.0,10.0,0.0\n"
+            "10.0,0.0,10.0\n"
+            "0.0,10.0,0.0\n"
+            "Image_ref,image.png\n"
+            "Complete Graph,\n"
+            "0.0,10.0,20.0\n"
+            "10.0,0.0,10.0\n"
+            "20.0,10.0,0.0\n"
+            "Shortest paths,\n"
+            "0,1,[0, 1]\n"
+            "0,2,[0, 1, 2]\n"
+            "1,0,[1, 0]\n"
+            "1,2,[1, 2]\n"
+            "2,0,[2, 1, 0]\n"
+            "2,1,[2, 1]\n"
+        )
+
+        service = CSVService()
+        with patch('builtins.open', mock_open(read_data=csv_data)):
+            graph_data = service._parse_csv_file('graph_1.csv')
+
+        # We verify that the paths are rebuilt from the stored
+        # predecessors
+        self.assertEqual(graph_data.shortest_paths[(0, 2)], [0, 1, 2])
+        self.assertEqual(graph_data.shortest_paths[(2, 0)], [2, 1, 0])
+        self.assertEqual(graph_data.shortest_paths.predecessors[0][2], 1)
+        self.assertEqual(len(graph_data.shortest_paths), 6)
+
+    @patch('os.path.exists')
+    def test_parse_only_requested_sections(self, mock_exists):
+        mock_exists.return_value = True
+        # We simulate a graph whose shortest paths section could not be
+        # parsed, to verify that it is not read
+        csv_data = (
+            "Nodes,(0, 0),(10, 0),\n"
+            "Simple Graph,\n"
+            "0.0,10.0\n"
+            "10.0,\n"
+            "Image_ref,image.png\n"
+            "Complete Graph,\n"
+            "0.0,10.0\n"
+            "10.0,0.0\n"
+            "Shortest paths,\n"
+            "not a path\n"
+        )
+
+        service = CSVService()
+        with patch('builtins.open', mock_open(read_data=csv_data)):
+            graph_data = service._parse_csv_file(
+                'graph_1.csv',
+                sections=[SIMPLE_GRAPH_SECTION]
+            )
+
+        # We verify that an empty cell is a missing edge
+        self.assertEqual(graph_data.nodes_list, [(0, 0), (10, 0)])
+        self.assertEqual(graph_data.adjacency_matrix, [[0.0, 10.0], [10.0, 0.0]])
+        self.assertEqual(graph_data.complete_adjacency_matrix, [])
+        self.assertIsNone(graph_data.shortest_paths)
+
+    def test_load_writes_and_reads_binary_bundle(self):
+        # We save a graph of three nodes in a line with its complements
+        csv_data = (
+            "Nodes,(0, 0),(10, 0),(20, 0),\n"
+            "Simple Graph,\n"
+            "0.0,10.0,0.0\n"
+            "10.0,0.0,10.0\n"
+            "0.0,10.0,0.0\n"
+            "Image_ref,image.png\n"
+            "Complete Graph,\n"
+            "0.0,10.0,20.0\n"
+            "10.0,0.0,10.0\n"
+            "20.0,10.0,0.0\n"
+            "Shortest paths,\n"
+            "0,1,[0, 1]\n"
+            "0,2,[0, 1, 2]\n"
+            "1,0,[1, 0]\n"
+            "1,2,[1, 2]\n"
+            "2,0,[2, 1, 0]\n"
+            "2,1,[2, 1]\n"
+        )
+        service = CSVService()
+        with tempfile.TemporaryDirectory() as folder:
+            csv_path = os.path.join(folder, "graph_1.csv")
+            with open(csv_path, "w") as f:
+                f.write(csv_data)
+
+            parsed = service.load(csv_path)
+            self.assertTrue(os.path.exists(os.path.join(folder, "graph_1.npz")))
+
+            # We verify that the next load reads the bundle only
+            with patch.object(service, '_parse_csv_file', side_effect=AssertionError):
+                loaded = service.load(csv_path)
+
+        self.assertEqual(loaded.nodes_list, [(0, 0), (10, 0), (20, 0)])
+        self.assertEqual(loaded.adjacency_matrix, parsed.adjacency_matrix)
+        self.assertEqual(loaded.complete_adjacency_matrix, parsed.complete_adjacency_matrix)
+        self.assertEqual(loaded.shortest_paths[(2, 0)], [2, 1, 0])
+
+    def test_bundle_older_than_csv_is_not_read(self):
+        service = CSVService()
+        with tempfile.TemporaryDirectory() as folder:
+            csv_path = os.path.join(folder, "graph_1.csv")
+            with open(csv_path, "w") as f:
+                f.write("Nodes,(0, 0),(10, 0),\nSimple Graph,\n0.0,10.0\n10.0,0.0\nImage_ref,image.png\n")
+            service.load(csv_path)
+
+            # We move a node of the saved graph after its bundle was
+            # written
+            with open(csv_path, "w") as f:
+                f.write("Nodes,(0, 0),(30, 0),\nSimple Graph,\n0.0,30.0\n30.0,0.0\nImage_ref,image.png\n")
+            bundle_time = os.stat(os.path.join(folder, "graph_1.npz")).st_mtime_ns
+            os.utime(csv_path, ns=(bundle_time + 1, bundle_time + 1))
+
+            graph_data = service.load(csv_path)
+
+        self.assertEqual(graph_data.nodes_list, [(0, 0), (30, 0)])
+        self.assertIsNone(graph_data.shortest_paths)
+
+    def test_next_test_numbers_are_appended(self):
+        with tempfile.TemporaryDirectory() as folder:
+            service = CSVService()
+            service._test_numbers_file_path = os.path.join(folder, "test_numbers.csv")
+
+            self.assertEqual(service.get_next_test_number("Ant Colony", 1), 1)
+            self.assertEqual(service.get_next_test_number("Ant Colony", 1), 2)
+            self.assertEqual(service.get_next_test_number("K-means", 1), 1)
+
+            # We verify that a new service reads the last number of each
+            # algorithm from the file
+            service = CSVService()
+            service._test_numbers_file_path = os.path.join(folder, "test_numbers.csv")
+            self.assertEqual(service.get_next_test_number("Ant Colony", 1), 3)
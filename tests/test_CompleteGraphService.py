@@ -0,0 +1,91 @@
+import math
+import unittest
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from services.AStarService import AStarService
+from services.CompleteGraphService import CompleteGraphService
+from services.DijkstraService import DijkstraService
+
+class TestCompleteGraphService(unittest.TestCase):
+    def setUp(self):
+        # We build a small graph shaped like a square with one diagonal,
+        # plus a tail node only linked to the node 2
+        self.node_positions = {
+            0: (0, 0),
+            1: (3, 0),
+            2: (3, 4),
+            3: (0, 4),
+            4: (3, 10)
+        }
+        self.simple_graph = [[0.0] * 5 for _ in range(5)]
+        for i, j in [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (2, 4)]:
+            (x1, y1), (x2, y2) = self.node_positions[i], self.node_positions[j]
+            distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            self.simple_graph[i][j] = self.simple_graph[j][i] = distance
+
+    def test_complete_graph_matches_a_star(self):
+        service = CompleteGraphService(self.simple_graph, DijkstraService)
+
+        # We verify that every distance of the complete graph is the
+        # one found by the A* algorithm on the same pair of nodes
+        for start in range(5):
+            for end in range(5):
+                if start == end:
+                    self.assertEqual(service.complete_graph[start][end], 0)
+                    continue
+                _, distance = AStarService(
+                    self.simple_graph,
+                    self.node_positions,
+                    start,
+                    end
+                ).find_path()
+                self.assertAlmostEqual(service.complete_graph[start][end], distance)
+
+    def test_shortest_paths_follow_the_simple_graph(self):
+        service = CompleteGraphService(self.simple_graph, DijkstraService)
+        shortest_paths = service.shortest_paths
+
+        # We verify that every ordered pair of distinct nodes has a path
+        self.assertEqual(len(shortest_paths), 5 * 4)
+
+        for (start, end), path in shortest_paths.items():
+            # The path must go from the start to the end...
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], end)
+            # ...only through existing edges...
+            length = 0
+            for node1, node2 in zip(path, path[1:]):
+                self.assertGreater(self.simple_graph[node1][node2], 0)
+                length += self.simple_graph[node1][node2]
+            # ...and its length must be the one of the complete graph
+            self.assertAlmostEqual(length, service.complete_graph[start][end])
+
+        # The tail node is only reachable through the node 2
+        self.assertEqual(shortest_paths[(1, 4)], [1, 2, 4])
+        self.assertEqual(service.get_shortest_way(4, 3), [4, 2, 3])
+
+    def test_isolated_subgraph_gives_no_complete_graph(self):
+        # We remove the only edge linking the tail node to the graph
+        self.simple_graph[2][4] = self.simple_graph[4][2] = 0.0
+
+        service = CompleteGraphService(self.simple_graph, DijkstraService)
+
+        self.assertIsNone(service.complete_graph)
+
+    def test_sparse_graph_gives_the_same_complete_graph(self):
+        dense_service = CompleteGraphService(self.simple_graph, DijkstraService)
+        sparse_service = CompleteGraphService(
+            csr_matrix(np.array(self.simple_graph)),
+            DijkstraService
+        )
+
+        # We verify that the A* algorithm also accepts the sparse graph
+        # with an array of positions
+        positions = np.array([self.node_positions[node] for node in range(5)])
+        self.assertEqual(
+            AStarService(csr_matrix(np.array(self.simple_graph)), positions).find_path(0, 4),
+            AStarService(self.simple_graph, self.node_positions).find_path(0, 4)
+        )
+        np.testing.assert_allclose(sparse_service.complete_graph, dense_service.complete_graph)
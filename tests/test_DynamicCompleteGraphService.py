@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+
+from services.CompleteGraphService import CompleteGraphService
+from services.DijkstraService import DijkstraService
+from services.DynamicCompleteGraphService import DynamicCompleteGraphService
+from tests.utils import build_grid_graph
+
+class TestDynamicCompleteGraphService(unittest.TestCase):
+    def setUp(self):
+        # We build a graph shaped like a grid of 3 x 3 nodes
+        self.graph = build_grid_graph(3, 3, 100)
+
+        simple_graph, _ = self.graph.compute_matrix()
+        self.service = DynamicCompleteGraphService(simple_graph, DijkstraService)
+        # We consider the changes made so far as already computed
+        self.graph.pop_changes()
+
+    def assert_matches_full_computation(self):
+        self.service.apply_changes(self.graph.pop_changes())
+
+        simple_graph, _ = self.graph.compute_matrix()
+        expected = CompleteGraphService(simple_graph, DijkstraService)
+
+        # We verify that the repaired distances are the ones computed
+        # from scratch...
+        np.testing.assert_allclose(
+            self.service.complete_graph,
+            expected.complete_graph
+        )
+        # ...and that every repaired path follows the simple graph
+        # with the right length
+        for (start, end), path in self.service.shortest_paths.items():
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], end)
+            length = sum(
+                simple_graph[node1][node2]
+                for node1, node2 in zip(path, path[1:])
+            )
+            self.assertTrue(
+                all(simple_graph[node1][node2] > 0
+                    for node1, node2 in zip(path, path[1:]))
+            )
+            self.assertAlmostEqual(length, expected.complete_graph[start][end])
+
+    def test_drag_node_away(self):
+        # We move the center node away, its edges get longer
+        center = self.graph.nodes[4]
+        center.x, center.y = 160, 190
+        self.graph.update_distances(center)
+
+        self.assert_matches_full_computation()
+
+    def test_drag_node_closer(self):
+        # We move a corner node towards the center, some of its edges
+        # get shorter and others get longer
+        corner = self.graph.nodes[0]
+        corner.x, corner.y = 90, 90
+        self.graph.update_distances(corner)
+
+        self.assert_matches_full_computation()
+
+    def test_add_shortcut_edge(self):
+        nodes = self.graph.nodes
+        self.graph.add_edge(nodes[0], nodes[8])
+
+        self.assert_matches_full_computation()
+        self.assertEqual(self.service.shortest_paths[(0, 8)], [0, 8])
+
+    def test_add_and_link_node(self):
+        self.graph.add_node(300, 300)
+        self.graph.add_edge(self.graph.nodes[8], self.graph.nodes[9])
+
+        self.assert_matches_full_computation()
+
+    def test_remove_node(self):
+        self.graph.remove_node(self.graph.nodes[4])
+
+        self.assert_matches_full_computation()
+        self.assertEqual(self.service.nb_nodes, 8)
+
+    def test_isolated_node_gives_no_complete_graph(self):
+        self.graph.add_node(500, 500)
+        self.service.apply_changes(self.graph.pop_changes())
+
+        self.assertIsNone(self.service.complete_graph)
+
+    def test_repair_only_converts_the_changed_rows(self):
+        before = self.service.complete_graph
+        nodes = self.graph.nodes
+        self.graph.add_edge(nodes[0], nodes[8])
+
+        self.assert_matches_full_computation()
+
+        # We verify that the matrix read before is left as it was, and
+        # that the rows no shortcut improves are shared with it
+        after = self.service.complete_graph
+        self.assertEqual(before[0][8], 400)
+        self.assertLess(after[0][8], 400)
+        self.assertIs(after[1], before[1])
+        self.assertIsNot(after[0], before[0])
+
+    def test_shortest_paths_skip_the_unreachable_pairs(self):
+        self.graph.add_node(500, 500)
+        self.service.apply_changes(self.graph.pop_changes())
+
+        # We verify that the isolated node is in no key, so that every
+        # key gives a path
+        shortest_paths = self.service.shortest_paths
+        self.assertEqual(len(shortest_paths), 9 * 8)
+        self.assertEqual(len(dict(shortest_paths.items())), 9 * 8)
+        self.assertNotIn((0, 9), shortest_paths)
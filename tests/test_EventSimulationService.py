@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from models.algorithms.NaiveRuntime import NaiveRuntime
+from services.EventSimulationService import EventSimulationService
+from services.SimulationService import SimulationService
+from tests.utils import build_grid_graph
+
+class TestEventSimulationService(unittest.TestCase):
+    def setUp(self):
+        # We build a graph shaped like a grid of 3 x 3 nodes, 60 pixels
+        # apart, with its complete graph and shortest paths
+        self.graph = build_grid_graph(3, 3, 60)
+
+        # We add an agent staying on its node
+        self.paths = self.graph.compute_real_paths([[0, 8, 2], [4, 6]]) + [[5]]
+
+    def test_idleness_between_arrivals(self):
+        simulation = EventSimulationService(self.graph, [[0, 1, 2, 2, 1, 0]], speed=60)
+        simulation.advance(10.5)
+
+        # The agent goes back and forth every 4 seconds, so the last
+        # visits are at 8, 9 and 10 seconds
+        np.testing.assert_allclose(
+            simulation.get_idleness()[:3], [2.5, 1.5, 0.5]
+        )
+        np.testing.assert_allclose(simulation.agent_positions, [[90, 0]])
+        self.assertEqual(simulation.get_idleness_data()[2], 10.5)
+
+    def test_matches_fixed_step_simulation(self):
+        # We give each simulation its own graph, which records the visits
+        events = EventSimulationService(self.graph, self.paths, speed=37)
+        steps = SimulationService(build_grid_graph(3, 3, 60), self.paths, speed=37, time_step=0.5)
+
+        np.testing.assert_allclose(events.run(300, 7), steps.run(300, 7))
+        np.testing.assert_allclose(events.agent_positions, steps.agent_positions)
+
+    def test_one_event_per_moving_agent(self):
+        simulation = EventSimulationService(self.graph, self.paths)
+        simulation.advance(1000)
+
+        # The still agent never gets an arrival
+        self.assertEqual(
+            sorted(agent for _, agent in simulation._arrivals), [0, 1]
+        )
+
+    def test_runtime_algorithm_is_updated_at_arrivals(self):
+        algorithm = NaiveRuntime().initialize_algorithm(2, self.graph, seed=0)
+        paths = [path[:2] for path in self.graph.compute_real_paths(algorithm.launch())]
+
+        events = EventSimulationService(self.graph, paths, algorithm=algorithm)
+        samples = events.run(600, 60)
+
+        # We verify that the agents keep visiting every node
+        self.assertTrue(all(sample[3] < 60 for sample in samples))
+        self.assertTrue(all(len(path) == 2 for path in algorithm.paths))
@@ -0,0 +1,118 @@
+import unittest
+
+import numpy as np
+
+from models.algorithms.Evolutional import Evolutional
+from tests.utils import build_grid_graph
+
+class TestEvolutionalAlgorithm(unittest.TestCase):
+    def setUp(self):
+        # We build a graph shaped like a grid of 3 x 3 nodes with its
+        # complete graph and shortest paths
+        self.graph = build_grid_graph(3, 3, 100)
+
+        self.algorithm = Evolutional(
+            nb_iterations=5,
+            nb_individuals=10
+        ).initialize_algorithm(2, self.graph)
+
+    def naive_pareto_fronts(self, fitness_list):
+        # We peel the fronts one by one with the dominates method
+        remaining = list(range(len(fitness_list)))
+        fronts = []
+        while remaining:
+            front = [
+                i for i in remaining
+                if not any(
+                    self.algorithm.dominates(fitness_list[j], fitness_list[i])
+                    for j in remaining
+                )
+            ]
+            fronts.append(front)
+            remaining = [i for i in remaining if i not in front]
+        return fronts
+
+    def test_pareto_fronts_match_naive_peeling(self):
+        rng = np.random.default_rng(0)
+        # We use few distinct values to get many ties and duplicates
+        fitness_list = [
+            (float(occurrence), float(distance))
+            for occurrence, distance in rng.integers(0, 5, (300, 2))
+        ]
+        fitness_list[:3] = [(-float('inf'), float('inf'))] * 3
+
+        expected = self.naive_pareto_fronts(fitness_list)
+        fitness_array = self.algorithm.minimised_fitness(fitness_list)
+
+        # We verify both the dominance matrix and the sorting variants
+        for fronts in (
+            self.algorithm._pareto_fronts_with_dominance_matrix(fitness_array),
+            self.algorithm._pareto_fronts_with_sorting(fitness_array)
+        ):
+            self.assertEqual([front.tolist() for front in fronts], expected)
+
+    def test_crowding_distances_keep_extremes(self):
+        front_fitness = np.array(
+            [[0.0, 4.0], [1.0, 3.0], [2.0, 2.0], [2.1, 1.9], [4.0, 0.0]]
+        )
+
+        distances = self.algorithm.crowding_distances(front_fitness)
+
+        self.assertEqual(distances[0], np.inf)
+        self.assertEqual(distances[4], np.inf)
+        # The third individual is closer to its neighbours than the others
+        self.assertAlmostEqual(distances[1], 1.0)
+        self.assertAlmostEqual(distances[2], 0.55)
+        self.assertAlmostEqual(distances[3], 1.0)
+
+    def test_selection_truncates_last_front_by_crowding(self):
+        self.algorithm.indicative_paths_population = np.arange(6)
+        # The last individual is dominated, the others are in the same front
+        # since the mean node occurrence is maximised
+        fitness = [(0.0, 4.0), (-1.0, 3.0), (-2.0, 2.0), (-2.1, 1.9), (-4.0, 0.0), (-5.0, 5.0)]
+
+        selected = self.algorithm.selection_with_pareto(fitness, 4)
+
+        # The most crowded individual of the first front is the one left out
+        self.assertEqual(selected.tolist(), [0, 4, 1, 3])
+
+    def test_fitness_of_population(self):
+        self.algorithm.indicative_paths_population = np.array([
+            [[0, 1, 2, 5, 4], [3, 6, 7, 8, 3]],
+            # This individual never visits the node 8
+            [[0, 1, 2, 5, 4], [3, 6, 7, 7, 3]]
+        ], dtype=np.int32)
+
+        fitness = self.algorithm.fitness()
+
+        # The real paths go through 6 + 6 nodes (the way back from 4 to 0
+        # and from 8 to 3 go through other nodes), for 9 nodes in the graph
+        self.assertAlmostEqual(fitness[0][0], 12 / 9)
+        # The indicative paths are 400 and 600 long
+        self.assertAlmostEqual(fitness[0][1], 500)
+        # The invalid individual gets the worst fitness
+        self.assertEqual(fitness[1], (-float('inf'), float('inf')))
+
+    def test_hop_counts_follow_the_shortest_ways(self):
+        shortest_paths = self.graph.get_shortest_paths()
+
+        for (start, end), path in shortest_paths.items():
+            self.assertEqual(self.algorithm.hop_count_matrix[start, end], len(path) - 1)
+
+    def test_pareto_sort_and_best_individual_agree(self):
+        self.algorithm.indicative_paths_population = np.arange(3)
+        # The second individual occurs more with the same distance, and the
+        # last one is invalid
+        fitness = [(1.0, 500.0), (2.0, 500.0), (-float('inf'), float('inf'))]
+
+        selected = self.algorithm.selection_with_pareto(fitness, 1)
+
+        self.assertEqual(selected.tolist(), [1])
+        self.assertEqual(self.algorithm.find_best_individual(fitness), 1)
+
+    def test_launch_visits_every_node(self):
+        best_individual = self.algorithm.launch()
+
+        self.assertEqual(len(best_individual), 2)
+        visited = {int(node) for path in best_individual for node in path}
+        self.assertEqual(visited, set(range(9)))
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import Mock
+
+from views.GlyphCache import GlyphCache
+
+class TestGlyphCache(unittest.TestCase):
+    def setUp(self):
+        # We use a mocked font rendering a new object at each call
+        self.font = Mock()
+        self.font.render.side_effect = lambda *_: object()
+        self.cache = GlyphCache(cache_size=2)
+
+    def test_text_is_rendered_once(self):
+        first = self.cache.render(self.font, "12", (255, 255, 255))
+        second = self.cache.render(self.font, "12", [255, 255, 255])
+
+        self.assertIs(first, second)
+        self.font.render.assert_called_once_with("12", True, (255, 255, 255))
+
+    def test_texts_are_distinguished_by_color_and_font(self):
+        other_font = Mock()
+        other_font.render.side_effect = lambda *_: object()
+
+        white = self.cache.render(self.font, "12", (255, 255, 255))
+        black = self.cache.render(self.font, "12", (0, 0, 0))
+        other = self.cache.render(other_font, "12", (255, 255, 255))
+
+        self.assertIsNot(white, black)
+        self.assertIsNot(white, other)
+
+    def test_least_recently_used_text_is_forgotten(self):
+        self.cache.render(self.font, "10", (0, 0, 0))
+        self.cache.render(self.font, "11", (0, 0, 0))
+        # We use the first text again, so that the second one is the
+        # least recently used
+        self.cache.render(self.font, "10", (0, 0, 0))
+        self.cache.render(self.font, "12", (0, 0, 0))
+
+        self.assertEqual(len(self.cache), 2)
+        self.cache.render(self.font, "10", (0, 0, 0))
+        self.cache.render(self.font, "11", (0, 0, 0))
+        self.assertEqual(self.font.render.call_count, 4)
@@ -0,0 +1,106 @@
+import unittest
+
+from models.Graph import Graph
+
+class TestGraph(unittest.TestCase):
+    def setUp(self):
+        # We build a path of 4 nodes, 10 pixels apart, with an extra
+        # edge from the first node to the last one
+        self.graph = Graph()
+        for x in range(4):
+            self.graph.add_node(x * 10, 0)
+        self.nodes = list(self.graph.nodes)
+        for node1, node2 in zip(self.nodes, self.nodes[1:]):
+            self.graph.add_edge(node1, node2)
+        self.graph.add_edge(self.nodes[0], self.nodes[3])
+        self.graph.pop_changes()
+
+    def test_neighbors_of_a_node(self):
+        first, second, third, last = self.nodes
+
+        self.assertEqual(self.graph.get_neighbors(first), [second, last])
+        self.assertEqual(self.graph.get_neighbors(third), [second, last])
+
+    def test_remove_node_removes_its_edges(self):
+        first, second, third, last = self.nodes
+        self.graph.remove_node(second)
+
+        self.assertEqual(self.graph.get_neighbors(first), [last])
+        self.assertEqual(self.graph.get_neighbors(third), [last])
+        self.assertEqual(len(self.graph.edges), 4)
+        self.assertEqual(self.graph.pop_changes(), [('remove_node', 1)])
+
+        # We verify that the indices of the following nodes are shifted
+        self.graph.add_edge(first, third)
+        self.assertEqual(self.graph.pop_changes(), [('edge', 0, 1, 20.0)])
+
+    def test_update_distances_of_a_dragged_node(self):
+        first, second, third, last = self.nodes
+        self.graph.move_node(last, 20, 15)
+        self.graph.update_distances(last)
+
+        self.assertEqual(self.graph.edges[first, last], 25.0)
+        self.assertEqual(self.graph.edges[last, third], 15.0)
+        self.assertEqual(
+            self.graph.pop_changes(),
+            [('edge', 2, 3, 15.0), ('edge', 0, 3, 25.0)]
+        )
+
+    def test_version_follows_the_changes_of_the_drawing(self):
+        first, second, third, last = self.nodes
+        versions = [self.graph.version]
+
+        # We verify that each change of the nodes or edges increases the
+        # version, while reading the graph does not
+        self.graph.move_node(last, 20, 15)
+        versions.append(self.graph.version)
+        self.graph.update_distances(last)
+        versions.append(self.graph.version)
+        self.graph.compute_matrix()
+        self.graph.get_nodes_near(0, 0, 8)
+        self.assertEqual(self.graph.version, versions[-1])
+        self.graph.add_edge(first, third)
+        versions.append(self.graph.version)
+        self.graph.remove_node(second)
+        versions.append(self.graph.version)
+        self.graph.add_node(50, 50)
+        versions.append(self.graph.version)
+        self.graph.clear()
+        versions.append(self.graph.version)
+
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_compute_matrix(self):
+        edges_matrix, nodes_list = self.graph.compute_matrix()
+
+        self.assertEqual(edges_matrix, [
+            [0, 10.0, 0, 30.0],
+            [10.0, 0, 10.0, 0],
+            [0, 10.0, 0, 10.0],
+            [30.0, 0, 10.0, 0]
+        ])
+        self.assertEqual(nodes_list[3], (30, 0))
+
+    def test_clear(self):
+        self.graph.reset_idleness(5.0)
+        self.graph.clear()
+
+        # We verify that a node added afterwards has no neighbor, the
+        # first index and its own idleness
+        self.graph.add_node(0, 0)
+        node = self.graph.nodes[0]
+        self.assertEqual(len(self.graph.edges), 0)
+        self.assertEqual(self.graph.get_neighbors(node), [])
+        self.assertEqual(self.graph.get_nodes_near(0, 0, 8), [node])
+        self.assertEqual(self.graph.pop_changes(), [('add_node',)])
+        self.assertEqual(self.graph.get_idleness().tolist(), [0])
+
+    def test_compute_sparse_matrix(self):
+        sparse_matrix, positions = self.graph.compute_sparse_matrix()
+        edges_matrix, _ = self.graph.compute_matrix()
+
+        # We verify that only the edges are stored, with the same
+        # distances as the dense matrix
+        self.assertEqual(sparse_matrix.nnz, 8)
+        self.assertEqual(sparse_matrix.toarray().tolist(), edges_matrix)
+        self.assertEqual(positions.tolist(), [[0, 0], [10, 0], [20, 0], [30, 0]])
@@ -7,7 +7,6 @@ from constants.Config import GRAPH_WINDOW_WIDTH, GRAPH_WINDOW_HEIGHT
 from controllers.GraphController import GraphController
 from models.Graph import Graph
 from models.GraphData import GraphData
-from models.Node import Node
 from services.ICSVService import ICSVService
 from services.IImageService import IImageService
 from views.GraphView import GraphView
@@ -144,19 +143,17 @@ class TestGraphController(unittest.TestCase):
         self.graph_controller._load_graph.assert_called_once_with(graph_data)
 
     def test_clear_graph_remove_all_nodes_and_edges(self):
-        # We create nodes
-        node1 = Node(50, 50)
-        node2 = Node(100, 100)
-        # We add them into the nodes list
-        self.graph_controller.graph.nodes.append(node1)
-        self.graph_controller.graph.nodes.append(node2)
-
-        # We also add an edge between these two nodes
-        self.graph_controller.graph.edges.append((node1, node2))
-
-        # At the beginning, the number of nodes must be 2 and the number of edges 1
+        # We use a real graph with two nodes linked by an edge
+        graph = Graph()
+        graph.add_node(50, 50)
+        graph.add_node(100, 100)
+        graph.add_edge(*graph.nodes)
+        self.graph_controller._graph = graph
+
+        # At the beginning, the number of nodes must be 2 and the number
+        # of edges 2, one per direction
         self.assertEqual(len(self.graph_controller.graph.nodes), 2)
-        self.assertEqual(len(self.graph_controller.graph.edges), 1)
+        self.assertEqual(len(self.graph_controller.graph.edges), 2)
 
         # We call the clear_graph() method
         self.graph_controller.clear_graph()
@@ -164,6 +161,7 @@ class TestGraphController(unittest.TestCase):
         # We verify that the nodes list and edges have been cleared
         self.assertEqual(len(self.graph_controller.graph.nodes), 0)
         self.assertEqual(len(self.graph_controller.graph.edges), 0)
+        self.assertEqual(graph.get_nodes_near(50, 50, 8), [])
     
     def test_graph_has_an_image(self):
         # We verify that he graph_has_an_image() method returns true when the
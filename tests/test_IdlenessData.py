@@ -0,0 +1,52 @@
+import unittest
+
+from models.Graph import Graph
+from models.IdlenessData import IdlenessData
+
+class TestIdlenessData(unittest.TestCase):
+    def setUp(self):
+        # We build a graph of 3 nodes, all visited at the start
+        self.graph = Graph()
+        for x in range(3):
+            self.graph.add_node(x * 10, 0)
+        self.graph.reset_idleness(10.0)
+        self.idleness_data = IdlenessData()
+
+    def test_idleness_is_the_time_since_the_last_visit(self):
+        self.graph.visit_nodes(1, 12.5)
+        self.graph.set_idleness_time(14.0)
+
+        self.assertEqual(self.graph.get_idleness().tolist(), [4.0, 1.5, 4.0])
+
+    def test_idleness_is_null_without_simulation(self):
+        self.graph.add_node(30, 0)
+
+        self.assertEqual(self.graph.get_idleness().tolist(), [0, 0, 0, 0])
+
+    def test_several_visits_of_a_node_at_once(self):
+        self.graph.visit_nodes([2, 0, 2], [13.0, 11.0, 12.0])
+        self.graph.set_idleness_time(15.0)
+
+        # We verify that the first visit gives the highest idleness
+        # and the last one the current idleness
+        self.assertEqual(self.graph.get_idleness().tolist(), [4.0, 5.0, 2.0])
+        self.assertEqual(self.graph.highest_idleness, 2.0)
+
+    def test_all_time_highest_idleness_includes_idleness_between_updates(self):
+        self.graph.set_idleness_time(12.0)
+        self.idleness_data.update_idleness(self.graph)
+        self.graph.visit_nodes(0, 16.0)
+        self.graph.set_idleness_time(16.0)
+        self.idleness_data.update_idleness(self.graph)
+
+        average, max_idleness, all_time_max = self.idleness_data.get_idleness_data()
+        self.assertAlmostEqual(average, 4.0)
+        self.assertEqual(max_idleness, 6.0)
+        self.assertEqual(all_time_max, 6.0)
+
+        # We verify that the idleness reached by nodes 1 and 2 just
+        # before their visit is kept, though it is never read
+        self.graph.set_idleness_time(17.0)
+        self.graph.visit_nodes([1, 2], 17.0)
+        self.idleness_data.update_idleness(self.graph)
+        self.assertEqual(self.idleness_data.get_idleness_data(), (1 / 3, 1.0, 7.0))
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from models.Graph import Graph
+from models.algorithms.KMeans import KMeans
+
+class TestKMeansAlgorithm(unittest.TestCase):
+    def setUp(self):
+        # We build three groups of nodes far away from each other, the
+        # first group having two nodes at the same coordinates
+        self.positions = [
+            (0, 0), (0, 0), (10, 0), (0, 10),
+            (500, 0), (510, 0), (500, 10),
+            (0, 500), (10, 500), (0, 510), (10, 510)
+        ]
+        self.graph = Graph()
+        for x, y in self.positions:
+            self.graph.add_node(x, y)
+        # We use the straight line distances as complete graph
+        self.distances = cdist(self.positions, self.positions)
+        self.graph.set_complete_adjacency_matrix(self.distances.tolist())
+
+        self.algorithm = KMeans(nb_launch_kmeans=5).initialize_algorithm(3, self.graph)
+        self.algorithm._rng = np.random.default_rng(0)
+
+    def test_group_nodes_finds_the_groups(self):
+        self.algorithm._group_nodes()
+
+        clusters = sorted(
+            cluster.tolist() for cluster in self.algorithm._clusters.values()
+        )
+        self.assertEqual(
+            clusters,
+            [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9, 10]]
+        )
+
+    def test_actualize_centers_of_every_launch(self):
+        # We attribute the nodes of two launches by hand, the third
+        # cluster of the second launch being empty
+        clusters_attribution = np.array(
+            [[0, 0]] * 4 + [[1, 1]] * 3 + [[2, 0]] * 4
+        )
+        centers = np.full((2, 3, 2), -1.0)
+        centers = self.algorithm._actualize_centers(clusters_attribution, centers)
+
+        positions = np.array(self.positions, dtype=float)
+        np.testing.assert_allclose(centers[0, 0], positions[:4].mean(axis=0))
+        np.testing.assert_allclose(centers[0, 2], positions[7:].mean(axis=0))
+        np.testing.assert_allclose(
+            centers[1, 0],
+            np.concatenate((positions[:4], positions[7:])).mean(axis=0)
+        )
+        np.testing.assert_allclose(centers[1, 2], [-1.0, -1.0])
+
+    def test_create_distance_matrix_slices_the_complete_graph(self):
+        cluster = np.array([4, 0, 1])
+
+        np.testing.assert_array_equal(
+            self.algorithm.create_distance_matrix(cluster),
+            self.distances[np.ix_(cluster, cluster)]
+        )
+        self.assertEqual(
+            self.algorithm.reconstruct_solution(cluster, np.array([2, 0, 1])),
+            [1, 4, 0]
+        )
+
+    def test_launch_visits_every_node_once(self):
+        paths = self.algorithm.launch()
+
+        self.assertEqual(len(paths), 3)
+        self.assertEqual(
+            sorted(node for path in paths for node in path),
+            list(range(len(self.positions)))
+        )
+
+    def test_random_seeding(self):
+        self.algorithm._kmeans_plus_plus = False
+        centers = self.algorithm._initialize_centers(4)
+
+        self.assertEqual(centers.shape, (4, 3, 2))
+        self.algorithm._group_nodes()
+        self.assertEqual(
+            sum(len(cluster) for cluster in self.algorithm._clusters.values()),
+            len(self.positions)
+        )
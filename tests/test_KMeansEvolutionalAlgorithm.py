@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from services.algorithms.KMeansEvolutionalAlgorithm import KMeansEvolutionalAlgorithm
+
+class TestKMeansEvolutionalAlgorithm(unittest.TestCase):
+    def setUp(self):
+        # We place 12 nodes on a circle in a shuffled order, so that the
+        # best tour is the regular polygon
+        rng = np.random.default_rng(0)
+        self.angles = rng.permutation(12) * 2 * np.pi / 12
+        points = np.column_stack((np.cos(self.angles), np.sin(self.angles)))
+        self.distances = cdist(points, points)
+        self.algorithm = KMeansEvolutionalAlgorithm(12, self.distances)
+        self.algorithm._rng = np.random.default_rng(0)
+        self.algorithm._init_ag()
+
+    def assert_permutations(self, population):
+        # We verify that every individual visits every node once
+        np.testing.assert_array_equal(
+            np.sort(population, axis=1),
+            np.tile(np.arange(12), (len(population), 1))
+        )
+
+    def test_compute_fitness_is_the_tour_length(self):
+        fitness = self.algorithm._compute_fitness()
+
+        for individual, length in zip(self.algorithm._population, fitness):
+            expected = sum(
+                self.distances[individual[j], individual[(j + 1) % 12]]
+                for j in range(12)
+            )
+            self.assertAlmostEqual(length, expected)
+
+    def test_mutation_reverses_one_segment(self):
+        children = self.algorithm._population
+        mutants = self.algorithm._mutation_rsm(children, mutation_rate=1.0)
+
+        self.assert_permutations(mutants)
+        for child, mutant in zip(children, mutants):
+            changed = np.flatnonzero(child != mutant)
+            if len(changed) == 0:
+                continue
+            # We verify that the changed genes are a reversed segment
+            start, stop = changed[0], changed[-1] + 1
+            np.testing.assert_array_equal(
+                mutant[start:stop], child[start:stop][::-1]
+            )
+
+    def test_crossover_keeps_permutations(self):
+        children = self.algorithm._crossover(self.algorithm._population, 30)
+
+        self.assertEqual(children.shape, (30, 12))
+        self.assert_permutations(children)
+
+    def test_run_finds_the_polygon(self):
+        solution, length = self.algorithm._optimize()
+
+        self.assert_permutations(solution[None, :])
+        self.assertAlmostEqual(length, 12 * 2 * np.sin(np.pi / 12))
+
+    def test_run_stops_on_stagnation(self):
+        # We start from the best tour, so the population can not improve
+        order = np.argsort(self.angles)
+        self.algorithm._population[:] = order
+        self.algorithm._max_stagnation = 5
+
+        calls = []
+        compute_fitness = self.algorithm._compute_fitness
+        self.algorithm._compute_fitness = lambda: calls.append(1) or compute_fitness()
+        self.algorithm._optimize()
+
+        self.assertEqual(len(calls), 6)
+
+    def test_run_with_few_nodes(self):
+        self.assertEqual(
+            KMeansEvolutionalAlgorithm(2, self.distances[:2, :2]).run()[0].tolist(),
+            [0, 1]
+        )
+        self.assertEqual(
+            KMeansEvolutionalAlgorithm(0, np.empty((0, 0))).run()[0].tolist(),
+            []
+        )
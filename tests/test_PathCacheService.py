@@ -0,0 +1,87 @@
+import os
+import tempfile
+import time
+import unittest
+
+from models.Graph import Graph
+from models.algorithms.AntColony import AntColony
+from services.PathCacheService import PathCacheService
+
+class TestPathCacheService(unittest.TestCase):
+    def setUp(self):
+        # We build a triangle with its complete graph
+        self.graph = Graph()
+        for x, y in [(0, 0), (100, 0), (0, 100)]:
+            self.graph.add_node(x, y)
+        self.graph.set_complete_adjacency_matrix(
+            [[0, 100, 100], [100, 0, 141.42], [100, 141.42, 0]]
+        )
+        self.model = AntColony()
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.service = PathCacheService(self.folder.name)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_get_stored_paths(self):
+        self.assertIsNone(self.service.get(self.model, 2, self.graph, 1))
+
+        self.service.put(self.model, 2, self.graph, 1, [[0, 1], [2]])
+
+        self.assertEqual(
+            self.service.get(self.model, 2, self.graph, 1),
+            ([[0, 1], [2]], 1)
+        )
+        self.assertIsNone(self.service.get(self.model, 2, self.graph, 2))
+        self.assertIsNone(self.service.get(self.model, 3, self.graph, 1))
+
+    def test_any_seed_gives_the_most_recent_paths(self):
+        self.service.put(self.model, 2, self.graph, 1, [[0, 1], [2]])
+        time.sleep(0.01)
+        self.service.put(self.model, 2, self.graph, 2, [[0], [1, 2]])
+
+        self.assertEqual(
+            self.service.get(self.model, 2, self.graph),
+            ([[0], [1, 2]], 2)
+        )
+
+    def test_parameters_and_graph_change_the_key(self):
+        self.service.put(self.model, 2, self.graph, 1, [[0, 1], [2]])
+
+        nb_iterations = self.model.parameters["Nb iterations"].text_content
+        self.model.parameters["Nb iterations"].text_content = "7"
+        self.assertIsNone(self.service.get(self.model, 2, self.graph, 1))
+        self.model.parameters["Nb iterations"].text_content = nb_iterations
+        self.assertIsNotNone(self.service.get(self.model, 2, self.graph, 1))
+
+        self.graph.nodes[0].x = 10
+        self.assertIsNone(self.service.get(self.model, 2, self.graph, 1))
+
+    def test_paths_of_another_version_are_not_used(self):
+        self.service.put(self.model, 2, self.graph, 1, [[0, 1], [2]])
+
+        service = PathCacheService(self.folder.name, version=2)
+        self.assertIsNone(service.get(self.model, 2, self.graph, 1))
+        self.assertIsNone(service.get(self.model, 2, self.graph))
+
+    def test_least_recently_used_paths_are_removed(self):
+        self.service.put(self.model, 2, self.graph, 1, [[0, 1], [2]])
+        entry_size = sum(
+            os.path.getsize(os.path.join(self.folder.name, file))
+            for file in os.listdir(self.folder.name)
+        )
+        service = PathCacheService(self.folder.name, max_size=2 * entry_size)
+
+        # We read the first paths again, so that the second ones are
+        # the least recently used
+        time.sleep(0.01)
+        service.put(self.model, 2, self.graph, 2, [[1, 0], [2]])
+        time.sleep(0.01)
+        service.get(self.model, 2, self.graph, 1)
+        time.sleep(0.01)
+        service.put(self.model, 2, self.graph, 3, [[2, 0], [1]])
+
+        self.assertIsNotNone(service.get(self.model, 2, self.graph, 1))
+        self.assertIsNone(service.get(self.model, 2, self.graph, 2))
+        self.assertIsNotNone(service.get(self.model, 2, self.graph, 3))
@@ -0,0 +1,120 @@
+import csv
+import os
+import tempfile
+import threading
+import unittest
+
+from services.ResultsWriter import RESULTS_HEADER, ResultsWriter, prepare_results_file
+
+class TestResultsWriter(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.folder.name, "graph_1_results.csv")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _read_rows(self):
+        with open(self.csv_path, newline="") as results:
+            return list(csv.reader(results))
+
+    def test_samples_are_written_when_stopped(self):
+        # We sample every 10 milliseconds with a buffer bigger than the
+        # number of samples, so that nothing is written before the stop
+        sampled = threading.Event()
+        samples = []
+
+        def idleness_data_provider():
+            samples.append(len(samples))
+            if len(samples) == 5:
+                sampled.set()
+            return (1.0, 2.0, 3.0)
+
+        writer = ResultsWriter(
+            self.csv_path,
+            idleness_data_provider,
+            lambda: True,
+            lambda: 0.5,
+            "Ant Colony",
+            4,
+            seed=7,
+            interval=0.01,
+            buffer_size=1000,
+            flush_interval=60
+        )
+        writer.start()
+        self.assertTrue(sampled.wait(5))
+        writer.stop()
+
+        self.assertFalse(writer.is_alive())
+        rows = self._read_rows()
+        self.assertEqual(rows[0], RESULTS_HEADER)
+        self.assertEqual(len(rows) - 1, len(samples))
+        self.assertEqual(rows[1], ["Ant Colony", "4", "0.5", "1.0", "2.0", "3.0", "7"])
+
+    def test_writer_stops_with_the_simulation(self):
+        # We write a first results file, then verify that a second
+        # writer appends to it without writing the header again
+        for test_number in (1, 2):
+            running = iter([True, False])
+            writer = ResultsWriter(
+                self.csv_path,
+                lambda: (1.0, 2.0, 3.0),
+                lambda: next(running),
+                lambda: 10.0,
+                "Ant Colony",
+                test_number,
+                interval=0.01
+            )
+            writer.start()
+            writer._thread.join(5)
+            self.assertFalse(writer.is_alive())
+
+        rows = self._read_rows()
+        self.assertEqual(rows[0], RESULTS_HEADER)
+        self.assertEqual([row[1] for row in rows[1:]], ["1", "2"])
+
+    def test_results_without_seed_are_migrated(self):
+        # We write a results file of the versions without a seed
+        with open(self.csv_path, mode="w", newline="") as results:
+            writer = csv.writer(results)
+            writer.writerow([
+                "Algorithm", "Test Number",
+                "Simulation Time (s)", "Average Idleness",
+                "Current Max Idleness", "All-time Max Idleness"
+            ])
+            writer.writerow(["Ant Colony", "1", "10.0", "1.0", "2.0", "3.0"])
+
+        running = iter([True, False])
+        writer = ResultsWriter(
+            self.csv_path,
+            lambda: (4.0, 5.0, 6.0),
+            lambda: next(running),
+            lambda: 10.0,
+            "Ant Colony",
+            2,
+            seed=7,
+            interval=0.01
+        )
+        writer.start()
+        writer._thread.join(5)
+
+        # We verify that the old rows get an empty seed, so that every
+        # row has the columns of the header
+        self.assertEqual(self._read_rows(), [
+            RESULTS_HEADER,
+            ["Ant Colony", "1", "10.0", "1.0", "2.0", "3.0", ""],
+            ["Ant Colony", "2", "10.0", "4.0", "5.0", "6.0", "7"]
+        ])
+
+    def test_results_with_unknown_columns_are_kept(self):
+        with open(self.csv_path, mode="w", newline="") as results:
+            results.write("Algorithm,Score\n")
+
+        with self.assertRaises(ValueError):
+            prepare_results_file(self.csv_path)
+        self.assertEqual(self._read_rows(), [["Algorithm", "Score"]])
+
+    def test_interval_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ResultsWriter(self.csv_path, None, None, None, "Ant Colony", 1, interval=0)
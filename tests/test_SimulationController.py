@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from controllers.GraphController import GraphController
+from controllers.SimulationController import SimulationController
+from models.Graph import Graph
+
+class TestSimulationController(unittest.TestCase):
+    def setUp(self):
+        # We build a line of 3 nodes, 60 pixels apart, so that an agent
+        # reaches a node every second
+        self.graph = Graph()
+        for x in range(3):
+            self.graph.add_node(x * 60, 0)
+
+        self.graph_controller = Mock(spec=GraphController)
+        self.graph_controller.graph = self.graph
+        self.graph_controller.reset_nodes_idleness.side_effect = self.graph.reset_idleness
+        self.simulation_controller = SimulationController(self.graph_controller)
+
+    @patch('pygame.time.get_ticks', return_value=2000)
+    def test_agents_reset_the_idleness_of_the_nodes_they_reach(self, mock_get_ticks):
+        self.simulation_controller.initialize_agents([[0, 1, 2, 1]])
+        self.simulation_controller.set_simulation_started(True)
+
+        # We verify that the simulation is advanced by the time between
+        # two frames, with a precision below the frame
+        mock_get_ticks.return_value = 2250
+        self.simulation_controller.draw_simulation()
+        mock_get_ticks.return_value = 4500
+        self.simulation_controller.draw_simulation()
+
+        self.assertEqual(self.graph.get_idleness().tolist(), [2.5, 1.5, 0.5])
+        positions = self.graph_controller.draw_simulation.call_args[0][0]
+        self.assertEqual(positions.tolist(), [[90, 0]])
+
+    @patch('pygame.time.get_ticks', return_value=0)
+    def test_gui_follows_the_headless_simulation(self, mock_get_ticks):
+        # We add an agent staying on its node
+        self.simulation_controller.initialize_agents([[0, 1], [2]])
+        self.simulation_controller.set_simulation_started(True)
+
+        for tick in range(100, 3100, 100):
+            mock_get_ticks.return_value = tick
+            self.simulation_controller.draw_simulation()
+
+        # We verify that the node of the staying agent is never idle, as
+        # in the simulation of a batch
+        simulation = self.simulation_controller.simulation
+        self.assertAlmostEqual(simulation.time, 3.0)
+        np.testing.assert_allclose(self.graph.get_idleness(), [1, 0, 0], atol=1e-9)
+        np.testing.assert_allclose(simulation.get_idleness(), [1, 0, 0], atol=1e-9)
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from models.Graph import Graph
+from services.SimulationService import SimulationService
+from simulate import simulate
+
+class TestSimulationService(unittest.TestCase):
+    def setUp(self):
+        # We build a line of 3 nodes, 60 pixels apart, so that an agent
+        # needs one second to go from a node to the next one
+        self.graph = Graph()
+        for x in range(3):
+            self.graph.add_node(x * 60, 0)
+        nodes = self.graph.nodes
+        self.graph.add_edge(nodes[0], nodes[1])
+        self.graph.add_edge(nodes[1], nodes[2])
+
+        # We use a closed path like the ones of the GUI
+        self.path = [0, 1, 2, 2, 1, 0]
+
+    def test_idleness_is_the_time_since_the_last_visit(self):
+        simulation = SimulationService(self.graph, [self.path], speed=60)
+        simulation.advance(10)
+
+        # The agent goes back and forth every 4 seconds, so the last
+        # visits are at 8, 9 and 10 seconds
+        np.testing.assert_allclose(simulation.get_idleness(), [2, 1, 0])
+        self.assertEqual(simulation.get_idleness_data(), (1.0, 2.0, 4.0))
+
+    def test_arrivals_do_not_depend_on_the_time_step(self):
+        long_steps = SimulationService(
+            self.graph, [self.path], speed=45, time_step=7
+        )
+        short_steps = SimulationService(
+            self.graph, [self.path], speed=45, time_step=0.1
+        )
+        long_steps.advance(50)
+        short_steps.advance(50)
+
+        np.testing.assert_allclose(
+            long_steps.get_idleness(), short_steps.get_idleness()
+        )
+        self.assertAlmostEqual(
+            long_steps.get_idleness_data()[2],
+            short_steps.get_idleness_data()[2]
+        )
+
+    def test_agent_positions(self):
+        simulation = SimulationService(
+            self.graph, [self.path, [2]], speed=60, time_step=0.25
+        )
+        simulation.advance(1.5)
+
+        np.testing.assert_allclose(
+            simulation.agent_positions, [[90, 0], [120, 0]]
+        )
+
+    def test_agents_on_nodes(self):
+        simulation = SimulationService(
+            self.graph, [self.path, [2]], speed=60, time_step=0.25
+        )
+        simulation.advance(1.5)
+        # We verify that only the agent staying on its node is on one
+        # between two arrivals of the other agent
+        self.assertEqual(simulation.agents_on_nodes().tolist(), [-1, 2])
+
+        simulation.advance(0.5)
+        self.assertEqual(simulation.agents_on_nodes().tolist(), [2, 2])
+
+    def test_node_with_a_still_agent_is_never_idle(self):
+        simulation = SimulationService(self.graph, [[2]])
+        simulation.advance(30)
+
+        np.testing.assert_allclose(simulation.get_idleness(), [30, 30, 0])
+
+    def test_run_samples_at_regular_intervals(self):
+        simulation = SimulationService(self.graph, [self.path], speed=60)
+        samples = simulation.run(100, interval=10)
+
+        self.assertEqual([sample[0] for sample in samples], list(range(10, 110, 10)))
+        self.assertEqual(samples[-1], (100.0, 1.0, 2.0, 4.0))
+
+    def test_simulate_graph_file_with_runtime_algorithm(self):
+        # We save a square of 4 nodes the way the GUI does
+        with tempfile.TemporaryDirectory() as folder:
+            csv_path = os.path.join(folder, "graph_1.csv")
+            with open(csv_path, "w") as f:
+                f.write("Nodes,(0, 0),(100, 0),(100, 100),(0, 100),\n")
+                f.write("Simple Graph,\n")
+                f.write("0,100.0,0,100.0\n100.0,0,100.0,0\n")
+                f.write("0,100.0,0,100.0\n100.0,0,100.0,0\n")
+                f.write("Image_ref,image.png\n")
+
+            samples = simulate(
+                csv_path, "Naive Algorithm Runtime", 2, 600, interval=60
+            )
+
+        self.assertEqual(len(samples), 10)
+        # We verify that the agents keep visiting every node
+        self.assertTrue(all(sample[3] < 60 for sample in samples))
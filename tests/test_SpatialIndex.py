@@ -0,0 +1,63 @@
+import unittest
+
+from models.Graph import Graph
+from models.Node import Node
+from models.SpatialIndex import SpatialIndex
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        # We place nodes on both sides of the border between two cells
+        self.index = SpatialIndex(cell_size=32)
+        self.nodes = [Node(30, 5), Node(34, 100), Node(200, 7), Node(-40, 60)]
+        for node in self.nodes:
+            self.index.add(node)
+
+    def test_nodes_near_a_point(self):
+        self.assertEqual(self.index.nodes_near(32, 5, 8), [self.nodes[0]])
+        self.assertEqual(self.index.nodes_near(-38, 58, 8), [self.nodes[3]])
+        self.assertEqual(self.index.nodes_near(100, 50, 8), [])
+
+    def test_last_node_aligned(self):
+        self.assertIs(self.index.last_node_aligned("x", 32, 10), self.nodes[1])
+        self.assertIs(self.index.last_node_aligned("y", 0, 10), self.nodes[2])
+        self.assertIs(
+            self.index.last_node_aligned("y", 0, 10, excluded=self.nodes[2]),
+            self.nodes[0]
+        )
+        self.assertIsNone(self.index.last_node_aligned("x", 100, 10))
+        with self.assertRaises(ValueError):
+            self.index.last_node_aligned("z", 0, 10)
+
+    def test_moved_and_removed_nodes(self):
+        node = self.nodes[0]
+        node.x, node.y = 500, 500
+        self.index.update(node)
+        self.index.remove(self.nodes[2])
+
+        self.assertEqual(self.index.nodes_near(500, 500, 8), [node])
+        self.assertIsNone(self.index.last_node_aligned("y", 0, 10))
+        self.assertEqual(len(self.index), 3)
+        # We verify that the empty cells are forgotten
+        self.assertNotIn((0, 0), self.index._cells)
+
+    def test_graph_keeps_its_index_up_to_date(self):
+        graph = Graph()
+        for x, y in [(0, 0), (100, 3), (100, 200)]:
+            graph.add_node(x, y)
+        first, second, third = graph.nodes
+
+        graph.move_node(third, 5, 300)
+        self.assertEqual(graph.get_nodes_near(5, 300, 8), [third])
+
+        # We verify that the last added aligned node is the candidate
+        # on each axis
+        self.assertEqual(
+            graph.find_aligned_nodes(first),
+            {"x": third, "y": second}
+        )
+
+        graph.remove_node(second)
+        self.assertEqual(graph.get_nodes_near(100, 3, 8), [])
+
+        graph.clear()
+        self.assertEqual(graph.get_nodes_near(0, 0, 8), [])
@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from batch import MANIFEST_FILENAME, build_runs, run_batch
+from services.CSVService import CSVService
+from simulate import get_algorithm_model
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        # We save a square of 4 nodes the way the GUI does
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.folder.name, "graph_1.csv")
+        with open(self.csv_path, "w") as f:
+            f.write("Nodes,(0, 0),(100, 0),(100, 100),(0, 100),\n")
+            f.write("Simple Graph,\n")
+            f.write("0,100.0,0,100.0\n100.0,0,100.0,0\n")
+            f.write("0,100.0,0,100.0\n100.0,0,100.0,0\n")
+            f.write("Image_ref,image.png\n")
+        self.output_folder = os.path.join(self.folder.name, "results")
+        self.test_numbers_path = os.path.join(self.folder.name, "test_numbers.csv")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _read_results(self) -> list[dict]:
+        with open(os.path.join(self.output_folder, "graph_1_results.csv"), newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_build_runs_with_parameter_grid(self):
+        runs = build_runs(
+            [self.csv_path],
+            ["naive algorithm", "Ant Colony Algorithm"],
+            [1, 2],
+            [7],
+            parameter_grid={"Nb iterations": ["5", "10"]}
+        )
+
+        # We verify that the grid only applies to the algorithms having
+        # the parameter
+        self.assertEqual(len(runs), 2 + 4)
+        self.assertEqual(runs[0]["algorithm"], "Naive Algorithm")
+        self.assertEqual(runs[0]["parameters"], {})
+        self.assertEqual(
+            [run["parameters"]["Nb iterations"] for run in runs[2:]],
+            ["5", "5", "10", "10"]
+        )
+
+    def test_algorithm_workers_only_apply_to_the_ant_colony(self):
+        # We verify that the pool of the ant colony can be turned on from
+        # the scripts, while the other algorithms run in one process
+        ant_colony = get_algorithm_model("Ant Colony Algorithm", nb_workers=2)
+        self.assertEqual(ant_colony.nb_workers, 2)
+        get_algorithm_model("Naive Algorithm", nb_workers=2)
+        with self.assertRaises(ValueError):
+            get_algorithm_model("Ant Colony Algorithm", nb_workers=0)
+
+    def test_results_are_written_for_analyse(self):
+        runs = build_runs([self.csv_path], ["Naive Algorithm"], [1, 2], [1])
+        done = run_batch(
+            runs, 60, interval=20, output_folder=self.output_folder, workers=1,
+            test_numbers_path=self.test_numbers_path
+        )
+
+        rows = self._read_results()
+        self.assertEqual(
+            list(rows[0].keys()),
+            [
+                "Algorithm", "Test Number",
+                "Simulation Time (s)", "Average Idleness",
+                "Current Max Idleness", "All-time Max Idleness",
+                "Seed"
+            ]
+        )
+        self.assertEqual(len(rows), 2 * 3)
+        self.assertEqual({row["Test Number"] for row in rows}, {"1", "2"})
+        self.assertEqual(sorted(run["test_number"] for run in done), [1, 2])
+
+    def test_resume_skips_the_runs_already_done(self):
+        runs = build_runs([self.csv_path], ["Naive Algorithm"], [1, 2], [1, 2])
+        run_batch(
+            runs[:3], 60, interval=20, output_folder=self.output_folder, workers=1,
+            test_numbers_path=self.test_numbers_path
+        )
+
+        # We verify that an existing batch is not overwritten by mistake
+        with self.assertRaises(ValueError):
+            run_batch(
+                runs, 60, interval=20, output_folder=self.output_folder, workers=1,
+                test_numbers_path=self.test_numbers_path
+            )
+
+        done = run_batch(
+            runs, 60, interval=20, output_folder=self.output_folder, workers=1, resume=True,
+            test_numbers_path=self.test_numbers_path
+        )
+
+        self.assertEqual(len(done), 1)
+        self.assertEqual(done[0]["test_number"], 4)
+        self.assertEqual(len(self._read_results()), 4 * 3)
+        with open(os.path.join(self.output_folder, MANIFEST_FILENAME)) as f:
+            self.assertEqual(len([json.loads(line) for line in f]), 4)
+
+    def test_gui_numbers_its_tests_after_the_batch(self):
+        runs = build_runs([self.csv_path], ["Naive Algorithm"], [1, 2], [1])
+        run_batch(
+            runs, 60, interval=20, output_folder=self.output_folder, workers=1,
+            test_numbers_path=self.test_numbers_path
+        )
+
+        # We verify that the GUI does not reuse the numbers of the batch
+        # on the same graph
+        csv_service = CSVService()
+        csv_service._test_numbers_file_path = self.test_numbers_path
+        self.assertEqual(csv_service.get_next_test_number("Naive Algorithm", 1), 3)
+
+        # ...and that a new batch follows the test of the GUI
+        done = run_batch(
+            runs[:1], 60, interval=20, output_folder=self.folder.name, workers=1,
+            test_numbers_path=self.test_numbers_path
+        )
+        self.assertEqual(done[0]["test_number"], 4)
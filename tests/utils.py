@@ -0,0 +1,35 @@
+from models.Graph import Graph
+from services.CompleteGraphService import CompleteGraphService
+from services.DijkstraService import DijkstraService
+
+def build_grid_graph(rows: int, columns: int, spacing: float) -> Graph:
+    """
+    Builds a graph shaped like a grid, each node being linked to the
+    next one on its row and on its column, with its complete graph and
+    shortest paths.
+
+    Args:
+        rows (int): The number of rows of the grid.
+        columns (int): The number of nodes of each row.
+        spacing (float): The distance between two linked nodes, in
+            pixels.
+
+    Returns:
+        Graph: The graph, whose nodes are numbered row by row.
+    """
+    graph = Graph()
+    for y in range(rows):
+        for x in range(columns):
+            graph.add_node(x * spacing, y * spacing)
+    nodes = graph.nodes
+    for i in range(rows * columns):
+        if i % columns < columns - 1:
+            graph.add_edge(nodes[i], nodes[i + 1])
+        if i < (rows - 1) * columns:
+            graph.add_edge(nodes[i], nodes[i + columns])
+
+    simple_graph, _ = graph.compute_matrix()
+    service = CompleteGraphService(simple_graph, DijkstraService)
+    graph.set_complete_adjacency_matrix(service.complete_graph)
+    graph.set_shortest_paths(service.shortest_paths)
+    return graph
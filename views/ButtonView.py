@@ -4,6 +4,7 @@ from constants.Config import GRAPH_WINDOW_WIDTH
 from constants.Colors import Colors
 
 from utils.utils import resource_path
+from views.GlyphCache import glyph_cache
 
 class ButtonView:
     """
@@ -111,7 +112,7 @@ class ButtonView:
 
             button_surface.blit(self._icon, (icon_x, icon_y))
 
-        text = self._font.render(self._text, True, self._text_color.value)
+        text = glyph_cache.render(self._font, self._text, self._text_color.value)
         text_rect = text.get_rect(
             center=(
                 self._width / 2 + (self._icon.get_width() if self._icon else 0) / 2,
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+import pygame
+
+from constants.Config import GLYPH_CACHE_SIZE
+
+class GlyphCache:
+    """
+    This class keeps the surfaces of rendered texts, so that a text
+    drawn at each frame is only rendered once by its font.
+
+    The least recently used surfaces are forgotten when the cache is
+    full.
+
+    Attributes:
+        _cache_size (int): The maximum number of surfaces kept.
+        _cache (OrderedDict): The surfaces by text, color and font,
+            from the least to the most recently used.
+    """
+    def __init__(self, cache_size: int = GLYPH_CACHE_SIZE) -> None:
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """
+        Returns the surface of an antialiased text, rendering it only if
+        it is not cached.
+
+        Args:
+            font (pygame.font.Font): The font of the text.
+            text (str): The text to be rendered.
+            color (tuple[int, int, int]): The color of the text.
+
+        Returns:
+            pygame.Surface: The rendered text, which must not be
+                modified as it is shared.
+        """
+        key = (text, tuple(color), font)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+
+        self._cache[key] = surface
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return surface
+
+
+# Shared by the views, as the same labels are drawn by several of them
+glyph_cache = GlyphCache()
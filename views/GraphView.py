@@ -1,14 +1,15 @@
 from typing import Optional
 
+import numpy as np
 import pygame
 
 from constants.Colors import Colors
 from constants.Config import NODE_RADIUS, GRAPH_WINDOW_WIDTH, \
     GRAPH_WINDOW_HEIGHT, MAX_IDLENESS
-from models.Agent import Agent
 from models.Graph import Graph
 from models.Node import Node
 from views.AgentView import AgentView
+from views.GlyphCache import glyph_cache
 from views.popup.PopupView import PopupView
 from views.popup.InfoPopupView import InfoPopupView
 from views.popup.ErrorPopupView import ErrorPopupView
@@ -26,6 +27,17 @@ class GraphView:
             other UI elements are drawn.
         _background_image (Optional[pygame.Surface]): The background
             image for the graph view, or None if no background is set.
+        _static_layer (Optional[pygame.Surface]): The background and
+            the edges, drawn again only when the graph changes.
+        _static_key (Optional[tuple]): The graph drawn on the static
+            layer, with its version.
+        _nodes_layer (Optional[pygame.Surface]): The static layer with
+            the nodes, drawn again only when the idleness of a node
+            reaches another second or the selection changes.
+        _nodes_key (Optional[tuple]): The selection and the idleness,
+            in whole seconds, of the nodes drawn on the nodes layer.
+        _agent_views (list[AgentView]): The views of the agents, kept
+            from one frame to the next.
     """
     def __init__(self, screen: pygame.Surface) -> None:
         self._screen = screen
@@ -37,6 +49,12 @@ class GraphView:
         self._margin_color = None
         self._popup = None
         self._font = pygame.font.SysFont("Arial", 16)
+        self._message_font = pygame.font.SysFont(None, 24)
+        self._static_layer = None
+        self._static_key = None
+        self._nodes_layer = None
+        self._nodes_key = None
+        self._agent_views = []
 
     def set_background_image(
         self,
@@ -74,6 +92,7 @@ class GraphView:
         # Draw margins and render the image
         self._margin_color = Colors.BLACK.value
         self._screen.fill(self._margin_color)
+        self._static_key = None
 
         # Scale the image and store it as the final background
         self._background_image = pygame.transform.scale(self._background_image,
@@ -120,9 +139,10 @@ class GraphView:
         if self._background_image is None and not graph.nodes:
             # Display a default message when no graph or background is loaded
             self._screen.fill(Colors.WHITE.value)
-            font = pygame.font.SysFont(None, 24)
-            text_surface = font.render(
-                "Please import a graph or image to start.", True, Colors.BLACK.value
+            text_surface = glyph_cache.render(
+                self._message_font,
+                "Please import a graph or image to start.",
+                Colors.BLACK.value
             )
             self._screen.blit(
                 text_surface,
@@ -133,40 +153,101 @@ class GraphView:
             )
             return
 
-            # If a background or nodes exist, proceed with normal drawing
+        # If a background or nodes exist, proceed with normal drawing
+        self._update_static_layer(graph)
+        self._update_nodes_layer(graph, selected_node, dragging_node)
+        self._screen.blit(self._nodes_layer, (0, 0))
+
+    def _update_static_layer(self, graph: Graph) -> None:
+        """
+        Draws the background and the edges on the static layer if the
+        graph has changed since they were drawn.
+
+        The graph increases its version on each change of its nodes or
+        edges, so comparing it is enough to know whether to draw again.
+
+        Args:
+            graph (Graph): The graph to be drawn.
+        """
+        static_key = (id(graph), graph.version)
+        if self._static_layer is not None and static_key == self._static_key:
+            return
+
+        if self._static_layer is None:
+            self._static_layer = pygame.Surface(self._screen.get_size())
         if self._background_image is None:
-            self._screen.fill(Colors.WHITE.value)
-        else:    
-            self._screen.fill(self._margin_color)
-            self._screen.blit(
+            self._static_layer.fill(Colors.WHITE.value)
+        else:
+            self._static_layer.fill(self._margin_color)
+            self._static_layer.blit(
                 self._background_image,
                 (self._margin_left, self._margin_top)
             )
-
         self._draw_edges(graph)
 
-        # Draw nodes
-        self._draw_nodes(graph, selected_node, dragging_node)
+        self._static_key = static_key
+        self._nodes_key = None
 
-    def _draw_nodes(self, graph: Graph, selected_node: Node, dragging_node: Node):
-        for node in graph.nodes:
-            color = self._get_node_color(node, selected_node, dragging_node)
+    def _update_nodes_layer(
+        self,
+        graph: Graph,
+        selected_node: Node,
+        dragging_node: Node
+    ) -> None:
+        """
+        Draws the nodes over the static layer if their idleness, in
+        whole seconds, or the selection has changed since they were
+        drawn.
+
+        Args:
+            graph (Graph): The graph to be drawn.
+            selected_node (Node): The node currently selected.
+            dragging_node (Node): The node currently being dragged.
+        """
+        # Read the idleness of every node once per frame
+        idlenesses = np.floor(graph.get_idleness())
+
+        nodes_key = (id(selected_node), id(dragging_node))
+        if (
+            self._nodes_layer is not None
+            and self._nodes_key is not None
+            and self._nodes_key[0] == nodes_key
+            and np.array_equal(self._nodes_key[1], idlenesses)
+        ):
+            return
+
+        if self._nodes_layer is None:
+            self._nodes_layer = pygame.Surface(self._screen.get_size())
+        self._nodes_layer.blit(self._static_layer, (0, 0))
+        self._draw_nodes(graph, idlenesses, selected_node, dragging_node)
+
+        self._nodes_key = (nodes_key, idlenesses)
+
+    def _draw_nodes(
+        self,
+        graph: Graph,
+        idlenesses: np.ndarray,
+        selected_node: Node,
+        dragging_node: Node
+    ) -> None:
+        for node, idleness in zip(graph.nodes, idlenesses.tolist()):
+            color = self._get_node_color(node, idleness, selected_node, dragging_node)
             
             pygame.draw.circle(
-                self._screen,
+                self._nodes_layer,
                 color,
                 (node.x, node.y),
                 min(
                     NODE_RADIUS * (1 + 0.05 * MAX_IDLENESS), 
-                    NODE_RADIUS * (1 + 0.05 * node.idleness)
+                    NODE_RADIUS * (1 + 0.05 * idleness)
                 ) # Modify size based on the idleness
             )
 
             # Display idlness if it is bigger than 10 (otherwise the circle is too small)
-            if node.idleness >= 10:
-                idleness_text = self._font.render(str(node.idleness), True, (255, 255, 255))  # white color for the text
+            if idleness >= 10:
+                idleness_text = glyph_cache.render(self._font, str(int(idleness)), (255, 255, 255))  # white color for the text
                 text_rect = idleness_text.get_rect(center=(node.x, node.y))
-                self._screen.blit(idleness_text, text_rect)
+                self._nodes_layer.blit(idleness_text, text_rect)
 
     def draw_popup(self):
         """
@@ -185,6 +266,7 @@ class GraphView:
     def _get_node_color(
         self,
         node: Node,
+        idleness: float,
         selected_node: Node,
         dragging_node: Node
     ) -> None:
@@ -193,6 +275,7 @@ class GraphView:
 
         Args:
             node (Node): The node whose color is to be determined.
+            idleness (float): The idleness of the node, in seconds.
             selected_node (Node): The node that is currently selected.
             dragging_node (Node): The node that is currently being
                 dragged.
@@ -208,11 +291,11 @@ class GraphView:
             min_color = Colors.NODE_COLOR_MIN.value
             max_color = Colors.NODE_COLOR_MAX.value
 
-            if node.idleness >= MAX_IDLENESS:
+            if idleness >= MAX_IDLENESS:
                 return max_color
 
             # Calculate the color based on idleness
-            ratio = node.idleness / MAX_IDLENESS
+            ratio = idleness / MAX_IDLENESS
             color = (
                 min_color[0] + (max_color[0] - min_color[0]) * ratio,
                 min_color[1] + (max_color[1] - min_color[1]) * ratio,
@@ -222,34 +305,38 @@ class GraphView:
 
     def _draw_edges(self, graph: Graph) -> None:
         """
-        Draws edges between nodes in the graph.
+        Draws edges between nodes in the graph on the static layer.
 
         Args:
             graph (Graph): The graph containing the edges to be drawn.
         """
-        for edge in graph.edges:
-            start_node = edge[0]
-            end_node = edge[1]
+        # Each edge is stored in both directions, but drawn once
+        for start_node, end_node in graph.edges:
+            if id(start_node) > id(end_node) and (end_node, start_node) in graph.edges:
+                continue
             pygame.draw.line(
-                self._screen,
+                self._static_layer,
                 Colors.EDGE_COLOR.value,
                 (start_node.x, start_node.y),
                 (end_node.x, end_node.y),
                 3
             )
 
-    def draw_simulation(self, agents: list[Agent]) -> None:
+    def draw_simulation(self, agent_positions: np.ndarray) -> None:
         """
         Draws each agent at its updated position.
 
         Args:
-            agents (List[Agent]): A list of agents to be drawn on the
-                screen.
+            agent_positions (np.ndarray): The (x, y) coordinates of the
+                agents to be drawn on the screen.
         """
-        agent_views = [AgentView(self._screen) for _ in agents]
-        
-        for agent, agent_view in zip(agents, agent_views):
-            agent_view.draw((int(agent.x), int(agent.y)))
+        # The views are created once, as each one loads the image of
+        # the agents
+        while len(self._agent_views) < len(agent_positions):
+            self._agent_views.append(AgentView(self._screen))
+
+        for (x, y), agent_view in zip(agent_positions.tolist(), self._agent_views):
+            agent_view.draw((int(x), int(y)))
 
     def draw_line_full_extent(self, candidate: Node, axis: str) -> None:
         """
@@ -2,6 +2,7 @@ import pygame
 
 from constants.Colors import Colors
 from constants.Config import PARAMETERS_WINDOW_WIDTH
+from views.GlyphCache import glyph_cache
 
 class IdlenessView:
     
@@ -27,8 +28,8 @@ class IdlenessView:
         Updates the values of average, max and all-tim highest idleness in the view.
         """
         self._label_average_idleness_value = round(average_idleness, 2)
-        self._label_max_idleness_value = max_idleness
-        self._label_ath_idleness_value = ath_idleness
+        self._label_max_idleness_value = round(max_idleness, 2)
+        self._label_ath_idleness_value = round(ath_idleness, 2)
 
         
     def draw_text(self) -> None:
@@ -46,9 +47,9 @@ class IdlenessView:
         center_x = PARAMETERS_WINDOW_WIDTH // 2
 
         # Title (Centered)
-        title_surface = self._title_font.render(
+        title_surface = glyph_cache.render(
+            self._title_font,
             "Simulation Statistics",
-            True,
             text_color
         )
 
@@ -68,8 +69,9 @@ class IdlenessView:
             rect = pygame.Rect(x, y, width, block_height)
             pygame.draw.rect(self._screen, gray_color, rect, border_radius=border_radius)
 
-            label_surface = self._name_font.render(label, True, text_color)
-            value_surface = self._value_font.render(value, True, text_color)
+            # The texts are only rendered when the values change
+            label_surface = glyph_cache.render(self._name_font, label, text_color)
+            value_surface = glyph_cache.render(self._value_font, value, text_color)
 
             label_rect = label_surface.get_rect(midtop=(rect.centerx, rect.top + padding))
             value_rect = value_surface.get_rect(midtop=(rect.centerx, label_rect.bottom + padding))